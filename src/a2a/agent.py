@@ -1,6 +1,7 @@
+import asyncio
 import random
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, HttpUrl, ValidationError
 
 from a2a.server.tasks import TaskUpdater
@@ -8,16 +9,27 @@ from a2a.types import Message, TaskState, Part, TextPart, DataPart
 from a2a.utils import get_message_text, new_agent_text_message
 
 from src.a2a.messenger import Messenger
+from src.a2a.card_cache import AgentCardCache
 from src.models.EvalRequest import EvalRequest
+from src.models.EvalConfig import EvalConfig
 from src.models.enum.Difficulty import Difficulty
 from src.game.Game import Game
 from src.models.Participant import Participant
+from src.models.AgentSession import AgentSession
+from src.game.AgentState import AgentState
 from src.models.enum.Phase import Phase
 
 from uuid import uuid4
 
 from src.models.enum.Role import Role
-from src.services.llm import LLM
+from src.services.llm import LLM, get_rate_limiter
+from src.services.response_cache import ResponseCache, get_shared_response_cache
+from src.services.single_flight import SingleFlight
+from src.services.hedging import Hedger
+from src.services.rate_limit import RateLimitUsage
+from src.services.standin import PrefixCacheProbe, StandInBackend
+from src.models.abstract.ParticipantBackend import ParticipantBackend
+from src.models.enum.Backend import Backend
 
 # Number of games to play per role
 GAMES_PER_ROLE = 2
@@ -27,10 +39,17 @@ class GreenAgent:
     """Runs Werewolf evaluation across multiple games and roles."""
 
     def __init__(self):
-        self.messenger = Messenger()
-        self.game = Game([])
-    
-        
+        # Shared by every game's messenger so the participant's card is fetched once per TTL
+        self.card_cache = AgentCardCache()
+        # Measures prompt prefix reuse across every stand-in player in this agent's games
+        self.prefix_cache = PrefixCacheProbe()
+        # Joins identical in-flight Gemini calls with any evaluation in the process; counts this agent's
+        self.single_flight = SingleFlight(process_wide=True)
+        # Hedges slow simulated-player calls across this agent's games, see hedger_for
+        self.hedger: Optional[Hedger] = None
+        # This agent's calls through each model's process-wide rate limiter
+        self.rate_limit_usage: Dict[str, RateLimitUsage] = {}
+
     async def run(self, message: Message, updater: TaskUpdater) -> None:
         """Implement your agent logic here.
 
@@ -38,7 +57,8 @@ class GreenAgent:
             message: The incoming message
             updater: Report progress (update_status) and results (add_artifact)
 
-        Use self.messenger.talk_to_agent(message, url) to call other agents.
+        Each game gets its own Game and Messenger, so up to
+        config.max_concurrent_games games can be played at the same time.
         """
         input_text = get_message_text(message)
 
@@ -54,7 +74,16 @@ class GreenAgent:
             return
 
         participant_url = str(next(iter(request.participants.values())))
-        difficulty = request.config.difficulty
+        config = request.config
+        difficulty = config.difficulty
+        self.card_cache = AgentCardCache(ttl=config.agent_card_ttl_seconds)
+        self.prefix_cache = PrefixCacheProbe()
+        self.single_flight = SingleFlight(process_wide=True)
+        self.hedger = None
+        self.rate_limit_usage = {}
+        # The reply cache is shared process-wide; report only lookups made during this evaluation
+        response_cache = self.response_cache_for(config, difficulty)
+        response_cache_before = response_cache.stats() if response_cache is not None else None
 
         # Data structure to store results from all games, grouped by role
         all_game_results: Dict[Role, List[Dict[str, Any]]] = {
@@ -66,27 +95,47 @@ class GreenAgent:
 
         await updater.update_status(
             TaskState.working,
-            new_agent_text_message(f"Starting evaluation ({difficulty.value} mode): {total_games} games ({GAMES_PER_ROLE} per role)")
+            new_agent_text_message(f"Starting evaluation ({difficulty.value} mode): {total_games} games ({GAMES_PER_ROLE} per role, up to {config.max_concurrent_games} at a time)")
         )
 
-        # Run games for each role
-        for role in ROLES_TO_EVALUATE:
-            await updater.update_status(
-                TaskState.working,
-                new_agent_text_message(f"Starting {GAMES_PER_ROLE} games as {role.name} ({difficulty.value})")
-            )
+        semaphore = asyncio.Semaphore(config.max_concurrent_games)
 
-            for game_num in range(1, GAMES_PER_ROLE + 1):
-                games_completed += 1
+        async def play_game(role: Role, game_num: int, game_config: EvalConfig) -> Dict[str, Any]:
+            nonlocal games_completed
+            label = f"{role.name} {game_num}/{GAMES_PER_ROLE}"
 
+            async with semaphore:
                 await updater.update_status(
                     TaskState.working,
-                    new_agent_text_message(f"Game {games_completed}/{total_games}: Playing as {role.name} (game {game_num}/{GAMES_PER_ROLE}, {difficulty.value})")
+                    new_agent_text_message(f"Starting game: Playing as {role.name} (game {game_num}/{GAMES_PER_ROLE}, {difficulty.value})")
                 )
+                game_analytics = await self.run_single_game(participant_url, role, game_config, updater, label=label)
+
+            games_completed += 1
+            await updater.update_status(
+                TaskState.working,
+                new_agent_text_message(f"Game {games_completed}/{total_games} finished: Played as {role.name} (game {game_num}/{GAMES_PER_ROLE}, {difficulty.value})")
+            )
+            return game_analytics
+
+        # Schedule every game up front; the semaphore bounds how many are in flight
+        games = [(role, game_num) for role in ROLES_TO_EVALUATE for game_num in range(1, GAMES_PER_ROLE + 1)]
+        scheduled = [
+            (role, asyncio.create_task(play_game(role, game_num, self.config_for_game(config, index))))
+            for index, (role, game_num) in enumerate(games)
+        ]
+
+        try:
+            await asyncio.gather(*(task for _, task in scheduled))
+        except BaseException:
+            # One failed game fails the evaluation - don't leave the others running
+            for _, task in scheduled:
+                task.cancel()
+            raise
 
-                # Run a single game and collect analytics
-                game_analytics = await self.run_single_game(participant_url, role, difficulty, updater)
-                all_game_results[role].append(game_analytics)
+        # Collect in scheduling order so results are stable regardless of finish order
+        for role, task in scheduled:
+            all_game_results[role].append(task.result())
 
         await updater.update_status(
             TaskState.working, new_agent_text_message("All games completed, compiling aggregate analytics")
@@ -94,6 +143,17 @@ class GreenAgent:
 
         # Compute aggregate analytics across all games
         aggregate_analytics = self.compute_aggregate_analytics(all_game_results, participant_url, difficulty)
+        aggregate_analytics["agent_card_cache"] = self.card_cache.stats()
+        if config.backend == Backend.STAND_IN:
+            aggregate_analytics["prompt_prefix_cache"] = self.prefix_cache.stats()
+        else:
+            if response_cache is not None:
+                aggregate_analytics["llm_response_cache"] = response_cache.stats(since=response_cache_before)
+            if config.coalesce_llm_calls:
+                aggregate_analytics["llm_coalescing"] = self.single_flight.stats()
+            aggregate_analytics["llm_rate_limits"] = self.rate_limit_stats()
+        if self.hedger is not None:
+            aggregate_analytics["hedging"] = self.hedger.stats()
         summary_text = self.render_aggregate_summary(aggregate_analytics)
 
         await updater.add_artifact(
@@ -104,30 +164,44 @@ class GreenAgent:
             name="Result",
         )
 
-    async def run_single_game(self, participant_url: str, participant_role: Role, difficulty: Difficulty, updater: TaskUpdater) -> Dict[str, Any]:
-        """Run a single game and return the analytics."""
-        # Reset state for new game
-        self.messenger.reset()
-        self.game = Game([])
-
-        self.init_game(participant_url, participant_role, difficulty)
-        self.game.updater = updater
+    def config_for_game(self, config: EvalConfig, index: int) -> EvalConfig:
+        """Give each game its own seed so seeded evaluations don't replay one game over and over."""
+        if config.seed is None:
+            return config
+        return config.model_copy(update={"seed": config.seed + index})
 
-        # Store participant ID before game starts (they may be eliminated during the game)
-        participant_id = self.get_participant_id_by_url(participant_url)
+    async def run_single_game(self, participant_url: str | None, participant_role: Role, config: EvalConfig, updater: TaskUpdater | None, label: str | None = None) -> Dict[str, Any]:
+        """
+        Run a single game in isolation and return the analytics.
 
-        game_over = False
-        while game_over == False:
-            await self.game.run_night_phase()
-            await self.game.run_bidding_phase()
-            await self.game.run_debate_phase()
-            await self.game.run_voting_phase()
-            await self.game.run_round_end_phase()
+        With no participant_url the evaluated seat is played by a simulated participant as well.
+        """
+        difficulty = config.difficulty
 
-            if self.game.current_phase == Phase.GAME_END:
-                game_over = True
+        # Every game owns its state and messenger so games can run side by side
+        messenger = Messenger(card_cache=self.card_cache)
+        game = Game([], messenger=messenger, label=label, config=config)
 
-        analytics = await self.game.run_game_end_phase()
+        try:
+            # Store participant ID before game starts (they may be eliminated during the game)
+            participant_id = self.init_game(game, participant_url, participant_role, difficulty)
+            game.updater = updater
+
+            game_over = False
+            while game_over == False:
+                await game.run_night_phase()
+                await game.run_bidding_phase()
+                await game.run_debate_phase()
+                await game.run_voting_phase()
+                await game.run_round_end_phase()
+
+                if game.current_phase == Phase.GAME_END:
+                    game_over = True
+
+            analytics = await game.run_game_end_phase()
+        finally:
+            # Release pooled connections whether the game finished or failed
+            await messenger.close()
 
         # Add participant-specific info to analytics
         if participant_id:
@@ -135,20 +209,24 @@ class GreenAgent:
             analytics["participant_role"] = participant_role.name
             analytics["participant_score"] = analytics.get("scores", {}).get(participant_id, 0)
             # Check if participant survived by seeing if they're still in the final round's participants
-            final_round = self.game.state.current_round
-            final_participants = self.game.state.participants.get(final_round, [])
+            final_round = game.state.current_round
+            final_participants = game.state.participants.get(final_round, [])
             analytics["participant_survived"] = any(p.id == participant_id for p in final_participants)
             analytics["difficulty"] = difficulty.value
 
+            participant = next((p for p in game.state.participants.get(1, []) if p.id == participant_id), None)
+            if participant is not None and participant.session is not None:
+                analytics["session"] = participant.session.stats()
+
         # Wrap everything except "winner" in a "detail" key
         winner = analytics.pop("winner", None)
         analytics = {"winner": winner, "detail": analytics}
 
         return analytics
 
-    def get_participant_id_by_url(self, url: str) -> str | None:
+    def get_participant_id_by_url(self, game: Game, url: str) -> str | None:
         """Find the participant ID for the given URL from round 1."""
-        round_1_participants = self.game.state.participants.get(1, [])
+        round_1_participants = game.state.participants.get(1, [])
         for p in round_1_participants:
             if hasattr(p, 'url') and p.url == url:
                 return p.id
@@ -218,6 +296,11 @@ class GreenAgent:
         total_games = aggregate["total_games"]
         aggregate["overall_win_rate"] = total_wins / total_games if total_games else 0
         aggregate["overall_total_score"] = sum(stats["total_score"] for stats in aggregate["by_role"].values())
+        # Games where simulated players gave up on calls and played fallback moves
+        aggregate["degraded_games"] = sum(
+            1 for games in all_results.values() for game in games
+            if game.get("detail", {}).get("simulated_calls_failed", 0) > 0
+        )
 
         return aggregate
 
@@ -232,6 +315,13 @@ class GreenAgent:
             f"Games Per Role: {analytics['games_per_role']}",
             f"Overall Win Rate: {analytics['overall_win_rate']:.1%}",
             f"Overall Total Score: {analytics['overall_total_score']}",
+        ]
+        if analytics.get("degraded_games"):
+            lines.append(
+                f"WARNING: {analytics['degraded_games']} game(s) had simulated players fall back to default moves "
+                "after their backend failed; those results are unreliable"
+            )
+        lines += [
             "",
             "-" * 60,
             "PERFORMANCE BY ROLE",
@@ -258,18 +348,29 @@ class GreenAgent:
 
         return "\n".join(lines)
 
-    def init_game(self, participant_url: str, participant_role: Role, difficulty: Difficulty):
+    def init_game(self, game: Game, participant_url: str | None, participant_role: Role, difficulty: Difficulty) -> str:
         """
         Takes one participant URL, their role, and difficulty level, then creates LLM-based 
         participants to fill out the rest of the game (3 villagers, 2 werewolves, 1 seer, 1 doctor)
 
-        :param participant_url: URL of the real participant agent
-        :type participant_url: str
+        :param game: The game to populate; participants share its state and messenger
+        :type game: Game
+        :param participant_url: URL of the real participant agent, or None to simulate that seat too
+        :type participant_url: str | None
         :param participant_role: Role assigned to the real participant
         :type participant_role: Role
         :param difficulty: Game difficulty level
         :type difficulty: Difficulty
+        :return: ID of the participant in the evaluated seat
+        :rtype: str
         """
+        config = game.state.config
+        # Seeded games draw every random choice from one generator so they can be replayed
+        rng = random.Random(config.seed)
+
+        def next_seed():
+            return rng.randrange(2 ** 32) if config.seed is not None else None
+
         # Game composition: 3 villagers, 2 werewolves, 1 seer, and 1 doctor 
         needed_roles = {
             Role.VILLAGER: 3,
@@ -284,14 +385,17 @@ class GreenAgent:
         all_participants = []
 
         # Create the real participant (uses URL to talk to external agent)
+        simulate_seat = participant_url is None
         real_participant = Participant(
             id=str(uuid4()),
             url=participant_url,
             role=participant_role,
-            use_llm=False,
-            game_data=self.game.state,
-            messenger=self.messenger,
-            difficulty=difficulty
+            use_llm=simulate_seat,
+            game_data=game.state,
+            messenger=game.messenger,
+            llm=self.create_backend(config, difficulty, seed=next_seed()) if simulate_seat else None,
+            difficulty=difficulty,
+            session=AgentSession() if config.session_mode and not simulate_seat else None
         )
         all_participants.append(real_participant)
 
@@ -314,9 +418,9 @@ class GreenAgent:
                     id=str(uuid4()),
                     role=role,
                     use_llm=True,
-                    game_data=self.game.state,
-                    messenger=self.messenger,
-                    llm=LLM(difficulty=difficulty),
+                    game_data=game.state,
+                    messenger=game.messenger,
+                    llm=self.create_backend(config, difficulty, seed=next_seed()),
                     difficulty=difficulty
                 )
                 all_participants.append(llm_participant)
@@ -330,21 +434,78 @@ class GreenAgent:
                     doctor = llm_participant
 
         # Store participants by round number (round 1 initially)
-        self.game.state.participants[1] = all_participants
+        game.state.participants[1] = all_participants
+        for participant in all_participants:
+            participant.llm_state = AgentState(game_data=game.state, participant_id=participant.id)
 
         # Assign special role references
         # Primary werewolf makes kill decisions, secondary is promoted if primary dies
-        self.game.state.primary_werewolf = werewolves[0] if len(werewolves) > 0 else None
-        self.game.state.secondary_werewolf = werewolves[1] if len(werewolves) > 1 else None
-        self.game.state.seer = seer
-        self.game.state.doctor = doctor
-        self.game.state.villagers = [p for p in all_participants if p.role == Role.VILLAGER]
+        game.state.primary_werewolf = werewolves[0] if len(werewolves) > 0 else None
+        game.state.secondary_werewolf = werewolves[1] if len(werewolves) > 1 else None
+        game.state.seer = seer
+        game.state.doctor = doctor
+        game.state.villagers = [p for p in all_participants if p.role == Role.VILLAGER]
 
         # Set random speaking order for round 1
         shuffled_participants = all_participants.copy()
-        random.shuffle(shuffled_participants)
-        self.game.state.speaking_order[1] = [p.id for p in shuffled_participants]
+        rng.shuffle(shuffled_participants)
+        game.state.speaking_order[1] = [p.id for p in shuffled_participants]
+
+        # Aliases are drawn independently of seating so they reveal neither role nor evaluated seat
+        alias_order = rng.sample(all_participants, len(all_participants))
+        game.state.assign_aliases([p.id for p in alias_order])
+
+        return real_participant.id
     
+    def create_backend(self, config: EvalConfig, difficulty: Difficulty, seed: int | None = None) -> ParticipantBackend:
+        """Build the backend that plays one simulated participant."""
+        if config.backend == Backend.STAND_IN:
+            return StandInBackend(
+                latency=config.stand_in_latency_seconds,
+                jitter=config.stand_in_jitter_seconds,
+                seed=seed,
+                prefix_cache=self.prefix_cache,
+                hedger=self.hedger_for(config)
+            )
+        return LLM(
+            difficulty=difficulty,
+            cache_prefix=config.cache_prompt_prefix,
+            structured_output=config.structured_output,
+            seed=seed,
+            response_cache=self.response_cache_for(config, difficulty),
+            single_flight=self.single_flight if config.coalesce_llm_calls else None,
+            rate_limiter=get_rate_limiter(
+                difficulty.get_model(),
+                rate=config.llm_requests_per_second,
+                burst=config.llm_burst,
+                max_concurrency=config.llm_max_concurrency
+            ),
+            rate_usage=self.rate_limit_usage.setdefault(difficulty.get_model(), RateLimitUsage()),
+            hedger=self.hedger_for(config)
+        )
+
+    def rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """This agent's requests and throttles per model, with the shared limiter's current window."""
+        return {
+            model: dict(usage.stats(), concurrency_limit=get_rate_limiter(model).concurrency.window)
+            for model, usage in self.rate_limit_usage.items()
+            if usage.requests
+        }
+
+    def hedger_for(self, config: EvalConfig) -> Optional[Hedger]:
+        """The agent's shared hedger for simulated players if hedging is enabled, built from the first config that enables it."""
+        if not config.hedge_simulated_calls:
+            return None
+        if self.hedger is None:
+            self.hedger = Hedger(config.hedge_percentile, config.hedge_max_ratio)
+        return self.hedger
+
+    def response_cache_for(self, config: EvalConfig, difficulty: Difficulty) -> Optional[ResponseCache]:
+        """The shared reply cache for Gemini players, unless it is disabled or bypassed for this difficulty."""
+        if config.response_cache_dir is None or difficulty in config.response_cache_bypass:
+            return None
+        return get_shared_response_cache(config.response_cache_dir, config.response_cache_max_mb * 1024 * 1024)
+
     def validate_request(self, request: EvalRequest) -> tuple[bool, str]:
       if not request.participants:
           return False, "No participant provided"
@@ -357,5 +518,5 @@ class GreenAgent:
     async def handle_game_prompt(self, prompt: str, updater: TaskUpdater) -> None:
         """Handle incoming game prompts (bid, vote, debate, etc.) using LLM."""
         llm = LLM()
-        response = llm.execute_prompt(prompt=prompt)
+        response = await llm.execute_prompt_async(prompt=prompt)
         await updater.complete(new_agent_text_message(response))
\ No newline at end of file
@@ -0,0 +1,53 @@
+import time
+from typing import Callable
+
+from a2a.types import AgentCard
+
+
+DEFAULT_CARD_TTL = 300
+
+
+class AgentCardCache:
+    """
+    Per-URL agent card cache with a time-to-live.
+
+    Cards older than ``ttl`` seconds are treated as missing so the next call
+    re-resolves them. A ttl of 0 disables caching. Counters are kept so the
+    hit rate can be reported with the evaluation results.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CARD_TTL, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: dict[str, tuple[AgentCard, float]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, url: str) -> AgentCard | None:
+        """Return the cached card for url, or None if it is missing or expired."""
+        entry = self._entries.get(url)
+        if entry is not None:
+            card, fetched_at = entry
+            if self._clock() - fetched_at < self.ttl:
+                self.hits += 1
+                return card
+            del self._entries[url]
+
+        self.misses += 1
+        return None
+
+    def put(self, url: str, card: AgentCard):
+        self._entries[url] = (card, self._clock())
+
+    def invalidate(self, url: str):
+        """Forget the card for url, e.g. after a failed send."""
+        if self._entries.pop(url, None) is not None:
+            self.invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
@@ -4,11 +4,20 @@ from uuid import uuid4
 import httpx
 from a2a.client import (
     A2ACardResolver,
+    Client,
+    ClientCallContext,
     ClientConfig,
     ClientFactory,
     Consumer,
 )
+from a2a.client.errors import (
+    A2AClientHTTPError,
+    A2AClientJSONError,
+    A2AClientJSONRPCError,
+    A2AClientTimeoutError,
+)
 from a2a.types import (
+    AgentCard,
     Message,
     Part,
     Role,
@@ -16,8 +25,34 @@ from a2a.types import (
     DataPart,
 )
 
+from src.a2a.card_cache import AgentCardCache, DEFAULT_CARD_TTL
+
 
 DEFAULT_TIMEOUT = 300
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 16
+DEFAULT_KEEPALIVE_EXPIRY = 30
+
+# Failures that suggest the cached card (and the client built from it) may be stale
+TRANSPORT_ERRORS = (
+    httpx.TransportError,
+    A2AClientHTTPError,
+    A2AClientJSONError,
+    A2AClientJSONRPCError,
+    A2AClientTimeoutError,
+)
+
+# Errors a remote raises when it refuses a message for an existing context
+CONTEXT_ERRORS = (A2AClientHTTPError, A2AClientJSONRPCError)
+REJECTED_STATES = ("rejected", "failed")
+
+
+class ContextRejectedError(RuntimeError):
+    """The remote agent refused a message sent in an existing conversation context."""
+
+
+class AgentTaskFailedError(RuntimeError):
+    """The remote agent's task ended in a state other than completed (e.g. failed)."""
 
 
 def create_message(
@@ -63,38 +98,115 @@ async def send_message(
         if consumer:
             await client.add_event_consumer(consumer)
 
-        outbound_msg = create_message(text=message, context_id=context_id)
-        last_event = None
-        outputs = {"response": "", "context_id": None}
+        return await send_with_client(client, message, context_id=context_id)
 
-        # if streaming == False, only one event is generated
-        async for event in client.send_message(outbound_msg):
-            last_event = event
 
-        match last_event:
-            case Message() as msg:
-                outputs["context_id"] = msg.context_id
-                outputs["response"] += merge_parts(msg.parts)
+async def send_with_client(
+    client: Client,
+    message: str,
+    context_id: str | None = None,
+    timeout: int | None = None,
+):
+    """Send a message through an existing A2A client. Returns the same dict as send_message."""
+    outbound_msg = create_message(text=message, context_id=context_id)
+    last_event = None
+    outputs = {"response": "", "context_id": None}
 
-            case (task, update):
-                outputs["context_id"] = task.context_id
-                outputs["status"] = task.status.state.value
-                msg = task.status.message
-                if msg:
-                    outputs["response"] += merge_parts(msg.parts)
-                if task.artifacts:
-                    for artifact in task.artifacts:
-                        outputs["response"] += merge_parts(artifact.parts)
+    context = None
+    if timeout is not None:
+        context = ClientCallContext(state={"http_kwargs": {"timeout": timeout}})
 
-            case _:
-                pass
+    # if streaming == False, only one event is generated
+    async for event in client.send_message(outbound_msg, context=context):
+        last_event = event
 
-        return outputs
+    match last_event:
+        case Message() as msg:
+            outputs["context_id"] = msg.context_id
+            outputs["response"] += merge_parts(msg.parts)
+
+        case (task, update):
+            outputs["context_id"] = task.context_id
+            outputs["status"] = task.status.state.value
+            msg = task.status.message
+            if msg:
+                outputs["response"] += merge_parts(msg.parts)
+            if task.artifacts:
+                for artifact in task.artifacts:
+                    outputs["response"] += merge_parts(artifact.parts)
+
+        case _:
+            pass
+
+    return outputs
 
 
 class Messenger:
-    def __init__(self):
+    """
+    Talks to participant agents over A2A.
+
+    One connection-pooled httpx client is shared by every call, and one A2A
+    client is kept per participant URL, so repeated prompts reuse open
+    connections instead of paying a handshake and agent card fetch each time.
+    Agent cards are held in an AgentCardCache for ``card_ttl`` seconds and
+    dropped whenever a send fails with a transport or protocol error; pass a
+    shared ``card_cache`` to reuse cards across messengers.
+    Call close() (or use ``async with``) once the evaluation is done.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+        card_ttl: float = DEFAULT_CARD_TTL,
+        card_cache: AgentCardCache | None = None,
+    ):
         self._context_ids = {}
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._httpx_client: httpx.AsyncClient | None = None
+        self._clients: dict[str, tuple[AgentCard, Client]] = {}
+        self.card_cache = card_cache if card_cache is not None else AgentCardCache(ttl=card_ttl)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_httpx_client(self) -> httpx.AsyncClient:
+        # Created lazily so a Messenger can be built outside of a running event loop
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            self._httpx_client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, limits=self._limits)
+        return self._httpx_client
+
+    async def _get_client(self, url: str) -> Client:
+        """Return the A2A client for url, rebuilding it when its agent card is refreshed."""
+        httpx_client = self._get_httpx_client()
+
+        agent_card = self.card_cache.get(url)
+        if agent_card is None:
+            resolver = A2ACardResolver(httpx_client=httpx_client, base_url=url)
+            agent_card = await resolver.get_agent_card()
+            self.card_cache.put(url, agent_card)
+
+        cached = self._clients.get(url)
+        if cached is not None and cached[0] is agent_card:
+            return cached[1]
+
+        factory = ClientFactory(ClientConfig(httpx_client=httpx_client, streaming=False))
+        client = factory.create(agent_card)
+        self._clients[url] = (agent_card, client)
+        return client
+
+    def invalidate(self, url: str):
+        """Drop the cached agent card and client for url so the next call re-resolves them."""
+        self.card_cache.invalidate(url)
+        self._clients.pop(url, None)
 
     async def talk_to_agent(
         self,
@@ -102,6 +214,7 @@ class Messenger:
         url: str,
         new_conversation: bool = False,
         timeout: int = DEFAULT_TIMEOUT,
+        context_key: str | None = None,
     ):
         """
         Communicate with another agent by sending a message and receiving their response.
@@ -111,26 +224,55 @@ class Messenger:
             url: The agent's URL endpoint
             new_conversation: If True, start fresh conversation; if False, continue existing conversation
             timeout: Timeout in seconds for the request (default: 300)
+            context_key: Which conversation to continue (default: one per URL)
 
         Returns:
             str: The agent's response message
+
+        Raises:
+            ContextRejectedError: If the remote refused a message in an existing context.
+                The context is forgotten, so the next call starts a new one.
+            AgentTaskFailedError: If the remote's task ended without completing.
         """
+        key = context_key or url
+        context_id = None if new_conversation else self._context_ids.get(key, None)
+
         # Debug: log message being sent
         print(f"[Messenger] Sending to {url}:")
         print(f"[Messenger] Message length: {len(message)}")
         print(f"[Messenger] Message preview: {message[:200]}...")
-        print(f"[Messenger] Context ID: {self._context_ids.get(url, None)}")
+        print(f"[Messenger] Context ID: {context_id}")
 
-        outputs = await send_message(
-            message=message,
-            base_url=url,
-            context_id=None if new_conversation else self._context_ids.get(url, None),
-            timeout=timeout,
-        )
-        if outputs.get("status", "completed") != "completed":
-            raise RuntimeError(f"{url} responded with: {outputs}")
-        self._context_ids[url] = outputs.get("context_id", None)
+        try:
+            client = await self._get_client(url)
+            outputs = await send_with_client(
+                client,
+                message,
+                context_id=context_id,
+                timeout=timeout,
+            )
+        except TRANSPORT_ERRORS as e:
+            self.invalidate(url)
+            if context_id is not None and isinstance(e, CONTEXT_ERRORS):
+                self._context_ids.pop(key, None)
+                raise ContextRejectedError(f"{url} rejected context {context_id}: {e}") from e
+            raise
+
+        status = outputs.get("status", "completed")
+        if status != "completed":
+            if context_id is not None and status in REJECTED_STATES:
+                self._context_ids.pop(key, None)
+                raise ContextRejectedError(f"{url} rejected context {context_id}: {outputs}")
+            raise AgentTaskFailedError(f"{url} responded with: {outputs}")
+        self._context_ids[key] = outputs.get("context_id", None)
         return outputs["response"]
 
     def reset(self):
-        self._context_ids = {}
\ No newline at end of file
+        self._context_ids = {}
+
+    async def close(self):
+        """Close pooled connections and drop cached clients."""
+        self._clients = {}
+        if self._httpx_client is not None:
+            await self._httpx_client.aclose()
+            self._httpx_client = None
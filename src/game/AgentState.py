@@ -2,30 +2,96 @@ from typing import List, TYPE_CHECKING, Any
 
 from pydantic import BaseModel
 from src.models.Suspect import Suspect
+from src.models.enum.EliminationType import EliminationType
+from src.models.enum.EventType import EventType
 
 if TYPE_CHECKING:
     from src.game.GameData import GameData
 
+# Memory caps; the oldest rounds are dropped first once either is exceeded
+MAX_MEMORY_ROUNDS = 6
+MAX_MEMORY_CHARS = 1500
+# Longest excerpt of a chat message kept in memory
+MAX_QUOTE_CHARS = 80
+
+
+def shorten(text: str, limit: int) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 3].rstrip() + "..."
+
+
 class AgentState(BaseModel):
+    """
+    Rolling memory of earlier rounds for one participant.
+
+    After every round, record_round() adds a one-paragraph summary of what the
+    participant saw: the night's outcome, a short excerpt of what each player
+    said, the votes and the elimination. Only the most recent rounds are kept
+    (at most ``max_rounds`` and ``max_chars``), so the memory included in
+    prompts stays the same size however long the game runs.
+    """
     model_config = {"arbitrary_types_allowed": True}
     suspects: List[Suspect] = []
     game_data: Any = None  # GameData at runtime
-        
-    def get_werewolf_kill_prompt(self):
-        pass
-    
-    def get_seer_reveal_prompt(self):
-        pass
-    
-    def get_bidding_prompt(self):
-        pass
-    
-    def get_debate_prompt(self):
-        pass
-    
-    def get_voting_prompt(self):
-        pass
-    
-    def get_suspect_prompt(self):
-        pass
-    
\ No newline at end of file
+    participant_id: str = ""
+    max_rounds: int = MAX_MEMORY_ROUNDS
+    max_chars: int = MAX_MEMORY_CHARS
+    notes: List[str] = []
+    note_rounds: List[int] = []  # round each note summarises
+    last_recorded_round: int = 0
+
+    def record_round(self, round_num: int):
+        """Summarise round_num into memory; rounds already recorded are ignored."""
+        if round_num <= self.last_recorded_round:
+            return
+
+        self.notes.append(shorten(self.summarise_round(round_num), self.max_chars))
+        self.note_rounds.append(round_num)
+        self.last_recorded_round = round_num
+
+        own_vote = next((v for v in self.game_data.votes.get(round_num, []) if v.voter_id == self.participant_id), None)
+        if own_vote is not None:
+            self.suspects.append(Suspect(suspect_agent_id=own_vote.voted_for_id, suspect_reason=own_vote.rationale))
+
+        while len(self.notes) > self.max_rounds or (len(self.notes) > 1 and len(self.get_memory_prompt()) > self.max_chars):
+            self.notes.pop(0)
+            self.note_rounds.pop(0)
+
+    def summarise_round(self, round_num: int) -> str:
+        game_data = self.game_data
+        alias = game_data.alias_for
+        eliminations = game_data.eliminations.get(round_num, [])
+        parts = [f"Round {round_num}:"]
+
+        killed = [e.eliminated_participant for e in eliminations if e.elimination_type == EliminationType.NIGHT_KILL]
+        saved = [e.player for e in game_data.events.get(round_num, []) if e.type == EventType.WEREWOLF_ELIMINATION_FAILURE]
+        if killed:
+            parts.append(f"{', '.join(alias(p) for p in killed)} killed at night.")
+        elif saved:
+            parts.append(f"{', '.join(alias(p) for p in saved)} attacked at night but saved.")
+        else:
+            parts.append("Nobody died at night.")
+
+        if game_data.doctor_saves.get(round_num) and game_data.doctor is not None and game_data.doctor.id == self.participant_id:
+            parts.append(f"You protected {alias(game_data.doctor_saves[round_num])}.")
+
+        spoken = {}
+        for message in game_data.chat_history.get(round_num, []):
+            spoken.setdefault(message.sender_id, message.content)
+        if spoken:
+            quotes = "; ".join(f'{alias(sender)}: "{shorten(content, MAX_QUOTE_CHARS)}"' for sender, content in spoken.items())
+            parts.append(f"Said: {quotes}")
+
+        votes = game_data.votes.get(round_num, [])
+        if votes:
+            parts.append("Votes: " + ", ".join(f"{alias(v.voter_id)}->{alias(v.voted_for_id)}" for v in votes) + ".")
+
+        voted_out = [e.eliminated_participant for e in eliminations if e.elimination_type == EliminationType.VOTED_OUT]
+        if voted_out:
+            parts.append(f"{', '.join(alias(p) for p in voted_out)} voted out.")
+
+        return " ".join(parts)
+
+    def get_memory_prompt(self, since_round: int = 0) -> str:
+        """The notes kept, or only those of rounds after ``since_round``."""
+        return "\n".join(note for note, round_num in zip(self.notes, self.note_rounds) if round_num > since_round)
@@ -5,6 +5,7 @@ from src.models.enum.EventType import EventType
 from src.models.enum.Phase import Phase
 from src.game.GameData import GameData
 from src.models.Event import Event
+from src.models.EvalConfig import EvalConfig
 from src.a2a.messenger import Messenger
 
 from a2a.types import TaskState
@@ -21,6 +22,7 @@ class Game(BaseModel):
     current_phase: Phase
     state: GameData
     messenger: Optional[Messenger] = None
+    label: Optional[str] = None  # Prefixes status updates when several games share an updater
     updater: Optional[Any] = None  # TaskUpdater at runtime
     night_controller: Optional[Night] = None
     bidding_controller: Optional[Bidding] = None
@@ -32,14 +34,16 @@ class Game(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
-    def __init__(self, participants: List[str], messenger: Optional[Messenger] = None):
+    def __init__(self, participants: List[str], messenger: Optional[Messenger] = None, label: Optional[str] = None, config: Optional[EvalConfig] = None):
         super().__init__(
             current_phase=Phase.NIGHT,
             state=GameData(
                 current_round=1,
-                turns_to_speak_per_round=1
+                turns_to_speak_per_round=1,
+                config=config or EvalConfig()
             ),
-            messenger=messenger
+            messenger=messenger,
+            label=label
         )
 
         # Initialize round 1 data structures
@@ -66,6 +70,8 @@ class Game(BaseModel):
     async def log(self, message: str):
         """Log a message via the updater if available"""
         if self.updater:
+            if self.label:
+                message = f"[{self.label}] {message}"
             await self.updater.update_status(
                 TaskState.working, new_agent_text_message(message)
             )
@@ -7,6 +7,8 @@ from src.models.Vote import Vote
 from src.models.Elimination import Elimination
 from src.models.Event import Event
 from src.models.Bid import Bid
+from src.models.EvalConfig import EvalConfig
+from src.models.Transcript import Transcript
 
 from src.models.enum.Role import Role
 
@@ -16,6 +18,7 @@ class GameData(BaseModel):
     current_round: int
     winner: Optional[str] = None
     turns_to_speak_per_round: int
+    config: EvalConfig = EvalConfig()
     participants: Dict[int, List[Any]] = {}  # List[Participant] at runtime
     primary_werewolf: Optional[Any] = None
     secondary_werewolf: Optional[Any] = None
@@ -24,6 +27,13 @@ class GameData(BaseModel):
     villagers: List[Any] = []
     speaking_order: Dict[int, List[str]] = {}
     chat_history: Dict[int, List[Message]] = {}
+    transcripts: Dict[int, Transcript] = {}
+    aliases: Dict[str, str] = {}  # participant ID -> short name shown to agents (P1..P7)
+    alias_ids: Dict[str, str] = {}  # upper-cased alias -> participant ID
+    truncations: List[Dict[str, Any]] = []  # prompts cut down to fit a phase token budget
+    invalid_replies: List[Dict[str, Any]] = []  # replies rejected by a phase's response validation
+    call_failures: List[Dict[str, Any]] = []  # participant calls that failed transiently (retried or given up)
+    circuit_breakers: Dict[str, Any] = {}  # simulated players' breakers by model, scoped to this game
     bids: Dict[int, List[Bid]] = {}
     votes: Dict[int, List[Vote]] = {}
     eliminations: Dict[int, List[Elimination]] = {}
@@ -47,6 +57,36 @@ class GameData(BaseModel):
             self.votes[self.current_round] = []
         self.votes[self.current_round].append(vote)
 
+    def get_transcript(self, round_num: int) -> Transcript:
+        """Return the round's rendered transcript, bringing it up to date with chat_history."""
+        transcript = self.transcripts.get(round_num)
+        if transcript is None:
+            transcript = Transcript()
+            self.transcripts[round_num] = transcript
+        transcript.sync(self.chat_history.get(round_num, []), self.aliases)
+        return transcript
+
+    def assign_aliases(self, participant_ids: List[str]):
+        """Give each participant a short per-game alias (P1, P2, ...) in the given order."""
+        self.aliases = {pid: f"P{i}" for i, pid in enumerate(participant_ids, start=1)}
+        self.alias_ids = {alias.upper(): pid for pid, alias in self.aliases.items()}
+
+    def alias_for(self, participant_id: str) -> str:
+        """Name to show agents for a participant; falls back to the ID if no alias was assigned."""
+        return self.aliases.get(participant_id, participant_id)
+
+    def resolve_player(self, name: str) -> str:
+        """
+        Translate a player named in an agent response back to its participant ID.
+
+        Accepts aliases (case-insensitive) as well as raw participant IDs; anything
+        else is returned unchanged so the caller's own validation applies.
+        """
+        if not isinstance(name, str):
+            return name
+        key = name.strip()
+        return self.alias_ids.get(key.upper(), key)
+
     def add_participant(self, participant_id: str, url: str):
         # Add participant to round 1's participant list
         participant = Participant(id=participant_id, url=url, role=Role.VILLAGER)
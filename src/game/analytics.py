@@ -92,6 +92,25 @@ def compute_game_analytics(state: GameData) -> Dict[str, Any]:
                     successful_saves += 1
                     break
 
+    # Prompts cut down to fit a phase token budget
+    truncations = getattr(state, "truncations", []) or []
+    truncations_by_phase = defaultdict(int)
+    for t in truncations:
+        truncations_by_phase[t.get("phase")] += 1
+
+    # Replies that failed validation and were re-requested
+    invalid_replies = getattr(state, "invalid_replies", []) or []
+    invalid_replies_by_phase = defaultdict(int)
+    for r in invalid_replies:
+        invalid_replies_by_phase[r.get("phase")] += 1
+
+    # Participant calls retried after timeouts, dropped connections or 5xx replies
+    call_failures = getattr(state, "call_failures", []) or []
+    retries_by_participant = defaultdict(int)
+    for f in call_failures:
+        if f.get("outcome") == "retried":
+            retries_by_participant[f.get("participant_id")] += 1
+
     winner = getattr(state, "winner", None)
 
     return {
@@ -104,6 +123,15 @@ def compute_game_analytics(state: GameData) -> Dict[str, Any]:
         "werewolf_kills": werewolf_kills,
         "doctor_saves": doctor_saves,
         "doctor_successful_saves": successful_saves,
+        "prompt_truncations": len(truncations),
+        "prompt_truncations_by_phase": dict(truncations_by_phase),
+        "invalid_replies": len(invalid_replies),
+        "invalid_replies_by_phase": dict(invalid_replies_by_phase),
+        "participant_retries": sum(retries_by_participant.values()),
+        "participant_retries_by_participant": dict(retries_by_participant),
+        "participant_calls_failed": sum(1 for f in call_failures if f.get("outcome") != "retried"),
+        # Simulated players that fell back to a default move; the game didn't measure what it was meant to
+        "simulated_calls_failed": sum(1 for f in call_failures if f.get("outcome") != "retried" and f.get("simulated")),
     }
 
 
@@ -0,0 +1,53 @@
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+
+class AgentSession(BaseModel):
+    """
+    Delta-only conversation with one external participant agent for one game.
+
+    Once ``active``, the remote context already holds the static prompt prefix,
+    the first ``delivered[round]`` transcript messages of each round and the
+    memory notes up to round ``remembered``, so prompts only carry what is new. ``resync_prompt`` is the full equivalent of
+    the latest prompt, sent in a fresh context if the remote rejects the
+    current one.
+    """
+    active: bool = False
+    delivered: Dict[int, int] = {}
+    pending: Dict[int, int] = {}
+    remembered: int = 0
+    pending_remembered: int = 0
+    last_prompt: Optional[str] = None
+    resync_prompt: Optional[str] = None
+
+    prompts_sent: int = 0
+    resyncs: int = 0
+    chars_sent: int = 0
+    full_chars: int = 0  # what the same prompts would have cost without the session
+
+    def commit(self, sent: str):
+        """Record a prompt the remote accepted."""
+        self.active = True
+        self.delivered.update(self.pending)
+        self.pending = {}
+        self.remembered = self.pending_remembered
+        self.prompts_sent += 1
+        self.chars_sent += len(sent)
+        self.full_chars += len(self.resync_prompt or sent)
+
+    def reset(self):
+        """Forget the remote context; the next prompt starts a new one."""
+        self.active = False
+        self.delivered = {}
+        self.remembered = 0
+        self.resyncs += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "prompts_sent": self.prompts_sent,
+            "resyncs": self.resyncs,
+            "chars_sent": self.chars_sent,
+            "full_chars": self.full_chars,
+            "payload_ratio": self.chars_sent / self.full_chars if self.full_chars else 1.0,
+        }
@@ -1,7 +1,57 @@
-from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field, field_validator
 from src.models.enum.Difficulty import Difficulty
+from src.models.enum.BiddingMode import BiddingMode
+from src.models.enum.Backend import Backend
+from src.models.enum.Phase import Phase
+from src.models.enum.TruncationPolicy import TruncationPolicy
 
 
 class EvalConfig(BaseModel):
     """Configuration options for the evaluation, passed via the [config] section."""
     difficulty: Difficulty = Field(default=Difficulty.HARD, description="Game difficulty level: 'easy' or 'hard'")
+    max_concurrent_games: int = Field(default=4, ge=1, description="Maximum number of evaluation games played at the same time")
+    agent_card_ttl_seconds: float = Field(default=300, ge=0, description="How long a participant's agent card is reused before it is fetched again (0 disables caching)")
+    bidding_mode: BiddingMode = Field(default=BiddingMode.SEQUENTIAL, description="Bid collection: 'sequential' (each bidder sees earlier bids) or 'sealed' (all bids requested concurrently)")
+    vote_timeout_seconds: float = Field(default=300, gt=0, description="How long each voter has to respond before they are counted as abstaining")
+    backend: Backend = Field(default=Backend.GEMINI, description="Backend for simulated participants: 'gemini' or 'stand_in' (offline, no API key needed)")
+    stand_in_latency_seconds: float = Field(default=0, ge=0, description="Fixed delay added to every stand-in reply")
+    stand_in_jitter_seconds: float = Field(default=0, ge=0, description="Random extra delay (0 to this value) added to every stand-in reply")
+    cache_prompt_prefix: bool = Field(default=False, description="Start every prompt with the shared static prefix (rules and all task instructions) and register it as Gemini cached content, so only the per-player suffix is sent; off, each prompt carries just its own task's instructions")
+    structured_output: bool = Field(default=True, description="Ask Gemini-backed players for JSON matching each phase's response schema instead of free text")
+    session_mode: bool = Field(default=False, description="Keep one A2A context per external participant per game and send only what is new since its last turn")
+    phase_token_budgets: Dict[str, int] = Field(default={}, description="Maximum tokens for the per-player part of each phase's prompts (the shared static prefix is not counted), keyed by phase: 'night', 'bidding', 'discussion' or 'vote'")
+    truncation_policy: TruncationPolicy = Field(default=TruncationPolicy.OLDEST_FIRST, description="How transcripts are cut to fit a phase token budget: 'oldest_first' or 'per_speaker'")
+    coalesce_llm_calls: bool = Field(default=False, description="Let concurrent identical Gemini calls (same model, seed, schema and prompt) share one request, across every evaluation in the process; mainly useful when concurrent evaluations replay the same seeded games")
+    llm_requests_per_second: float = Field(default=10, ge=0, description="Per-model request rate shared by all Gemini players in the process; 0 disables the limit")
+    llm_burst: int = Field(default=10, ge=1, description="Requests per model that may be sent at once before the rate limit applies")
+    llm_max_concurrency: int = Field(default=16, ge=1, description="Upper bound of the per-model concurrency window, which shrinks when Gemini throttles and grows back on success")
+    participant_retries: int = Field(default=3, ge=0, description="Retries of a participant call after a timeout, dropped connection or 5xx reply")
+    retry_base_delay_seconds: float = Field(default=0.5, ge=0, description="Base of the jittered exponential backoff between participant call retries")
+    retry_max_delay_seconds: float = Field(default=8, ge=0, description="Longest wait between participant call retries")
+    circuit_failure_threshold: int = Field(default=5, ge=1, description="Consecutive failed calls after which a participant endpoint is treated as down")
+    circuit_reset_seconds: float = Field(default=30, ge=0, description="How long calls to a down endpoint fail fast before one trial call is let through")
+    response_cache_dir: Optional[str] = Field(default=None, description="Directory of the on-disk cache of Gemini replies, reused across runs; unset disables the cache")
+    response_cache_max_mb: int = Field(default=256, gt=0, description="Size bound of the on-disk reply cache; least recently used replies are evicted first")
+    response_cache_bypass: List[Difficulty] = Field(default=[], description="Difficulties whose players always call the model, e.g. to force stochastic play")
+    hedge_simulated_calls: bool = Field(default=False, description="Send a duplicate request for a simulated player's call that is slower than most recent calls, and take whichever reply comes first")
+    hedge_percentile: float = Field(default=95, gt=0, lt=100, description="Latency percentile of recent simulated-player calls after which a hedge request is sent")
+    hedge_max_ratio: float = Field(default=0.1, ge=0, le=1, description="Upper bound on hedge requests as a fraction of all simulated-player calls")
+    seed: Optional[int] = Field(default=None, description="Seeds simulated players and the opening speaking order so games can be replayed")
+
+    @field_validator("phase_token_budgets")
+    @classmethod
+    def validate_phase_token_budgets(cls, budgets: Dict[str, int]) -> Dict[str, int]:
+        normalized = {}
+        for phase, budget in budgets.items():
+            name = phase.upper()
+            if name not in Phase.__members__:
+                raise ValueError(f"Unknown phase '{phase}' in phase_token_budgets")
+            if budget <= 0:
+                raise ValueError(f"Token budget for '{phase}' must be positive")
+            normalized[name] = budget
+        return normalized
+
+    def token_budget_for(self, phase: Phase) -> Optional[int]:
+        return self.phase_token_budgets.get(phase.name)
@@ -1,11 +1,19 @@
-import json
-from typing import Optional, TYPE_CHECKING, Any
+from typing import Callable, Iterable, Optional, TYPE_CHECKING, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from src.models.enum.Role import Role
 from src.models.enum.Difficulty import Difficulty
-from src.services.llm import LLM
-from src.a2a.messenger import Messenger
+from src.models.enum.Phase import Phase
+from src.models.abstract.ParticipantBackend import ParticipantBackend
+from src.models.AgentSession import AgentSession
+from src.models.PhaseResponse import describe_errors, response_model_for
+from src.models.Transcript import Transcript, fit_lines
+from src.services.llm import LLM, prefix_cacheable
+from src.services.replies import ReplyParseError, extract_json_object
+from src.services.tokens import CHARS_PER_TOKEN
+from src.services.resilience import CircuitBreaker, ParticipantUnavailableError, get_circuit_breaker, is_transient, sleep_before_retry
+from src.a2a.messenger import ContextRejectedError, Messenger
+from src import prompts
 
 from src.models.enum.EliminationType import EliminationStatus
 
@@ -13,6 +21,10 @@ if TYPE_CHECKING:
     from src.game.AgentState import AgentState
     from src.game.GameData import GameData
 
+# Attempts at a valid reply before a phase falls back to its default
+MAX_REPLY_ATTEMPTS = 3
+
+
 class Participant(BaseModel):
     model_config = {"arbitrary_types_allowed": True}
 
@@ -23,221 +35,347 @@ class Participant(BaseModel):
     messenger: Any  # Messenger at runtime
     llm_state: Optional[Any] = None  # AgentState at runtime
     url: Optional[str] = None
-    llm: Optional[Any] = None  # LLM at runtime
-    difficulty: Difficulty = Difficulty.HARD   
+    llm: Optional[Any] = None  # ParticipantBackend (LLM or StandInBackend) at runtime
+    difficulty: Difficulty = Difficulty.HARD
+    session: Optional[AgentSession] = None  # delta-only A2A session (external agents, opt-in)
+
+    def model_post_init(self, __context: Any):
+        if isinstance(self.llm, ParticipantBackend):
+            self.llm.bind(self)
 
     #Messaging
-    async def talk_to_agent(self, prompt: str):
+    async def talk_to_agent(self, prompt: str, phase: Optional[Phase] = None):
         if not prompt or not prompt.strip():
             raise ValueError(f"[Participant {self.id[:8]}] Attempted to send empty prompt")
 
+        response = await self.send_with_retry(prompt, phase)
+        parsed = self.parse_json_response(response)
+        return parsed
+
+    async def send(self, prompt: str, phase: Optional[Phase] = None) -> str:
         if self.use_llm:
-            response = self.llm.execute_prompt(prompt=prompt)
-        else:
-            # Use new_conversation=True to avoid context continuation issues
+            return await self.llm.execute_prompt_async(prompt=prompt, phase=phase)
+        if self.session is not None:
+            return await self.talk_in_session(prompt)
+        # Use new_conversation=True to avoid context continuation issues
+        return await self.messenger.talk_to_agent(
+            message=prompt,
+            url=self.url,
+            new_conversation=True
+        )
+
+    async def send_with_retry(self, prompt: str, phase: Optional[Phase] = None) -> str:
+        """
+        Send a prompt, retrying transient failures with jittered exponential backoff.
+
+        Game prompts are idempotent, so resending one is safe. Failures count
+        against the endpoint's circuit breaker; while it is open, calls fail
+        fast. Raises ParticipantUnavailableError once retries run out or the
+        circuit is open.
+        """
+        config = self.game_data.config
+        breaker = self.circuit_breaker()
+
+        for attempt in range(config.participant_retries + 1):
+            if not breaker.allow():
+                self.record_call_failure(phase, attempt + 1, "circuit_open", "circuit open")
+                raise ParticipantUnavailableError(f"{self.endpoint} is unavailable (circuit open)")
+
+            try:
+                response = await self.send(prompt, phase)
+            except Exception as e:
+                if not is_transient(e):
+                    # The endpoint answered; the problem is the call itself
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                if attempt == config.participant_retries or breaker.state == "open":
+                    self.record_call_failure(phase, attempt + 1, "gave_up", repr(e))
+                    raise ParticipantUnavailableError(f"{self.endpoint} failed after {attempt + 1} attempts: {e}") from e
+                self.record_call_failure(phase, attempt + 1, "retried", repr(e))
+                await sleep_before_retry(attempt, config.retry_base_delay_seconds, config.retry_max_delay_seconds)
+            except BaseException:
+                # Cancelled mid-call: no verdict on the endpoint, but a half-open trial must not stay claimed
+                breaker.release_trial()
+                raise
+            else:
+                breaker.record_success()
+                return response
+
+    def circuit_breaker(self) -> CircuitBreaker:
+        """
+        The breaker guarding this participant's endpoint.
+
+        Agent URLs share one breaker across the process. Simulated players get
+        one per game: their model is shared by every game, and a process-wide
+        open circuit would quietly turn all later games into fallback moves.
+        """
+        config = self.game_data.config
+        if not self.use_llm:
+            return get_circuit_breaker(self.endpoint, config.circuit_failure_threshold, config.circuit_reset_seconds)
+        breaker = self.game_data.circuit_breakers.get(self.endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(config.circuit_failure_threshold, config.circuit_reset_seconds)
+            self.game_data.circuit_breakers[self.endpoint] = breaker
+        return breaker
+
+    def record_call_failure(self, phase: Optional[Phase], attempt: int, outcome: str, error: str):
+        self.game_data.call_failures.append({
+            "round": self.game_data.current_round,
+            "phase": phase.name if phase is not None else None,
+            "participant_id": self.id,
+            "endpoint": self.endpoint,
+            "simulated": self.use_llm,
+            "attempt": attempt,
+            "outcome": outcome,
+            "error": error,
+        })
+
+    async def ask(self, prompt: str, phase: Phase, candidates: Optional[Iterable[str]] = None, max_attempts: int = MAX_REPLY_ATTEMPTS) -> Optional[BaseModel]:
+        """
+        Send a phase prompt and validate the reply against the phase's response model.
+
+        Player choices must be one of ``candidates`` (participant IDs) and are
+        returned resolved to participant IDs. An unparseable or invalid reply
+        is re-requested with the error appended to the prompt, up to
+        ``max_attempts`` in total; returns None if no valid reply arrives or
+        the participant is unavailable.
+        """
+        model = response_model_for(phase)
+        context = {
+            "resolve": self.game_data.resolve_player,
+            "alias": self.alias,
+            "candidates": list(candidates) if candidates is not None else None,
+        }
+
+        message = prompt
+        for attempt in range(1, max_attempts + 1):
+            try:
+                return model.model_validate(await self.talk_to_agent(message, phase=phase), context=context)
+            except ParticipantUnavailableError:
+                # Already retried (or failing fast); re-prompting wouldn't help
+                return None
+            except ReplyParseError as e:
+                error = e.reason
+            except ValidationError as e:
+                error = describe_errors(e)
+
+            self.game_data.invalid_replies.append({
+                "round": self.game_data.current_round,
+                "phase": phase.name,
+                "participant_id": self.id,
+                "attempt": attempt,
+                "error": error,
+            })
+            message = f"{prompt}\n\n{prompts.INVALID_REPLY.render(error=error)}"
+        return None
+
+    async def talk_in_session(self, prompt: str) -> str:
+        """
+        Send a prompt in this participant's own A2A context.
+
+        If the remote rejects the context, the session is reset and the full
+        equivalent of the prompt, plus anything appended to it (such as a
+        re-prompt note), is sent in a new context instead.
+        """
+        session = self.session
+        built_here = session.last_prompt is not None and prompt.startswith(session.last_prompt)
+
+        try:
             response = await self.messenger.talk_to_agent(
                 message=prompt,
                 url=self.url,
-                new_conversation=True
+                new_conversation=not session.active,
+                context_key=self.id
+            )
+        except ContextRejectedError:
+            session.reset()
+            if built_here and session.resync_prompt is not None:
+                prompt = session.resync_prompt + prompt[len(session.last_prompt):]
+            response = await self.messenger.talk_to_agent(
+                message=prompt,
+                url=self.url,
+                new_conversation=True,
+                context_key=self.id
             )
 
-        parsed = self.parse_json_response(response)
-        return parsed
+        if built_here or not session.active:
+            session.commit(sent=prompt)
+        return response
         
     def parse_json_response(self, response: str) -> dict:
         """
         Parse JSON response from agent.
         Expected format varies by phase, but generally: {"key": "value", ...}
+        Raises ReplyParseError if the reply holds no JSON object.
         """
-        try:
-            # Try to parse the entire response as JSON
-            return json.loads(response)
-        except json.JSONDecodeError:
-            # If that fails, try to extract JSON from markdown code blocks
-            # Sometimes LLMs wrap JSON in ```json ... ```
-            json_match = response.find("```json")
-            if json_match != -1:
-                start = response.find("\n", json_match) + 1
-                end = response.find("```", start)
-                json_str = response[start:end].strip()
-                return json.loads(json_str)
-
-            # Try without the json marker
-            json_match = response.find("```")
-            if json_match != -1:
-                start = response.find("\n", json_match) + 1
-                end = response.find("```", start)
-                json_str = response[start:end].strip()
-                return json.loads(json_str)
-
-            # If all else fails, raise an error with the response
-            raise ValueError(f"Could not parse JSON from agent response: {response}")
-        
-    
-    #Helpers
-    def get_context_prompt(self):
-        return f"""
-            You are a participant in a game of werewolf.
-            Your player ID: {self.id}
-            Your role: {self.role.name}
-        """
-            
-    # Prompts
-    def get_vote_prompt(self) -> str:
-        current_round = self.game_data.current_round
-        messages = self.game_data.chat_history.get(current_round, [])
-        participants = self.game_data.participants.get(current_round, [])
+        return extract_json_object(response)
 
-        messages_w_ids = [f"{msg.sender_id} - {msg.content}" for msg in messages]
-        participant_ids = [p.id for p in participants if p.id != self.id]
-
-        context = self.get_context_prompt()
+    #Helpers
+    @property
+    def endpoint(self) -> str:
+        """What this participant's calls go to, for circuit breaking: the agent URL or the backend model."""
+        if self.use_llm:
+            return f"llm:{getattr(self.llm, 'model', type(self.llm).__name__)}"
+        return self.url or self.id
 
-        return f"""
-            {context}
+    def alias(self, participant_id: str) -> str:
+        return self.game_data.alias_for(participant_id)
 
-            It's time to vote for a player to eliminate.
+    def get_context_prompt(self, memory_since: int = 0):
+        context = prompts.CONTEXT.render(player=self.alias(self.id), role=self.role.name)
+        memory = self.llm_state.get_memory_prompt(since_round=memory_since) if self.llm_state is not None else ""
+        if memory:
+            context = f"{context}\n\n{prompts.MEMORY.render(memory=memory)}"
+        return context
 
-            Your role is: {self.role.name}
+    def render_prompt(self, template: "prompts.PhasePrompt", transcript_round: Optional[int] = None, empty_transcript: str = "No messages yet.", **sections) -> str:
+        """
+        Render a phase prompt, filling ``transcript`` from ``transcript_round`` if given.
 
-            Here is all of the conversations from this round:
-            {chr(10).join(messages_w_ids)}
+        The transcript is cut down to fit the phase's token budget, if one is
+        configured. In session mode, once the remote context holds the static
+        prefix, only the suffix is sent: the rolling memory and the transcript
+        are cut down to the notes and messages this participant hasn't been
+        sent yet.
+        """
+        transcript = self.game_data.get_transcript(transcript_round) if transcript_round is not None else None
+        session = self.session
+        if session is None:
+            return self.build_prompt(template, transcript, empty_transcript, sections)
+
+        session.resync_prompt = self.build_prompt(template, transcript, empty_transcript, sections)
+        session.pending = {transcript_round: transcript.rendered_messages} if transcript is not None else {}
+        session.pending_remembered = self.llm_state.last_recorded_round if self.llm_state is not None else 0
+        prompt = session.resync_prompt
+        if session.active:
+            delivered = session.delivered.get(transcript_round, 0)
+            prompt = self.build_prompt(template, transcript, empty_transcript, sections, delivered=delivered, delta=True, memory_since=session.remembered)
+
+        session.last_prompt = prompt
+        return prompt
+
+    @property
+    def shares_prefix(self) -> bool:
+        """Whether prompts start with the shared static prefix: only when it is cached or sent once per session."""
+        if self.session is not None:
+            return True
+        if not self.game_data.config.cache_prompt_prefix:
+            return False
+        # A prefix too short for the Gemini model to cache would just be resent in every call
+        return not isinstance(self.llm, LLM) or prefix_cacheable(self.llm.model)
+
+    def build_prompt(self, template: "prompts.PhasePrompt", transcript: Optional[Transcript], empty_transcript: str, sections: dict, delivered: int = 0, delta: bool = False, memory_since: int = 0) -> str:
+        sections = dict(sections, context=self.get_context_prompt(memory_since=memory_since))
+        if delta:
+            render = template.render_suffix
+        elif self.shares_prefix:
+            render = template.render
+        else:
+            render = template.render_standalone
 
-            Pick a single player to eliminate and provide an explanation as to why.
-            Here are the players to choose from:
-            {chr(10).join(participant_ids)}
+        if transcript is not None:
+            header = "(continuing after the messages already sent)\n" if delivered else ""
+            if delivered >= transcript.rendered_messages:
+                sections["transcript"] = "No new messages since your last turn." if delivered else empty_transcript
+            else:
+                sections["transcript"] = header + self.fit_transcript(template, render, transcript, delivered, len(header), sections)
+        return render(**sections)
+
+    def fit_transcript(self, template: "prompts.PhasePrompt", render: Callable[..., str], transcript: Transcript, delivered: int, reserved: int, sections: dict) -> str:
+        """The transcript's rendered text after ``delivered`` messages, cut down if the prompt would exceed the phase's token budget."""
+        text = transcript.text_since(delivered)
+        config = self.game_data.config
+        budget = config.token_budget_for(template.phase)
+        if budget is None:
+            return text
+
+        # Everything in the per-player part except the transcript counts against the budget
+        _, suffix = prompts.split_prefix(render(**dict(sections, transcript="")))
+        overhead = len(suffix) + reserved
+        max_chars = budget * CHARS_PER_TOKEN - overhead
+        if len(text) <= max_chars:
+            return text
+
+        # Only a transcript that has to be cut is split back into its messages
+        policy = config.truncation_policy
+        note = f"[transcript shortened to fit the prompt budget ({policy.value})]"
+        kept, affected = fit_lines(transcript.message_lines(delivered), max_chars - len(note) - 1, policy)
+        self.game_data.truncations.append({
+            "round": self.game_data.current_round,
+            "phase": template.phase.name,
+            "participant_id": self.id,
+            "policy": policy.value,
+            "messages_affected": affected,
+            "budget_tokens": budget,
+        })
+        return "\n".join([note] + kept)
 
-            Respond in JSON format:
-            {{
-                "player_id": "the player ID you want to eliminate",
-                "reason": "your explanation for why you are eliminating this player"
-            }}
+    # Prompts
+    def get_vote_prompt(self) -> str:
+        current_round = self.game_data.current_round
+        participants = self.game_data.participants.get(current_round, [])
 
-            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
-        """
+        return self.render_prompt(
+            prompts.VOTE,
+            transcript_round=current_round,
+            round=current_round,
+            candidates="\n".join(self.alias(p.id) for p in participants if p.id != self.id),
+        )
 
     def get_werewolf_prompt(self) -> str:
         current_round = self.game_data.current_round
         participants = self.game_data.participants.get(current_round, [])
-        participant_ids = [p.id for p in participants if p.id != self.id]
 
-        context = self.get_context_prompt()
-        participants_list = "\n".join([f"- {p}" for p in participant_ids])
-
-        return f"""
-            {context}
-
-            ROUND {current_round}:
-
-            YOU ARE THE WEREWOLF
-
-            Pick one participant to eliminate. Here is a list of the participants:
-            {participants_list}
-
-            Be sure to also explain why you are choosing to eliminate this player.
-
-            Respond with a JSON object in the following format:
-            {{
-                "player_id": "the player ID you want to eliminate",
-                "reason": "your explanation for why you are eliminating this player"
-            }}
-
-            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
-        """
+        return self.render_prompt(
+            prompts.WEREWOLF,
+            round=current_round,
+            candidates="\n".join(f"- {self.alias(p.id)}" for p in participants if p.id != self.id),
+        )
 
     def get_seer_prompt(self) -> str:
         current_round = self.game_data.current_round
         participants = self.game_data.participants.get(current_round, [])
         previous_checks = self.game_data.seer_checks
 
-        context = self.get_context_prompt()
-
         previous_checked_names = [name for name, _ in previous_checks]
-        remaining = [p.id for p in participants if p.id not in previous_checked_names and p.id != self.id]
+        remaining = [self.alias(p.id) for p in participants if p.id not in previous_checked_names and p.id != self.id]
         remaining_list = "\n".join([f"- {p}" for p in remaining])
-        checked_list = "\n".join([f"- {name} is werewolf: {result}" for name, result in previous_checks])
-
-        return f"""
-            {context}
-
-            ROUND {current_round}:
-
-            YOU ARE THE SEER
+        checked_list = "\n".join([f"- {self.alias(name)} is werewolf: {result}" for name, result in previous_checks])
 
-            Pick one participant to investigate. If you already know who the werewolf is, you don't have
-            to investigate someone again.
-
-            Participants you have not checked:
-            {remaining_list if remaining_list else "None"}
-
-            Participants you have checked:
-            {checked_list if checked_list else "None"}
-
-            Explain why you are choosing to investigate this player.
-
-            Respond with a JSON object in the following format:
-            {{
-                "player_id": "the player ID you want to investigate",
-                "reason": "your explanation for why you are investigating this player"
-            }}
-
-            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
-        """
+        return self.render_prompt(
+            prompts.SEER,
+            round=current_round,
+            unchecked=remaining_list or "None",
+            checked=checked_list or "None",
+        )
 
     def get_seer_reveal_prompt(self, player_id: str, is_werewolf: bool) -> str:
-        context = self.get_context_prompt()
+        return prompts.SEER_REVEAL.render(
+            context=self.get_context_prompt(),
+            player=self.alias(player_id),
+            verdict="are" if is_werewolf else "are not",
+        )
 
-        return f"""
-            {context}
-
-            Here are the results of your investigation:
-
-            You investigated player: {player_id}
-            They {"are" if is_werewolf else "are not"} the werewolf
-        """
-
-    def get_bid_prompt(self) -> str:
+    def get_bid_prompt(self, sealed: bool = False) -> str:
         current_round = self.game_data.current_round
         bids = self.game_data.bids.get(current_round, [])
 
-        context = self.get_context_prompt()
-        bids_list = "\n".join([f"- Participant {bid.participant_id}: {bid.amount} points" for bid in bids])
-
-        return f"""
-            {context}
-
-            It is time to place your bid for speaking order in the upcoming debate round.
-            You are playing as a {self.role.name}.
-
-            Place a bid between 0 and 100 points to determine your speaking order.
-
-            Remember, your bid will determine when you get to speak, with higher bids allowing you to speak earlier.
-            Consider your strategy carefully based on the current state of the game.
-
-            Current bids from other participants:
-            {bids_list if bids_list else "No bids yet."}
-
-            Respond in JSON format:
-            {{
-                "bid_amount": 50,
-                "reason": "your explanation for your bid"
-            }}
+        if sealed:
+            bids_section = "Bids are sealed this round: everyone bids at the same time without seeing the others."
+        else:
+            bids_list = "\n".join([f"- Participant {self.alias(bid.participant_id)}: {bid.amount} points" for bid in bids])
+            bids_section = f"Current bids from other participants:\n{bids_list or 'No bids yet.'}"
 
-            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
-        """
+        return self.render_prompt(prompts.BID, round=current_round, bids=bids_section)
 
     def get_debate_prompt(self) -> str:
         current_round = self.game_data.current_round
-        messages = self.game_data.chat_history.get(current_round, [])
         speaking_order = self.game_data.speaking_order.get(current_round, [])
 
-        context = self.get_context_prompt()
-        messages_str = "\n".join([f"{msg.sender_id}: {msg.content}" for msg in messages])
-        order_str = ", ".join(speaking_order)
-
         # Handle night info - may be None on first round
         if self.game_data.latest_werewolf_kill is not None:
-            latest_kill_target = self.game_data.latest_werewolf_kill[0]
+            latest_kill_target = self.alias(self.game_data.latest_werewolf_kill[0])
             latest_kill_success = self.game_data.latest_werewolf_kill[1]
             if latest_kill_success == EliminationStatus.SUCCESS:
                 night_info = f"Last night, {latest_kill_target} was eliminated by the werewolves."
@@ -245,69 +383,24 @@ class Participant(BaseModel):
                 night_info = f"Last night, {latest_kill_target} was targeted by the werewolves but was saved by the doctor."
         else:
             night_info = ""
-            
-        return f"""
-            {context}
-
-            ROUND {current_round} - Debate Phase
-
-            Your role is: {self.role.name}
-
-            {night_info}
-
-            Speaking order: {order_str}
-
-            Conversation so far:
-            {messages_str if messages_str else "No messages yet."}
 
-            Share your thoughts with the group. Try to identify the werewolf (or deflect suspicion if you are the werewolf).
+        return self.render_prompt(
+            prompts.DEBATE,
+            transcript_round=current_round,
+            round=current_round,
+            night_info=night_info,
+            speaking_order=", ".join(self.alias(pid) for pid in speaking_order),
+        )
 
-            Respond in JSON format:
-            {{
-                "message": "your message to the group"
-            }}
-
-            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
-        """
-        
     def get_doctor_prompt(self) -> str:
         current_round = self.game_data.current_round
-        # Use previous round's chat history since night happens before debate
-        previous_round = current_round - 1
-        messages = self.game_data.chat_history.get(previous_round, [])
         participants = self.game_data.participants.get(current_round, [])
 
-        context = self.get_context_prompt()
-        messages_w_ids = [f"{msg.sender_id} - {msg.content}" for msg in messages]
-
         # Get list of valid targets (exclude self)
-        valid_targets = [p.id for p in participants if p.id != self.id]
-        targets_list = "\n".join([f"- {p}" for p in valid_targets])
-
-        return f"""
-            {context}
-
-            ROUND {current_round}:
-
-            YOU ARE THE DOCTOR
-
-            Pick one participant to save. Whoever you save cannot be eliminated by the werewolf tonight.
-            You are not allowed to save yourself. Remember, it is important to save those who you feel
-            are contributing valuable information, particularly individuals who you think might be the seer.
-
-            Players you can save:
-            {targets_list}
-
-            Here are the conversations from last round:
-            {chr(10).join(messages_w_ids) if messages_w_ids else "No conversations yet (first round)."}
-
-            Explain why you are choosing to save this player.
-
-            Respond with a JSON object in the following format:
-            {{
-                "player_id": "the player ID you want to save",
-                "reason": "your explanation for why you are saving this player"
-            }}
+        valid_targets = [self.alias(p.id) for p in participants if p.id != self.id]
 
-            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
-        """
\ No newline at end of file
+        return self.render_prompt(
+            prompts.DOCTOR,
+            round=current_round,
+            candidates="\n".join([f"- {p}" for p in valid_targets]),
+        )
@@ -0,0 +1,62 @@
+from typing import Dict, Optional, Type
+
+from pydantic import BaseModel, Field, ValidationError, ValidationInfo, field_validator
+from src.models.enum.Phase import Phase
+
+
+class BidResponse(BaseModel):
+    bid_amount: int = Field(ge=0, le=100, description="Points bid for speaking order, 0 to 100")
+    reason: str = Field(description="Explanation for the bid")
+
+
+class DebateResponse(BaseModel):
+    model_config = {"str_strip_whitespace": True}
+
+    message: str = Field(min_length=1, description="Message to the group")
+
+
+class PlayerChoiceResponse(BaseModel):
+    """
+    A vote or a night action: the chosen player and why.
+
+    Validated with a context of ``resolve`` (alias to participant ID),
+    ``candidates`` (allowed participant IDs) and ``alias`` (ID to the name
+    shown to agents); player_id comes out as the resolved participant ID.
+    """
+    player_id: str = Field(description="The chosen player's ID")
+    reason: str = Field(description="Explanation for this choice")
+
+    @field_validator("player_id")
+    @classmethod
+    def validate_candidate(cls, name: str, info: ValidationInfo) -> str:
+        context = info.context or {}
+        resolve = context.get("resolve")
+        player_id = resolve(name) if resolve is not None else name
+
+        candidates = context.get("candidates")
+        if candidates is not None and player_id not in candidates:
+            alias = context.get("alias", str)
+            raise ValueError(f"'{name}' is not a valid choice; pick one of: {', '.join(alias(c) for c in candidates)}")
+        return player_id
+
+
+# Reply shape for each phase that prompts a player; night covers the werewolf, seer and doctor
+RESPONSE_MODELS: Dict[Phase, Type[BaseModel]] = {
+    Phase.BIDDING: BidResponse,
+    Phase.DISCUSSION: DebateResponse,
+    Phase.VOTE: PlayerChoiceResponse,
+    Phase.NIGHT: PlayerChoiceResponse,
+}
+
+
+def response_model_for(phase: Optional[Phase]) -> Optional[Type[BaseModel]]:
+    return RESPONSE_MODELS.get(phase) if phase is not None else None
+
+
+def describe_errors(error: ValidationError) -> str:
+    """Summarise validation problems on one line, phrased for the agent that sent the reply."""
+    problems = []
+    for e in error.errors():
+        field = ".".join(str(part) for part in e["loc"]) or "reply"
+        problems.append(f"{field}: {e['msg'].removeprefix('Value error, ')}")
+    return "; ".join(problems)
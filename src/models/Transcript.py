@@ -0,0 +1,105 @@
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+from src.models.Message import Message
+from src.models.enum.TruncationPolicy import TruncationPolicy
+
+# PER_SPEAKER never cuts messages shorter than this; it drops the oldest instead
+MIN_MESSAGE_CHARS = 40
+
+
+def joined_length(lines: List[str]) -> int:
+    return sum(len(line) for line in lines) + max(len(lines) - 1, 0)
+
+
+def shorten_line(line: str, limit: int) -> str:
+    return line if len(line) <= limit else line[:max(limit - 3, 0)] + "..."
+
+
+def fit_lines(lines: List[str], max_chars: int, policy: TruncationPolicy) -> Tuple[List[str], int]:
+    """
+    Cut rendered transcript lines down to at most max_chars once joined.
+
+    Returns the kept lines and how many messages were dropped or shortened.
+    """
+    if joined_length(lines) <= max_chars:
+        return lines, 0
+
+    affected = 0
+    if policy == TruncationPolicy.PER_SPEAKER:
+        # Largest per-message length that fits, found by binary search
+        low, high = MIN_MESSAGE_CHARS, max(len(line) for line in lines)
+        while low < high:
+            cap = (low + high + 1) // 2
+            if joined_length([shorten_line(line, cap) for line in lines]) <= max_chars:
+                low = cap
+            else:
+                high = cap - 1
+        shortened = [shorten_line(line, low) for line in lines]
+        affected = sum(1 for before, after in zip(lines, shortened) if before != after)
+        lines = shortened
+
+    kept = list(lines)
+    while len(kept) > 1 and joined_length(kept) > max_chars:
+        kept.pop(0)
+        affected += 1
+    if kept and len(kept[0]) > max_chars:
+        # A single message larger than the whole budget
+        kept = [shorten_line(kept[0], max_chars)] if max_chars > 0 else []
+        affected += 1
+    return kept, min(affected, len(lines))
+
+
+class Transcript(BaseModel):
+    """
+    Append-only rendering of one round's chat history.
+
+    Each message is rendered once when it first appears in the round's
+    chat_history; every prompt builder afterwards reuses the rendered text.
+    """
+    text: str = ""
+    rendered_messages: int = 0
+    offsets: List[int] = []  # where each rendered message starts in text
+
+    def sync(self, messages: List[Message], aliases: Optional[Dict[str, str]] = None) -> str:
+        """
+        Render any messages added since the last call and return the full text.
+
+        Senders are shown by their alias when one is given.
+        """
+        if len(messages) < self.rendered_messages:
+            # History was replaced rather than appended to; start over
+            self.text = ""
+            self.rendered_messages = 0
+            self.offsets = []
+
+        for message in messages[self.rendered_messages:]:
+            self.append(message, aliases)
+        return self.text
+
+    def append(self, message: Message, aliases: Optional[Dict[str, str]] = None):
+        sender = (aliases or {}).get(message.sender_id, message.sender_id)
+        line = f"{sender}: {message.content}"
+        if self.text:
+            self.offsets.append(len(self.text) + 1)
+            self.text = f"{self.text}\n{line}"
+        else:
+            self.offsets.append(0)
+            self.text = line
+        self.rendered_messages += 1
+
+    def message_lines(self, start: int = 0) -> List[str]:
+        """Rendered line of every message from ``start`` on."""
+        ends = [offset - 1 for offset in self.offsets[1:]] + [len(self.text)]
+        return [self.text[self.offsets[i]:ends[i]] for i in range(start, self.rendered_messages)]
+
+    def text_since(self, count: int) -> str:
+        """Rendered text of every message after the first ``count``."""
+        if count >= self.rendered_messages:
+            return ""
+        return self.text[self.offsets[count]:]
+
+    @property
+    def length(self) -> int:
+        """Number of rendered characters."""
+        return len(self.text)
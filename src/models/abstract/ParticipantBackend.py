@@ -0,0 +1,16 @@
+from typing import Any, Optional
+from abc import ABC, abstractmethod
+
+from src.models.enum.Phase import Phase
+
+
+class ParticipantBackend(ABC):
+    """Produces the raw reply of a simulated participant to a game prompt."""
+
+    def bind(self, participant: Any):
+        """Called once the owning Participant is built; backends that need game context keep a reference."""
+        pass
+
+    @abstractmethod
+    async def execute_prompt_async(self, prompt: str, phase: Optional[Phase] = None) -> str:
+        pass
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class Backend(Enum):
+    """Which backend plays the simulated participants."""
+    GEMINI = "gemini"
+    STAND_IN = "stand_in"  # Local, offline player for benchmarks and CI
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class BiddingMode(Enum):
+    """How bids for speaking order are collected each round."""
+    SEQUENTIAL = "sequential"  # Participants bid one at a time and see earlier bids
+    SEALED = "sealed"  # All bids are requested at once and nobody sees the others
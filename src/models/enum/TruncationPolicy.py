@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class TruncationPolicy(Enum):
+    """How a round's transcript is cut down when a prompt exceeds its token budget."""
+    OLDEST_FIRST = "oldest_first"  # Drop whole messages, oldest first
+    PER_SPEAKER = "per_speaker"  # Cut every message to the same length so each speaker keeps a voice
@@ -1,9 +1,13 @@
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any, Optional
 
 from src.models.abstract.Phase import Phase
 from src.models.Bid import Bid
 from src.models.Event import Event
+from src.models.PhaseResponse import BidResponse
 from src.models.enum.EventType import EventType
+from src.models.enum.BiddingMode import BiddingMode
+from src.models.enum.Phase import Phase as PhaseEnum
 
 if TYPE_CHECKING:
     from src.game.Game import Game
@@ -19,6 +23,13 @@ class Bidding(Phase):
         self.tally_bids_and_set_order()
 
     async def collect_round_bids(self):
+        if self.game.state.config.bidding_mode == BiddingMode.SEALED:
+            await self.collect_sealed_bids()
+        else:
+            await self.collect_sequential_bids()
+
+    async def collect_sequential_bids(self):
+        """Ask each participant in turn; later bidders see the earlier bids."""
         game_state = self.game.state
         current_round = game_state.current_round
 
@@ -26,32 +37,60 @@ class Bidding(Phase):
 
         for participant in current_participants:
             await self.game.log(f"[Bidding] {participant.id[:8]} placing bid...")
-            response = await participant.talk_to_agent(
-                prompt=participant.get_bid_prompt(),
-            )
+            response = await participant.ask(participant.get_bid_prompt(), PhaseEnum.BIDDING)
 
-            bid_amount = response["bid_amount"]
-            reason = response["reason"]
-            await self.game.log(f"[Bidding] {participant.id[:8]} bid {bid_amount}")
+            await self.record_bid(participant, response)
 
-            player_bid = Bid(
-                participant_id=participant.id,
-                amount=bid_amount
-            )
+    async def collect_sealed_bids(self):
+        """Ask every participant at once; bids are recorded in participant order."""
+        game_state = self.game.state
+        current_round = game_state.current_round
+
+        current_participants = game_state.participants[current_round]
 
-            if current_round not in game_state.bids:
-                game_state.bids[current_round] = []
+        await self.game.log(f"[Bidding] Requesting {len(current_participants)} sealed bids...")
 
-            game_state.bids[current_round].append(player_bid)
+        # Build every prompt before any bid is recorded so nobody sees another bid
+        prompts = [participant.get_bid_prompt(sealed=True) for participant in current_participants]
+        responses = await asyncio.gather(*(
+            participant.ask(prompt, PhaseEnum.BIDDING)
+            for participant, prompt in zip(current_participants, prompts)
+        ))
+
+        for participant, response in zip(current_participants, responses):
+            await self.record_bid(participant, response)
+
+    async def record_bid(self, participant: Any, response: Optional[BidResponse]):
+        game_state = self.game.state
+        current_round = game_state.current_round
 
-            # Log Event
-            bid_event = Event(
-                type=EventType.BID_PLACED,
-                player=participant.id,
-                description=f"Placed a bid of {bid_amount} points for rationale: {reason}"
-            )
+        if response is None:
+            # Still bid, so the participant keeps a (last) place in the speaking order
+            await self.game.log(f"[Bidding] {participant.id[:8]} gave no valid bid, bidding 0")
+            response = BidResponse(bid_amount=0, reason="No valid bid")
+
+        bid_amount = response.bid_amount
+        reason = response.reason
+        await self.game.log(f"[Bidding] {participant.id[:8]} bid {bid_amount}")
+
+        player_bid = Bid(
+            participant_id=participant.id,
+            amount=bid_amount
+        )
+
+        if current_round not in game_state.bids:
+            game_state.bids[current_round] = []
+
+        game_state.bids[current_round].append(player_bid)
+
+        # Log Event
+        bid_event = Event(
+            type=EventType.BID_PLACED,
+            player=participant.id,
+            description=f"Placed a bid of {bid_amount} points for rationale: {reason}"
+        )
 
-            self.game.log_event(current_round, bid_event)
+        self.game.log_event(current_round, bid_event)
 
     def tally_bids_and_set_order(self):
         game_state = self.game.state
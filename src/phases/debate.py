@@ -31,11 +31,12 @@ class Debate(PhaseBase):
                 participant = participants_dict[participant_id]
 
                 await self.game.log(f"[Debate] {participant_id[:8]} speaking...")
-                response = await participant.talk_to_agent(
-                    prompt=participant.get_debate_prompt(),
-                )
+                response = await participant.ask(participant.get_debate_prompt(), PhaseEnum.DISCUSSION)
+                if response is None:
+                    await self.game.log(f"[Debate] {participant_id[:8]} gave no valid message, skipping their turn")
+                    continue
 
-                message_content = response["message"]
+                message_content = response.message
                 await self.game.log(f"[Debate] {participant_id[:8]}: {message_content[:50]}...")
 
                 # Store response in chat history
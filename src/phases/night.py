@@ -1,56 +1,120 @@
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
 
 from src.models.abstract.Phase import Phase
 from src.models.Event import Event
 from src.models.enum.EventType import EventType
 from src.models.enum.EliminationType import EliminationType
 from src.models.enum.EliminationType import EliminationStatus
+from src.models.enum.Phase import Phase as PhaseEnum
 
 if TYPE_CHECKING:
     from src.game.Game import Game
     from src.a2a.messenger import Messenger
 
 class Night(Phase):
+    """
+    Runs the night in two stages.
+
+    The doctor, werewolf and seer decisions only depend on the state at the
+    start of the night, so they are requested concurrently. They are then
+    resolved in rule order: save, then kill, then seer result.
+    """
+
     def __init__(self, game: "Game", messenger: "Messenger"):
         super().__init__(game, messenger)
 
     async def run(self):
         await self.game.log(f"[Night] Round {self.game.state.current_round}")
-        await self.execute_doctor_save()
-        await self.execute_werewolf_kill()
-        await self.execute_seer_investigation()
+
+        doctor_decision, werewolf_decision, seer_decision = await asyncio.gather(
+            self.collect_doctor_save(),
+            self.collect_werewolf_kill(),
+            self.collect_seer_investigation(),
+        )
+
+        await self.resolve_doctor_save(doctor_decision)
+        await self.resolve_werewolf_kill(werewolf_decision)
+        await self.resolve_seer_investigation(seer_decision)
 
         self.game.log_event(self.game.state.current_round, Event(type=EventType.NIGHT_END))
-        
+
     async def execute_doctor_save(self):
-        game_state = self.game.state
+        await self.resolve_doctor_save(await self.collect_doctor_save())
+
+    async def execute_werewolf_kill(self):
+        await self.resolve_werewolf_kill(await self.collect_werewolf_kill())
+
+    async def execute_seer_investigation(self):
+        await self.resolve_seer_investigation(await self.collect_seer_investigation())
+
+    # Collect decisions
+    async def collect_doctor_save(self) -> Optional[Tuple[str, str]]:
+        """Returns (player_id, rationale) for the doctor's save, or None if there is no save."""
         doctor = self.game.state.doctor
 
-        if game_state.doctor is None:
+        if doctor is None:
             await self.game.log(f"[Night] doctor is dead, skipping save")
-            return
+            return None
 
         await self.game.log(f"[Night] Doctor choosing target to save...")
 
-        # Try up to 3 times if doctor tries to save themselves
-        max_attempts = 3
-        for attempt in range(max_attempts):
-            response = await doctor.talk_to_agent(
-                prompt=doctor.get_doctor_prompt()
-            )
+        # Re-prompted up to MAX_REPLY_ATTEMPTS times if the doctor tries to save themselves
+        candidates = [p.id for p in self.living_participants() if p.id != doctor.id]
+        response = await doctor.ask(doctor.get_doctor_prompt(), PhaseEnum.NIGHT, candidates=candidates)
+        if response is None:
+            await self.game.log("[Night] Doctor failed to choose a valid target, no save this round")
+            return None
+
+        return response.player_id, response.reason
+
+    async def collect_werewolf_kill(self) -> Optional[Tuple[str, str]]:
+        """Returns (player_id, rationale) for the werewolf's target, or None if no werewolf is alive."""
+        werewolf = self.game.state.primary_werewolf
+
+        # Check if primary werewolf is still alive (secondary would have been promoted)
+        if werewolf is None:
+            await self.game.log("[Night] All werewolves are dead, skipping kill")
+            return None
+
+        await self.game.log(f"[Night] Werewolf {werewolf.id[:8]} choosing victim...")
+        candidates = [p.id for p in self.living_participants() if p.id != werewolf.id]
+        response = await werewolf.ask(werewolf.get_werewolf_prompt(), PhaseEnum.NIGHT, candidates=candidates)
+        if response is None:
+            await self.game.log("[Night] Werewolf failed to choose a valid target, no kill this round")
+            return None
+
+        return response.player_id, response.reason
+
+    async def collect_seer_investigation(self) -> Optional[Tuple[Any, str, str]]:
+        """Returns (seer, player_id, rationale) for the investigation, or None if the seer is dead."""
+        seer = self.game.state.seer
+
+        # Check if seer is still alive
+        if seer is None:
+            await self.game.log("[Night] Seer is dead, skipping investigation")
+            return None
+
+        await self.game.log(f"[Night] Seer {seer.id[:8]} choosing target...")
+        candidates = [p.id for p in self.living_participants() if p.id != seer.id]
+        response = await seer.ask(seer.get_seer_prompt(), PhaseEnum.NIGHT, candidates=candidates)
+        if response is None:
+            await self.game.log("[Night] Seer failed to choose a valid target, no investigation this round")
+            return None
 
-            player = response["player_id"]
-            rationale = response["reason"]
+        return seer, response.player_id, response.reason
 
-            # Validate doctor is not saving themselves
-            if player == doctor.id:
-                await self.game.log(f"[Night] Doctor tried to save themselves (attempt {attempt + 1}/{max_attempts}), re-prompting...")
-                if attempt == max_attempts - 1:
-                    await self.game.log(f"[Night] Doctor failed to choose valid target after {max_attempts} attempts, no save this round")
-                    return
-                continue
+    def living_participants(self) -> List[Any]:
+        game_state = self.game.state
+        return game_state.participants.get(game_state.current_round, [])
 
-            break
+    # Resolve decisions
+    async def resolve_doctor_save(self, decision: Optional[Tuple[str, str]]):
+        if decision is None:
+            return
+
+        game_state = self.game.state
+        player, rationale = decision
 
         doctor_save_event = Event(
             type=EventType.DOCTOR_SAVE,
@@ -62,21 +126,12 @@ class Night(Phase):
 
         game_state.doctor_saves[game_state.current_round] = player
 
-    async def execute_werewolf_kill(self):
-        game_state = self.game.state
-
-        # Check if primary werewolf is still alive (secondary would have been promoted)
-        if game_state.primary_werewolf is None:
-            await self.game.log("[Night] All werewolves are dead, skipping kill")
+    async def resolve_werewolf_kill(self, decision: Optional[Tuple[str, str]]):
+        if decision is None:
             return
 
-        await self.game.log(f"[Night] Werewolf {game_state.primary_werewolf.id[:8]} choosing victim...")
-        response = await game_state.primary_werewolf.talk_to_agent(
-            prompt=game_state.primary_werewolf.get_werewolf_prompt(),
-        )
-
-        player = response["player_id"]
-        rationale = response["reason"]
+        game_state = self.game.state
+        player, rationale = decision
         await self.game.log(f"[Night] Werewolf tried to eliminate {player[:8]}: {rationale[:50]}...")
 
         ## Check for doctor save
@@ -105,22 +160,17 @@ class Night(Phase):
             
             game_state.latest_werewolf_kill = (player, EliminationStatus.SUCCESS)
 
-    async def execute_seer_investigation(self):
-        game_state = self.game.state
-        seer = game_state.seer
-
-        # Check if seer is still alive
-        if seer is None:
-            await self.game.log("[Night] Seer is dead, skipping investigation")
+    async def resolve_seer_investigation(self, decision: Optional[Tuple[Any, str, str]]):
+        if decision is None:
             return
 
-        await self.game.log(f"[Night] Seer {seer.id[:8]} choosing target...")
-        response = await seer.talk_to_agent(
-            prompt=seer.get_seer_prompt(),
-        )
+        game_state = self.game.state
+        seer, player, rationale = decision
 
-        player = response["player_id"]
-        rationale = response["reason"]
+        # The seer's choice was made at the start of the night; drop it if they were killed
+        if game_state.seer is None or game_state.seer.id != seer.id:
+            await self.game.log("[Night] Seer was eliminated tonight, discarding investigation")
+            return
 
         seer_investigation_event = Event(
             type=EventType.SEER_INVESTIGATION,
@@ -15,6 +15,7 @@ class RoundEnd(Phase):
         super().__init__(game, messenger)
         
     async def run(self):
+        self.update_memories()
         await self.check_win_conditions()
         self.log_event(EventType.ROUND_END)
         
@@ -49,6 +50,14 @@ class RoundEnd(Phase):
             game_state.current_round += 1
             self.game.current_phase = PhaseEnum.NIGHT
     
+    #Add this round to every surviving participant's rolling memory
+    def update_memories(self):
+        game_state = self.game.state
+        current_round = game_state.current_round
+        for participant in game_state.participants.get(current_round, []):
+            if participant.llm_state is not None:
+                participant.llm_state.record_round(current_round)
+
     #Check if any werewolf is alive (primary or secondary)
     def is_werewolf_alive(self, participants):
         # Check if primary werewolf is alive
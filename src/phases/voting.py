@@ -1,9 +1,12 @@
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from src.models.abstract.Phase import Phase
 from src.models import Event, Vote
+from src.models.PhaseResponse import PlayerChoiceResponse
 from src.models.enum.EventType import EventType
 from src.models.enum.EliminationType import EliminationType
+from src.models.enum.Phase import Phase as PhaseEnum
 
 if TYPE_CHECKING:
     from src.game.Game import Game
@@ -19,41 +22,71 @@ class Voting(Phase):
         await self.tally_and_eliminate()
 
     async def collect_round_votes(self):
+        """
+        Ask every participant for their vote at the same time.
+
+        Votes only depend on the round's chat history, so they are requested
+        concurrently and recorded afterwards in participant order to keep
+        scoring reproducible. A voter that doesn't name a living player within
+        config.vote_timeout_seconds abstains.
+        """
         game_state = self.game.state
         current_round = game_state.current_round
 
         current_participants = game_state.participants[current_round]
+        timeout = game_state.config.vote_timeout_seconds
 
         #Send prompt for player vote
-        for participant in current_participants:
-            await self.game.log(f"[Voting] {participant.id[:8]} voting...")
-            response = await participant.talk_to_agent(
-                prompt=participant.get_vote_prompt(),
-            )
+        await self.game.log(f"[Voting] Requesting {len(current_participants)} votes...")
+        prompts = [participant.get_vote_prompt() for participant in current_participants]
+        responses = await asyncio.gather(*(
+            # Voters may pick any other living player, as listed in their prompt
+            self.request_vote(participant, prompt, [p.id for p in current_participants if p.id != participant.id], timeout)
+            for participant, prompt in zip(current_participants, prompts)
+        ))
+
+        for participant, response in zip(current_participants, responses):
+            if response is not None:
+                await self.record_vote(participant, response)
+
+    async def request_vote(self, participant: Any, prompt: str, candidates: List[str], timeout: float) -> Optional[PlayerChoiceResponse]:
+        try:
+            response = await asyncio.wait_for(participant.ask(prompt, PhaseEnum.VOTE, candidates=candidates), timeout=timeout)
+        except TimeoutError:
+            await self.game.log(f"[Voting] {participant.id[:8]} did not vote within {timeout}s, abstaining")
+            return None
+
+        if response is None:
+            await self.game.log(f"[Voting] {participant.id[:8]} gave no valid vote, abstaining")
+        return response
+
+    async def record_vote(self, participant: Any, response: PlayerChoiceResponse):
+        game_state = self.game.state
+        current_round = game_state.current_round
 
-            voted_for = response["player_id"]
-            rationale = response["reason"]
-            await self.game.log(f"[Voting] {participant.id[:8]} voted for {voted_for[:8]}")
+        voted_for = response.player_id
+        rationale = response.reason
+        await self.game.log(f"[Voting] {participant.id[:8]} voted for {voted_for[:8]}")
 
-            round_votes = game_state.votes[current_round]
+        round_votes = game_state.votes[current_round]
 
-            player_vote = Vote(
-                voter_id=participant.id,
-                voted_for_id=voted_for,
-                rationale=rationale
-            )
+        player_vote = Vote(
+            voter_id=participant.id,
+            voted_for_id=voted_for,
+            rationale=rationale
+        )
 
-            round_votes.append(player_vote)
+        round_votes.append(player_vote)
 
-            # Log Event
-            player_vote_event = Event(
-                type=EventType.VOTE,
-                player=participant.id,
-                description=f"Voted for {voted_for} for rationale: {rationale}"
-            )
+        # Log Event
+        player_vote_event = Event(
+            type=EventType.VOTE,
+            player=participant.id,
+            description=f"Voted for {voted_for} for rationale: {rationale}"
+        )
+
+        self.game.log_event(current_round, player_vote_event)
 
-            self.game.log_event(current_round, player_vote_event)
-        
     async def tally_and_eliminate(self):
         game_state = self.game.state
         current_round = game_state.current_round
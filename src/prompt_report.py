@@ -0,0 +1,379 @@
+"""
+Prompt token report.
+
+Renders every phase prompt for a sample game twice: with the indented
+f-string prompts Participant used before the template layer (kept verbatim
+below as the baseline) and with the compiled templates in src.prompts, and
+reports how many tokens each call actually sends under the given config.
+
+    python -m src.prompt_report [--cache-prefix] [--difficulty easy|hard]
+"""
+import argparse
+from typing import Any, Dict, List
+
+from src.a2a.agent import GreenAgent
+from src.game.Game import Game
+from src.models.EvalConfig import EvalConfig
+from src.models.Message import Message
+from src.models.enum.Backend import Backend
+from src.models.enum.Difficulty import Difficulty
+from src.models.enum.EliminationType import EliminationStatus
+from src.models.enum.Role import Role
+from src.prompts import STATIC_PREFIX, split_prefix
+from src.services.tokens import CHARS_PER_TOKEN, estimate_tokens
+from src.services.llm import MIN_CACHED_TOKENS, prefix_cacheable
+
+
+class LegacyPrompts:
+    """The pre-template prompt builders, bound to a participant for comparison."""
+
+    def __init__(self, participant: Any):
+        self.participant = participant
+
+    def __getattr__(self, name: str):
+        return getattr(self.participant, name)
+
+    def get_context_prompt(self):
+        return f"""
+            You are a participant in a game of werewolf.
+            Your player ID: {self.alias(self.id)}
+            Your role: {self.role.name}
+        """
+
+    def get_vote_prompt(self) -> str:
+        current_round = self.game_data.current_round
+        transcript = self.game_data.get_transcript(current_round)
+        participants = self.game_data.participants.get(current_round, [])
+
+        participant_ids = [self.alias(p.id) for p in participants if p.id != self.id]
+
+        context = self.get_context_prompt()
+
+        return f"""
+            {context}
+
+            It's time to vote for a player to eliminate.
+
+            Your role is: {self.role.name}
+
+            Here is all of the conversations from this round:
+            {transcript.text}
+
+            Pick a single player to eliminate and provide an explanation as to why.
+            Here are the players to choose from:
+            {chr(10).join(participant_ids)}
+
+            Respond in JSON format:
+            {{
+                "player_id": "the player ID you want to eliminate",
+                "reason": "your explanation for why you are eliminating this player"
+            }}
+
+            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
+        """
+
+    def get_werewolf_prompt(self) -> str:
+        current_round = self.game_data.current_round
+        participants = self.game_data.participants.get(current_round, [])
+        participant_ids = [self.alias(p.id) for p in participants if p.id != self.id]
+
+        context = self.get_context_prompt()
+        participants_list = "\n".join([f"- {p}" for p in participant_ids])
+
+        return f"""
+            {context}
+
+            ROUND {current_round}:
+
+            YOU ARE THE WEREWOLF
+
+            Pick one participant to eliminate. Here is a list of the participants:
+            {participants_list}
+
+            Be sure to also explain why you are choosing to eliminate this player.
+
+            Respond with a JSON object in the following format:
+            {{
+                "player_id": "the player ID you want to eliminate",
+                "reason": "your explanation for why you are eliminating this player"
+            }}
+
+            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
+        """
+
+    def get_seer_prompt(self) -> str:
+        current_round = self.game_data.current_round
+        participants = self.game_data.participants.get(current_round, [])
+        previous_checks = self.game_data.seer_checks
+
+        context = self.get_context_prompt()
+
+        previous_checked_names = [name for name, _ in previous_checks]
+        remaining = [self.alias(p.id) for p in participants if p.id not in previous_checked_names and p.id != self.id]
+        remaining_list = "\n".join([f"- {p}" for p in remaining])
+        checked_list = "\n".join([f"- {self.alias(name)} is werewolf: {result}" for name, result in previous_checks])
+
+        return f"""
+            {context}
+
+            ROUND {current_round}:
+
+            YOU ARE THE SEER
+
+            Pick one participant to investigate. If you already know who the werewolf is, you don't have
+            to investigate someone again.
+
+            Participants you have not checked:
+            {remaining_list if remaining_list else "None"}
+
+            Participants you have checked:
+            {checked_list if checked_list else "None"}
+
+            Explain why you are choosing to investigate this player.
+
+            Respond with a JSON object in the following format:
+            {{
+                "player_id": "the player ID you want to investigate",
+                "reason": "your explanation for why you are investigating this player"
+            }}
+
+            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
+        """
+
+    def get_seer_reveal_prompt(self, player_id: str, is_werewolf: bool) -> str:
+        context = self.get_context_prompt()
+
+        return f"""
+            {context}
+
+            Here are the results of your investigation:
+
+            You investigated player: {self.alias(player_id)}
+            They {"are" if is_werewolf else "are not"} the werewolf
+        """
+
+    def get_bid_prompt(self, sealed: bool = False) -> str:
+        current_round = self.game_data.current_round
+        bids = self.game_data.bids.get(current_round, [])
+
+        context = self.get_context_prompt()
+        bids_list = "\n".join([f"- Participant {self.alias(bid.participant_id)}: {bid.amount} points" for bid in bids])
+
+        if sealed:
+            bids_section = "Bids are sealed this round: everyone bids at the same time without seeing the others."
+        else:
+            bids_section = f"""Current bids from other participants:
+            {bids_list if bids_list else "No bids yet."}"""
+
+        return f"""
+            {context}
+
+            It is time to place your bid for speaking order in the upcoming debate round.
+            You are playing as a {self.role.name}.
+
+            Place a bid between 0 and 100 points to determine your speaking order.
+
+            Remember, your bid will determine when you get to speak, with higher bids allowing you to speak earlier.
+            Consider your strategy carefully based on the current state of the game.
+
+            {bids_section}
+
+            Respond in JSON format:
+            {{
+                "bid_amount": 50,
+                "reason": "your explanation for your bid"
+            }}
+
+            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
+        """
+
+    def get_debate_prompt(self) -> str:
+        current_round = self.game_data.current_round
+        speaking_order = self.game_data.speaking_order.get(current_round, [])
+
+        context = self.get_context_prompt()
+        messages_str = self.game_data.get_transcript(current_round).text
+        order_str = ", ".join(self.alias(pid) for pid in speaking_order)
+
+        # Handle night info - may be None on first round
+        if self.game_data.latest_werewolf_kill is not None:
+            latest_kill_target = self.alias(self.game_data.latest_werewolf_kill[0])
+            latest_kill_success = self.game_data.latest_werewolf_kill[1]
+            if latest_kill_success == EliminationStatus.SUCCESS:
+                night_info = f"Last night, {latest_kill_target} was eliminated by the werewolves."
+            else:
+                night_info = f"Last night, {latest_kill_target} was targeted by the werewolves but was saved by the doctor."
+        else:
+            night_info = ""
+            
+        return f"""
+            {context}
+
+            ROUND {current_round} - Debate Phase
+
+            Your role is: {self.role.name}
+
+            {night_info}
+
+            Speaking order: {order_str}
+
+            Conversation so far:
+            {messages_str if messages_str else "No messages yet."}
+
+            Share your thoughts with the group. Try to identify the werewolf (or deflect suspicion if you are the werewolf).
+
+            Respond in JSON format:
+            {{
+                "message": "your message to the group"
+            }}
+
+            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
+        """
+        
+    def get_doctor_prompt(self) -> str:
+        current_round = self.game_data.current_round
+        # Use previous round's chat history since night happens before debate
+        previous_round = current_round - 1
+        previous_transcript = self.game_data.get_transcript(previous_round).text
+        participants = self.game_data.participants.get(current_round, [])
+
+        context = self.get_context_prompt()
+
+        # Get list of valid targets (exclude self)
+        valid_targets = [self.alias(p.id) for p in participants if p.id != self.id]
+        targets_list = "\n".join([f"- {p}" for p in valid_targets])
+
+        return f"""
+            {context}
+
+            ROUND {current_round}:
+
+            YOU ARE THE DOCTOR
+
+            Pick one participant to save. Whoever you save cannot be eliminated by the werewolf tonight.
+            You are not allowed to save yourself. Remember, it is important to save those who you feel
+            are contributing valuable information, particularly individuals who you think might be the seer.
+
+            Players you can save:
+            {targets_list}
+
+            Here are the conversations from last round:
+            {previous_transcript if previous_transcript else "No conversations yet (first round)."}
+
+            Explain why you are choosing to save this player.
+
+            Respond with a JSON object in the following format:
+            {{
+                "player_id": "the player ID you want to save",
+                "reason": "your explanation for why you are saving this player"
+            }}
+
+            IMPORTANT: You MUST respond with valid JSON only. Do not include any text, markdown, or explanation before or after the JSON object.
+        """
+
+
+def create_sample_game(config: EvalConfig | None = None) -> Game:
+    """A round-2 game with a transcript, bids, a seer check and a night result."""
+    config = config or EvalConfig(seed=0)
+    game = Game([], config=config.model_copy(update={"backend": Backend.STAND_IN}))
+    GreenAgent().init_game(game, None, Role.VILLAGER, config.difficulty)
+    state = game.state
+    participants = state.participants[1]
+
+    state.chat_history[1].extend(
+        Message(sender_id=p.id, content="I think we should look closely at who stays quiet.")
+        for p in participants
+    )
+    state.seer_checks.append((state.primary_werewolf.id, True))
+    state.initialize_next_round()
+    state.current_round = 2
+    state.chat_history[2].extend(
+        Message(sender_id=p.id, content="Last round's vote told us a lot about who is hiding.")
+        for p in participants[:3]
+    )
+    state.speaking_order[2] = [p.id for p in participants]
+    state.latest_werewolf_kill = (participants[-1].id, EliminationStatus.SUCCESS)
+    return game
+
+
+def phase_prompts(game: Game) -> Dict[str, tuple]:
+    """(legacy, current) prompt for each phase, rendered for the player who would receive it."""
+    state = game.state
+    villager = state.villagers[0]
+    seer, doctor, werewolf = state.seer, state.doctor, state.primary_werewolf
+
+    def pair(participant, name, *args):
+        legacy = getattr(LegacyPrompts(participant), f"get_{name}_prompt")(*args)
+        current = getattr(participant, f"get_{name}_prompt")(*args)
+        return legacy, current
+
+    return {
+        "vote": pair(villager, "vote"),
+        "werewolf": pair(werewolf, "werewolf"),
+        "seer": pair(seer, "seer"),
+        "seer_reveal": pair(seer, "seer_reveal", werewolf.id, True),
+        "bid": pair(villager, "bid"),
+        "debate": pair(villager, "debate"),
+        "doctor": pair(doctor, "doctor"),
+    }
+
+
+def build_report(game: Game | None = None) -> List[Dict[str, Any]]:
+    """
+    Token counts per phase. "tokens" is the whole prompt as rendered under the
+    game's config; "sent_tokens" is what each call actually sends, which leaves
+    out the shared STATIC_PREFIX only when prefix caching is on and the prefix
+    is long enough for the model to cache.
+    """
+    game = game or create_sample_game()
+    config = game.state.config
+    prefix_cached = config.cache_prompt_prefix and prefix_cacheable(config.difficulty.get_model())
+
+    rows = []
+    for phase, (legacy, current) in phase_prompts(game).items():
+        _, suffix = split_prefix(current)
+        rows.append({
+            "phase": phase,
+            "legacy_tokens": estimate_tokens(legacy),
+            "tokens": estimate_tokens(current),
+            "sent_tokens": estimate_tokens(suffix if prefix_cached else current),
+        })
+    return rows
+
+
+def render_report(rows: List[Dict[str, Any]], config: EvalConfig | None = None) -> str:
+    config = config or EvalConfig()
+    lines = [f"{'phase':<12} {'old':>6} {'prompt':>7} {'sent':>6} {'saved':>7}"]
+    for row in rows + [{
+        "phase": "total",
+        "legacy_tokens": sum(r["legacy_tokens"] for r in rows),
+        "tokens": sum(r["tokens"] for r in rows),
+        "sent_tokens": sum(r["sent_tokens"] for r in rows),
+    }]:
+        saved = 1 - row["sent_tokens"] / row["legacy_tokens"] if row["legacy_tokens"] else 0
+        lines.append(f"{row['phase']:<12} {row['legacy_tokens']:>6} {row['tokens']:>7} {row['sent_tokens']:>6} {saved:>7.0%}")
+
+    if config.cache_prompt_prefix:
+        model = config.difficulty.get_model()
+        prefix = estimate_tokens(STATIC_PREFIX)
+        minimum = MIN_CACHED_TOKENS.get(model, 0)
+        verdict = "cached, so only suffixes are sent" if prefix_cacheable(model) else "too short to cache, so it is not sent"
+        lines.append(f"Shared static prefix: {prefix} tokens; {model} caches at least {minimum} tokens: {verdict}")
+    lines.append(f"(tokens estimated at 1 per {CHARS_PER_TOKEN} characters; 'saved' compares old with sent)")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare phase prompt sizes with the pre-template prompts.")
+    parser.add_argument("--cache-prefix", action="store_true", help="Render prompts as with cache_prompt_prefix")
+    parser.add_argument("--difficulty", type=str, choices=[d.value for d in Difficulty], default=Difficulty.HARD.value)
+    args = parser.parse_args()
+
+    config = EvalConfig(seed=0, difficulty=Difficulty(args.difficulty), cache_prompt_prefix=args.cache_prefix)
+    # Gemini players only get the shared prefix if their model can cache it
+    rendered = config.model_copy(update={"cache_prompt_prefix": args.cache_prefix and prefix_cacheable(config.difficulty.get_model())})
+    print(render_report(build_report(create_sample_game(rendered)), config))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,30 +1,267 @@
+import re
+import textwrap
+from string import Template
+from typing import Dict
+
+from src.models.enum.Phase import Phase
+
+
+def compact(text: str) -> str:
+    """Dedent, strip trailing whitespace and collapse runs of blank lines."""
+    lines = [line.rstrip() for line in textwrap.dedent(text).strip().splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines))
+
+
+class PromptTemplate:
+    """
+    A prompt compiled once at import time.
+
+    The source text is dedented and compacted, ``constants`` are substituted
+    immediately, and only the remaining ``$name`` sections are filled in by
+    ``render``.
+    """
+
+    def __init__(self, text: str, **constants: str):
+        self.text = Template(compact(text)).safe_substitute(constants)
+        self.template = Template(self.text)
+        self.sections = frozenset(self.template.get_identifiers())
+
+    def render(self, **sections) -> str:
+        missing = self.sections - sections.keys()
+        if missing:
+            raise KeyError(f"Missing prompt sections: {', '.join(sorted(missing))}")
+        return self.template.substitute(sections)
+
+
+GAME_RULES = PromptTemplate("""
+    This is the game of werewolf. The main objective is for villagers to detect the werewolves and for the werewolves to avoid detection
+    through deception and persuasion.
+
+    ROLES:
+    - Werewolves (2): Work together to eliminate villagers. One werewolf is the primary killer who chooses the night target.
+      If the primary werewolf is eliminated, the secondary werewolf becomes the primary.
+    - Seer (1): Can investigate one player each night to learn if they are a werewolf.
+    - Doctor (1): Can protect one player each night from being eliminated by the werewolves (cannot protect themselves).
+    - Villagers (3): Must identify and vote out the werewolves through discussion and deduction.
+
+    GAME RULES:
+    Each round starts with a NIGHT phase:
+    1. The doctor chooses one player to protect from elimination.
+    2. The werewolves secretly choose one player to eliminate.
+    3. The seer investigates one player to learn if they are a werewolf.
+
+    Next, the game enters the DAY phase:
+    1. Bidding: Each participant bids for speaking order in the discussion.
+    2. Discussion: Players speak in order of highest bid, sharing suspicions and defending themselves.
+    3. Voting: Each participant votes for one person to eliminate. The player with the most votes is removed.
+
+    WIN CONDITIONS:
+    - Villagers win if both werewolves are eliminated.
+    - Werewolves win if they equal or outnumber the remaining villagers.
+
+    If no winning condition is met after voting, the next round begins at the NIGHT phase.
+""")
+
+RESPONSE_FORMATS = dict(
+    bid_format='Format: {"bid_amount": 50, "reason": "your explanation for your bid"}',
+    debate_format='Format: {"message": "your message to the group"}',
+    player_format='Format: {"player_id": "the chosen player\'s ID", "reason": "your explanation for this choice"}',
+)
+
+REPLY_RULE = "Respond with valid JSON only, with no text or markdown before or after it."
+
+# What each TASK line asks for, with its reply format
+TASKS: Dict[str, str] = {name: PromptTemplate(text, **RESPONSE_FORMATS).text for name, text in {
+    "BID": """
+        Bid between 0 and 100 points for your speaking order in the upcoming debate. Higher bids speak
+        earlier. Consider your strategy carefully based on the current state of the game.
+        $bid_format
+    """,
+    "DEBATE": """
+        Share your thoughts with the group. Try to identify the werewolf (or deflect suspicion if you
+        are the werewolf).
+        $debate_format
+    """,
+    "VOTE": """
+        Pick a single player from the candidates to eliminate and explain why.
+        $player_format
+    """,
+    "WEREWOLF": """
+        You are the werewolf. Pick one of the candidates to eliminate tonight and explain why.
+        $player_format
+    """,
+    "SEER": """
+        You are the seer. Pick one unchecked participant to investigate and explain why. If you already
+        know who the werewolf is, you don't have to investigate someone again.
+        $player_format
+    """,
+    "DOCTOR": """
+        You are the doctor. Pick one of the candidates to save; whoever you save cannot be eliminated
+        by the werewolf tonight. You are not allowed to save yourself. Remember, it is important to save those who
+        you feel are contributing valuable information, particularly individuals who you think might be the seer.
+        $player_format
+    """,
+}.items()}
+
+# With a shared prefix (cache_prompt_prefix or session mode), every phase prompt
+# is STATIC_PREFIX followed by a short per-player suffix. The prefix is identical
+# for every player, phase and game, so providers that cache prompt prefixes (or
+# an explicit cached-content registration) only process it once; the suffix
+# names the player, the current state and the TASK to perform. Without one, the
+# suffix carries only its own task's instructions instead.
+TASK_INSTRUCTIONS = PromptTemplate("""
+    HOW TO PLAY YOUR TURN:
+    Each message gives your player ID and role, what you know about the current round, and ends with a
+    TASK line naming one of the tasks below. Perform only that task. Players are named by short IDs (P1, P2, ...).
+    $reply_rule
+
+    $tasks
+""",
+    reply_rule=REPLY_RULE,
+    tasks="\n\n".join(f"TASK {name}: {text}" for name, text in TASKS.items()),
+)
+
+STATIC_PREFIX = f"{GAME_RULES.text}\n\n{TASK_INSTRUCTIONS.text}\n\n"
+
+CONTEXT = PromptTemplate("""
+    Your player ID: $player
+    Your role: $role
+""")
+
+MEMORY = PromptTemplate("""
+    What you remember from earlier rounds:
+    $memory
+""")
+
+# Appended to the original prompt when a reply has to be re-requested
+INVALID_REPLY = PromptTemplate("""
+    Your previous reply was rejected: $error
+    Reply again with a single JSON object in the format for this task.
+""")
+
+
+class PhasePrompt(PromptTemplate):
+    """A per-player suffix rendered after STATIC_PREFIX, or on its own with its task's instructions."""
+
+    def __init__(self, phase: Phase, task: str, text: str, **constants: str):
+        super().__init__(text, **constants)
+        self.phase = phase
+        self.instructions = f"{TASKS[task]}\n{REPLY_RULE}"
+
+    def render(self, **sections) -> str:
+        return STATIC_PREFIX + super().render(**sections)
+
+    def render_suffix(self, **sections) -> str:
+        """The suffix alone, for a conversation that already holds the prefix."""
+        return super().render(**sections)
+
+    def render_standalone(self, **sections) -> str:
+        """The suffix followed by its task's instructions, for calls that don't share the prefix."""
+        return f"{super().render(**sections)}\n{self.instructions}"
+
+
+VOTE = PhasePrompt(Phase.VOTE, "VOTE", """
+    $context
+
+    ROUND $round
+
+    Conversation this round:
+    $transcript
+
+    Candidates:
+    $candidates
+
+    TASK: VOTE
+""")
+
+WEREWOLF = PhasePrompt(Phase.NIGHT, "WEREWOLF", """
+    $context
+
+    ROUND $round - night
+
+    Candidates:
+    $candidates
+
+    TASK: WEREWOLF
+""")
+
+SEER = PhasePrompt(Phase.NIGHT, "SEER", """
+    $context
+
+    ROUND $round - night
+
+    Participants you have not checked:
+    $unchecked
+
+    Participants you have checked:
+    $checked
+
+    TASK: SEER
+""")
+
+SEER_REVEAL = PromptTemplate("""
+    $context
+
+    Here are the results of your investigation:
+
+    You investigated player: $player
+    They $verdict the werewolf
+""")
+
+BID = PhasePrompt(Phase.BIDDING, "BID", """
+    $context
+
+    ROUND $round - bidding
+
+    $bids
+
+    TASK: BID
+""")
+
+DEBATE = PhasePrompt(Phase.DISCUSSION, "DEBATE", """
+    $context
+
+    ROUND $round - debate
+
+    $night_info
+
+    Speaking order: $speaking_order
+
+    Conversation so far:
+    $transcript
+
+    TASK: DEBATE
+""")
+
+DOCTOR = PhasePrompt(Phase.NIGHT, "DOCTOR", """
+    $context
+
+    ROUND $round - night
+
+    Candidates:
+    $candidates
+
+    TASK: DOCTOR
+""")
+
+# Phase prompts by name, used by the token report
+PHASE_TEMPLATES: Dict[str, PromptTemplate] = {
+    "vote": VOTE,
+    "werewolf": WEREWOLF,
+    "seer": SEER,
+    "seer_reveal": SEER_REVEAL,
+    "bid": BID,
+    "debate": DEBATE,
+    "doctor": DOCTOR,
+}
+
+
+def split_prefix(prompt: str) -> tuple[str, str]:
+    """Split a prompt into (STATIC_PREFIX, suffix); the prefix is empty if the prompt doesn't start with it."""
+    if prompt.startswith(STATIC_PREFIX):
+        return STATIC_PREFIX, prompt[len(STATIC_PREFIX):]
+    return "", prompt
+
+
 def get_game_rules_prompt(self):
-    return """
-        This is the game of werewolf. The main objective is for villagers to detect the werewolves and for the werewolves to avoid detection
-        through deception and persuasion.
-
-        ROLES:
-        - Werewolves (2): Work together to eliminate villagers. One werewolf is the primary killer who chooses the night target.
-          If the primary werewolf is eliminated, the secondary werewolf becomes the primary.
-        - Seer (1): Can investigate one player each night to learn if they are a werewolf.
-        - Doctor (1): Can protect one player each night from being eliminated by the werewolves (cannot protect themselves).
-        - Villagers (3): Must identify and vote out the werewolves through discussion and deduction.
-
-        GAME RULES:
-        Each round starts with a NIGHT phase:
-        1. The doctor chooses one player to protect from elimination.
-        2. The werewolves secretly choose one player to eliminate.
-        3. The seer investigates one player to learn if they are a werewolf.
-
-        Next, the game enters the DAY phase:
-        1. Bidding: Each participant bids for speaking order in the discussion.
-        2. Discussion: Players speak in order of highest bid, sharing suspicions and defending themselves.
-        3. Voting: Each participant votes for one person to eliminate. The player with the most votes is removed.
-
-        WIN CONDITIONS:
-        - Villagers win if both werewolves are eliminated.
-        - Werewolves win if they equal or outnumber the remaining villagers.
-
-        If no winning condition is met after voting, the next round begins at the NIGHT phase.
-
-    """
\ No newline at end of file
+    return GAME_RULES.text
@@ -0,0 +1,91 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Awaitable, Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PERCENTILE = 95
+DEFAULT_MAX_HEDGE_RATIO = 0.1
+# Latencies needed before any hedge is sent, and how many recent ones set the threshold
+MIN_SAMPLES = 20
+LATENCY_WINDOW = 500
+
+
+class Hedger:
+    """
+    Hedged requests for calls whose latency has a long tail.
+
+    A call that hasn't finished after the ``percentile`` latency of recent
+    calls gets a duplicate; whichever finishes first (successfully) wins and
+    the other is cancelled. Duplicates are capped at ``max_ratio`` of all
+    calls, so the extra load stays bounded even when the backend slows down
+    as a whole.
+    """
+
+    def __init__(self, percentile: float = DEFAULT_PERCENTILE, max_ratio: float = DEFAULT_MAX_HEDGE_RATIO, min_samples: int = MIN_SAMPLES, window: int = LATENCY_WINDOW):
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.min_samples = min_samples
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def threshold(self) -> Optional[float]:
+        """Nearest-rank percentile of recent latencies, or None until there are enough samples."""
+        if len(self.latencies) < self.min_samples:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(self.percentile / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def hedge_allowed(self) -> bool:
+        return self.hedges < self.max_ratio * self.requests
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        self.requests += 1
+        delay = self.threshold()
+        started = time.perf_counter()
+        tasks = [asyncio.ensure_future(call())]
+
+        try:
+            if delay is not None and self.hedge_allowed():
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                # Re-check after the wait: concurrent slow calls all passed the check above
+                if not done and self.hedge_allowed():
+                    self.hedges += 1
+                    tasks.append(asyncio.ensure_future(call()))
+            winner = await self.first_success(tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        if winner is not tasks[0]:
+            self.hedge_wins += 1
+        self.latencies.append(time.perf_counter() - started)
+        return winner.result()
+
+    @staticmethod
+    async def first_success(tasks: List[asyncio.Future]) -> asyncio.Future:
+        """The first task to finish without an error, preferring the original; the original if all fail."""
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task in done and task.exception() is None:
+                    return task
+        return tasks[0]
+
+    def stats(self) -> dict:
+        threshold = self.threshold()
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_rate": self.hedges / self.requests if self.requests else 0.0,
+            "hedge_wins": self.hedge_wins,
+            "hedge_win_rate": self.hedge_wins / self.hedges if self.hedges else 0.0,
+            "threshold_seconds": threshold,
+        }
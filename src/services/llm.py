@@ -1,20 +1,142 @@
+import asyncio
 import os
+import threading
+import time
 from google import genai
+from google.genai import errors, types
 from pydantic import BaseModel
 from typing import Optional, Any
+from src.models.abstract.ParticipantBackend import ParticipantBackend
 from src.models.enum.Difficulty import Difficulty
+from src.models.enum.Phase import Phase
+from src.models.PhaseResponse import response_model_for
+from src.services.response_cache import ResponseCache, cache_key
+from src.services.hedging import Hedger
+from src.services.rate_limit import RateLimitUsage, RateLimiter
+from src.services.single_flight import SingleFlight
+from src.services.tokens import estimate_tokens
+from src import prompts
 
-class LLM(BaseModel):
+# Process-wide genai clients keyed by (model, api_key) so every LLM instance
+# reuses the same connection pool and auth state
+_shared_clients: dict[tuple[str, str], genai.Client] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(model: str, api_key: str) -> genai.Client:
+    """Return the shared genai client for this model and API key, creating it on first use."""
+    key = (model, api_key)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = genai.Client(api_key=api_key)
+            _shared_clients[key] = client
+        return client
+
+
+# Cached-content registrations of prompts.STATIC_PREFIX, keyed like the clients.
+# Each entry is a task resolving to the cache name, or None if registration failed,
+# and the monotonic time after which it is registered again.
+_prefix_caches: dict[tuple[str, str], asyncio.Task] = {}
+_prefix_cache_renew_at: dict[tuple[str, str], float] = {}
+
+PREFIX_CACHE_TTL_SECONDS = 3600
+# Registrations are renewed this long before their TTL runs out, so no call references an expired cache
+PREFIX_CACHE_RENEW_MARGIN_SECONDS = 300
+
+# Smallest content each model accepts for context caching (Gemini API docs), in tokens
+MIN_CACHED_TOKENS = {
+    "gemini-2.5-flash": 1024,
+    "gemini-2.5-pro": 2048,
+}
+
+
+def prefix_cacheable(model: str) -> bool:
+    """Whether prompts.STATIC_PREFIX is (by estimate) long enough for this model to cache."""
+    return estimate_tokens(prompts.STATIC_PREFIX) >= MIN_CACHED_TOKENS.get(model, 0)
+
+
+# Request rate and concurrency limits keyed by model, shared by every LLM instance
+# calling that model so the provider's per-model quota is respected process-wide
+_rate_limiters: dict[str, RateLimiter] = {}
+
+
+def get_rate_limiter(model: str, **settings) -> RateLimiter:
+    """
+    Return the shared limiter for this model, applying ``settings`` to it if given.
+
+    The limit belongs to the model's quota, not to one evaluation, so
+    concurrent evaluations share it and the most recent settings win.
+    """
+    with _shared_clients_lock:
+        limiter = _rate_limiters.get(model)
+        if limiter is None:
+            limiter = RateLimiter(**settings)
+            _rate_limiters[model] = limiter
+        elif settings:
+            limiter.configure(**settings)
+        return limiter
+
+
+def clear_shared_clients():
+    """Forget all shared clients, prefix caches and rate limiters (e.g. after rotating the API key)."""
+    with _shared_clients_lock:
+        _shared_clients.clear()
+        _prefix_caches.clear()
+        _prefix_cache_renew_at.clear()
+        _rate_limiters.clear()
+
+
+async def register_prefix_cache(client: genai.Client, model: str) -> Optional[str]:
+    """Register the static prompt prefix as cached content; returns the cache name or None on failure."""
+    if not prefix_cacheable(model):
+        print(f"[LLM] Prompt prefix (~{estimate_tokens(prompts.STATIC_PREFIX)} tokens) is below {model}'s "
+              f"{MIN_CACHED_TOKENS[model]}-token caching minimum; sending full prompts")
+        return None
+    try:
+        cache = await client.aio.caches.create(
+            model=model,
+            config=types.CreateCachedContentConfig(
+                contents=[prompts.STATIC_PREFIX],
+                ttl=f"{PREFIX_CACHE_TTL_SECONDS}s",
+                display_name="werewolf-static-prefix",
+            )
+        )
+        return cache.name
+    except Exception as e:
+        # e.g. the prefix is below the model's minimum cacheable size; send full prompts instead
+        print(f"[LLM] Could not cache prompt prefix for {model}: {e}")
+        return None
+
+
+def is_missing_cache(error: BaseException) -> bool:
+    """Whether Gemini rejected a call because the cached content it references expired or was deleted."""
+    return isinstance(error, errors.ClientError) and error.code in (400, 403, 404) and "cache" in str(error).lower()
+
+
+class LLM(BaseModel, ParticipantBackend):
     model_config = {"arbitrary_types_allowed": True}
 
     model: str = "gemini-2.0-flash"
     difficulty: Difficulty = Difficulty.HARD
+    cache_prefix: bool = False
+    structured_output: bool = True
+    seed: Optional[int] = None
+    response_cache: Optional[ResponseCache] = None  # replays identical calls instead of paying for them again
+    single_flight: Optional[SingleFlight] = None  # shares one request between concurrent identical calls
+    rate_limiter: Optional[RateLimiter] = None  # shared per model, see get_rate_limiter; set on creation if not given
+    rate_usage: Optional[RateLimitUsage] = None  # this evaluation's share of the limiter's traffic
+    hedger: Optional[Hedger] = None  # duplicates upstream requests stuck in the latency tail
     _client: Optional[Any] = None
+    _api_key: Optional[str] = None
 
     def __init__(self, difficulty: Difficulty = Difficulty.HARD, **data):
         super().__init__(**data)
         self.difficulty = difficulty
         self.model = difficulty.get_model()
+        if self.rate_limiter is None:
+            # Every call to the model counts against its shared quota, whoever makes it
+            self.rate_limiter = get_rate_limiter(self.model)
 
     @property
     def client(self) -> genai.Client:
@@ -22,14 +144,105 @@ class LLM(BaseModel):
             api_key = os.getenv("GEMINI_API_KEY")
             if not api_key:
                 raise ValueError("GEMINI_API_KEY environment variable not set")
-            self._client = genai.Client(api_key=api_key)
+            self._api_key = api_key
+            self._client = get_shared_client(self.model, api_key)
         return self._client
 
-    def execute_prompt(self, prompt: str) -> str:
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=prompt
-        )
+    async def execute_prompt_async(self, prompt: str, phase: Optional[Phase] = None) -> str:
+        """
+        Send a prompt to the model without blocking the event loop.
+
+        With structured_output, a known phase's reply is constrained to that
+        phase's response schema, so it parses as JSON without any cleanup.
+        With a response_cache, a call already made with the same model, seed,
+        schema and prompt is answered from the cache; with single_flight, such
+        calls made concurrently share one upstream request.
+        """
+        schema = response_model_for(phase) if self.structured_output else None
+        key = cache_key(self.model, prompt, self.seed, schema.__name__ if schema is not None else "")
+        cached = await self.response_cache.get_async(key) if self.response_cache is not None else None
+        if cached is not None:
+            return cached
+
+        if self.single_flight is not None:
+            return await self.single_flight.run(key, lambda: self.generate(prompt, schema, key))
+        return await self.generate(prompt, schema, key)
+
+    async def generate(self, prompt: str, schema: Optional[type[BaseModel]], key: str) -> str:
+        prefix, _ = prompts.split_prefix(prompt)
+        cache_name = await self.get_prefix_cache() if self.cache_prefix and prefix else None
+
+        try:
+            response = await self.request(prompt, schema, cache_name)
+        except errors.ClientError as e:
+            if cache_name is None or not is_missing_cache(e):
+                raise
+            # The registration is gone early (deleted, or expired across a clock jump): resend in full
+            print(f"[LLM] Cached prompt prefix {cache_name} is no longer available: {e}")
+            self.forget_prefix_cache(cache_name)
+            response = await self.request(prompt, schema, None)
+
+        if response.text is None:
+            # Safety block or no candidates: an empty reply, which the caller re-prompts like any unparseable one
+            print(f"[LLM] {self.model} returned no text")
+            return ""
+        if self.response_cache is not None:
+            # The disk write happens on the cache's own thread, not on the event loop
+            self.response_cache.put_nowait(key, response.text)
         return response.text
-        
-        
\ No newline at end of file
+
+    async def request(self, prompt: str, schema: Optional[type[BaseModel]], cache_name: Optional[str]) -> Any:
+        config = {}
+        if self.seed is not None:
+            config["seed"] = self.seed
+        if cache_name is not None:
+            # The cached content already holds the static prefix; send only the rest
+            config["cached_content"] = cache_name
+            _, prompt = prompts.split_prefix(prompt)
+
+        if schema is not None:
+            # Constrained decoding: the reply is a bare JSON object of this phase's shape
+            config["response_mime_type"] = "application/json"
+            config["response_schema"] = schema
+
+        async def send():
+            if config:
+                return await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(**config)
+                )
+            return await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=prompt
+            )
+
+        async def attempt():
+            # Hedge only the upstream call: the limiter's queueing and 429 backoff aren't latency
+            # a duplicate could cut, and while Gemini is throttling a duplicate only adds load
+            if self.hedger is not None and not self.rate_limiter.throttling:
+                return await self.hedger.run(send)
+            return await send()
+
+        # Hedged below single_flight, so the duplicate is a real second request
+        return await self.rate_limiter.call(attempt, self.rate_usage)
+
+    async def get_prefix_cache(self) -> Optional[str]:
+        """Cache name for the static prefix, registered once per model and API key and renewed before it expires."""
+        client = self.client
+        key = (self.model, self._api_key or "")
+        with _shared_clients_lock:
+            task = _prefix_caches.get(key)
+            if task is None or time.monotonic() >= _prefix_cache_renew_at[key]:
+                task = asyncio.ensure_future(register_prefix_cache(client, self.model))
+                _prefix_caches[key] = task
+                _prefix_cache_renew_at[key] = time.monotonic() + PREFIX_CACHE_TTL_SECONDS - PREFIX_CACHE_RENEW_MARGIN_SECONDS
+        return await asyncio.shield(task)
+
+    def forget_prefix_cache(self, cache_name: str):
+        """Drop a registration Gemini no longer has, so the next call registers the prefix again."""
+        key = (self.model, self._api_key or "")
+        with _shared_clients_lock:
+            task = _prefix_caches.get(key)
+            if task is not None and task.done() and not task.cancelled() and task.result() == cache_name:
+                del _prefix_caches[key]
@@ -0,0 +1,185 @@
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_CONCURRENCY = 16
+# Throttled calls are retried this many times, waiting THROTTLE_BACKOFF_SECONDS * 2**attempt in between
+MAX_THROTTLE_RETRIES = 5
+THROTTLE_BACKOFF_SECONDS = 1.0
+
+
+def is_throttled(error: BaseException) -> bool:
+    """Whether a provider error means "slow down" (HTTP 429 / RESOURCE_EXHAUSTED)."""
+    return getattr(error, "code", None) == 429 or getattr(error, "status", None) == "RESOURCE_EXHAUSTED"
+
+
+class TokenBucket:
+    """
+    Requests-per-second limit with bursts of up to ``burst`` requests.
+
+    Callers reserve a token immediately and sleep until it would have been
+    available, so waiters are served in arrival order. A rate of 0 disables
+    the limit.
+    """
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], Awaitable] = asyncio.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+
+    async def acquire(self):
+        if self.rate <= 0:
+            return
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            await self._sleep(-self.tokens / self.rate)
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency window adjusted by AIMD.
+
+    Each successful call grows the window by ``increase / window`` (about
+    ``increase`` per window's worth of calls); each throttled call shrinks it
+    by ``decrease``, never below ``minimum``.
+    """
+
+    def __init__(self, maximum: int, minimum: int = 1, increase: float = 1.0, decrease: float = 0.5):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(maximum)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def window(self) -> int:
+        return max(self.minimum, int(self.limit))
+
+    async def acquire(self):
+        while self.in_flight >= self.window:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass a wake-up we may have received on to the next waiter
+                self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def release(self, throttled: bool = False):
+        self.in_flight -= 1
+        if throttled:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+        else:
+            self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+        self._wake()
+
+    def _wake(self):
+        free = self.window - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+class RateLimitUsage:
+    """One evaluation's share of a shared limiter's traffic."""
+
+    def __init__(self):
+        self.requests = 0
+        self.throttled = 0
+
+    def stats(self) -> dict:
+        return {"requests": self.requests, "throttled": self.throttled}
+
+
+class RateLimiter:
+    """
+    Token bucket plus adaptive concurrency around calls to one model.
+
+    Calls rejected as throttled shrink the concurrency window and are retried
+    with exponential backoff, up to ``max_throttle_retries`` times; other
+    errors are raised unchanged.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int = DEFAULT_BURST,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_throttle_retries: int = MAX_THROTTLE_RETRIES,
+        backoff_seconds: float = THROTTLE_BACKOFF_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable] = asyncio.sleep,
+    ):
+        self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self.concurrency = AdaptiveConcurrency(max_concurrency)
+        self.max_throttle_retries = max_throttle_retries
+        self.backoff_seconds = backoff_seconds
+        self._sleep = sleep
+        self.requests = 0
+        self.throttled = 0
+
+    def configure(self, rate: float = DEFAULT_REQUESTS_PER_SECOND, burst: int = DEFAULT_BURST, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """Apply new limits; calls already in flight finish, and a larger maximum is reached by the usual growth."""
+        self.bucket.rate = rate
+        self.bucket.burst = burst
+        self.bucket.tokens = min(self.bucket.tokens, burst)
+        self.concurrency.maximum = max_concurrency
+        self.concurrency.limit = min(self.concurrency.limit, max_concurrency)
+
+    @property
+    def throttling(self) -> bool:
+        """Whether a recent 429 shrank the concurrency window and it hasn't grown back yet."""
+        return self.concurrency.limit < self.concurrency.maximum
+
+    async def call(self, request: Callable[[], Awaitable[T]], usage: Optional[RateLimitUsage] = None) -> T:
+        """Run ``request`` within the limits; its requests and throttles are also counted in ``usage``, if given."""
+        for attempt in range(self.max_throttle_retries + 1):
+            await self.bucket.acquire()
+            await self.concurrency.acquire()
+            self.requests += 1
+            if usage is not None:
+                usage.requests += 1
+            try:
+                result = await request()
+            except BaseException as e:
+                throttled = is_throttled(e)
+                self.concurrency.release(throttled)
+                self.throttled += throttled
+                if usage is not None:
+                    usage.throttled += throttled
+                if not throttled or attempt == self.max_throttle_retries:
+                    raise
+            else:
+                self.concurrency.release()
+                return result
+            await self._sleep(self.backoff_seconds * 2 ** attempt)
+
+    def stats(self) -> dict:
+        return {
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "concurrency_limit": self.concurrency.window,
+            "peak_in_flight": self.concurrency.peak_in_flight,
+        }
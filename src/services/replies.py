@@ -0,0 +1,67 @@
+import json
+from typing import Any, Dict, Optional
+
+# Longest excerpt of an unparseable reply kept in the error message
+MAX_EXCERPT_CHARS = 200
+
+
+class ReplyParseError(ValueError):
+    """An agent reply that doesn't contain a JSON object."""
+
+    def __init__(self, reason: str, reply: str):
+        excerpt = reply if len(reply) <= MAX_EXCERPT_CHARS else reply[:MAX_EXCERPT_CHARS] + "..."
+        super().__init__(f"{reason}: {excerpt!r}")
+        self.reason = reason
+        self.reply = reply
+
+
+def extract_json_object(reply: Optional[str]) -> Dict[str, Any]:
+    """
+    Return the first balanced top-level JSON object in ``reply``.
+
+    Handles bare JSON, JSON in markdown fences and JSON surrounded by prose in
+    one pass: braces are only counted outside string literals, and a balanced
+    candidate that isn't valid JSON is skipped in favour of the next one.
+    Raises ReplyParseError if there is none, including for an empty or
+    missing reply.
+    """
+    if not isinstance(reply, str) or not reply.strip():
+        raise ReplyParseError("Reply is empty", reply if isinstance(reply, str) else "")
+
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+    found_candidate = False
+
+    for i, char in enumerate(reply):
+        if depth:
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+                continue
+            if char == '"':
+                in_string = True
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+                if not depth:
+                    found_candidate = True
+                    try:
+                        return json.loads(reply[start:i + 1])
+                    except json.JSONDecodeError:
+                        continue
+        elif char == "{":
+            depth = 1
+            start = i
+
+    if found_candidate:
+        raise ReplyParseError("Reply contains braces but no valid JSON object", reply)
+    if depth:
+        raise ReplyParseError("Reply ends inside an unclosed JSON object", reply)
+    raise ReplyParseError("Reply contains no JSON object", reply)
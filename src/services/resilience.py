@@ -0,0 +1,114 @@
+import asyncio
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+import httpx
+from a2a.client.errors import A2AClientHTTPError, A2AClientTimeoutError
+
+from src.a2a.messenger import AgentTaskFailedError
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_SECONDS = 30.0
+
+
+class ParticipantUnavailableError(RuntimeError):
+    """A participant call failed after all retries, or was skipped because its endpoint's circuit is open."""
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether retrying the same game prompt could succeed: timeouts, dropped connections, 5xx replies and failed remote tasks."""
+    if isinstance(error, (TimeoutError, A2AClientTimeoutError, httpx.TransportError, ConnectionError, AgentTaskFailedError)):
+        return True
+    if isinstance(error, A2AClientHTTPError):
+        return error.status_code >= 500 or error.status_code in (408, 429)
+    # google.genai API errors; 429s are already retried by the LLM rate limiter
+    code = getattr(error, "code", None)
+    return isinstance(code, int) and code >= 500
+
+
+def backoff_delay(attempt: int, base: float, cap: float, rng: random.Random = random) -> float:
+    """Full-jitter exponential backoff: uniform between 0 and min(cap, base * 2**attempt)."""
+    return rng.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """
+    Fails fast for an endpoint that keeps failing.
+
+    After ``failure_threshold`` consecutive transient failures the circuit
+    opens and calls are refused for ``reset_seconds``. Then one trial call is
+    let through (half-open): success closes the circuit, failure opens it
+    again.
+    """
+
+    def __init__(self, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, reset_seconds: float = DEFAULT_RESET_SECONDS, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.trial_in_flight = False
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if self._clock() - self.opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self.trial_in_flight:
+            self.trial_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+
+    def record_failure(self):
+        self.failures += 1
+        if self.trial_in_flight or self.failures >= self.failure_threshold:
+            self.opened_at = self._clock()
+        self.trial_in_flight = False
+
+    def release_trial(self):
+        """Give up a call that ended without an outcome (e.g. cancelled), so a half-open circuit can try again."""
+        self.trial_in_flight = False
+
+
+# Breakers keyed by participant endpoint URL, shared by every game in the process
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(endpoint: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD, reset_seconds: float = DEFAULT_RESET_SECONDS) -> CircuitBreaker:
+    """Return the shared breaker for this endpoint, updated to the given settings."""
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(failure_threshold, reset_seconds)
+            _breakers[endpoint] = breaker
+        breaker.failure_threshold = failure_threshold
+        breaker.reset_seconds = reset_seconds
+        return breaker
+
+
+def clear_circuit_breakers():
+    with _breakers_lock:
+        _breakers.clear()
+
+
+async def sleep_before_retry(attempt: int, base: float, cap: float):
+    delay = backoff_delay(attempt, base, cap)
+    if delay > 0:
+        await asyncio.sleep(delay)
@@ -0,0 +1,222 @@
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Optional
+
+DEFAULT_MEMORY_ENTRIES = 1024
+DEFAULT_MAX_DISK_BYTES = 256 * 1024 * 1024
+# Rows removed per eviction query once the disk store is over its size bound
+EVICTION_BATCH = 64
+# Memory hits whose last_used is written back to disk in one batch
+TOUCH_BATCH = 64
+# Counters that stats(since=...) reports as deltas
+COUNTERS = ("memory_hits", "disk_hits", "misses", "writes", "evictions")
+
+
+def cache_key(model: str, prompt: str, seed: Optional[int] = None, variant: str = "") -> str:
+    """Content address of one model call: model, seed, reply variant (e.g. response schema) and prompt hash."""
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return f"{model}|{seed}|{variant}|{prompt_hash}"
+
+
+class ResponseCache:
+    """
+    Two-tier cache of model replies.
+
+    A small in-memory LRU sits in front of a SQLite file that keeps replies
+    across runs. The file is bounded to ``max_bytes`` of reply text; the
+    least recently used rows are evicted first. Safe to share between the
+    LLM instances (and threads) of one process. On the event loop use
+    ``get_async`` and ``put_nowait``, which leave all SQLite work to the
+    cache's own disk thread. Memory hits refresh the disk row's recency in
+    batches, so replies served from memory aren't the first evicted.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._clock = clock
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._touched: dict[str, float] = {}  # memory hits not yet written to last_used
+        self._lock = threading.Lock()
+        # One thread for disk reads and writes keeps them off the event loop and in order
+        self._disk = ThreadPoolExecutor(max_workers=1, thread_name_prefix="response-cache")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self.disk_bytes = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._memory_get(key)
+        return value if value is not None else self._disk_get(key)
+
+    async def get_async(self, key: str) -> Optional[str]:
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+        return await asyncio.wrap_future(self._disk.submit(self._disk_get, key))
+
+    def put(self, key: str, value: str):
+        if self._fits(value):
+            self._remember_locked(key, value)
+            self._disk_put(key, value)
+
+    def put_nowait(self, key: str, value: str) -> Optional[Future]:
+        """Update the memory tier now and queue the disk write; returns the write's future."""
+        if not self._fits(value):
+            return None
+        self._remember_locked(key, value)
+        return self._disk.submit(self._disk_put, key, value)
+
+    def resize(self, max_bytes: int) -> Optional[Future]:
+        """Change the size bound; if the store is now over it, eviction is queued on the disk thread."""
+        self.max_bytes = max_bytes
+        if self.disk_bytes <= max_bytes:
+            return None
+        return self._disk.submit(self._evict_locked)
+
+    def _fits(self, value: str) -> bool:
+        return len(value.encode("utf-8")) <= self.max_bytes
+
+    def _memory_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                self._touched[key] = self._clock()
+                if len(self._touched) == TOUCH_BATCH:
+                    self._disk.submit(self._write_touches_locked)
+            return value
+
+    def _disk_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._db.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+
+            self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (self._clock(), key))
+            self.disk_hits += 1
+            self._remember(key, row[0])
+            return row[0]
+
+    def _disk_put(self, key: str, value: str):
+        size = len(value.encode("utf-8"))
+        with self._lock:
+            previous = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+                (key, value, size, self._clock())
+            )
+            self.disk_bytes += size - (previous[0] if previous else 0)
+            self.writes += 1
+            self._evict()
+
+    def _remember_locked(self, key: str, value: str):
+        with self._lock:
+            self._remember(key, value)
+
+    def _remember(self, key: str, value: str):
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _write_touches_locked(self):
+        with self._lock:
+            self._write_touches()
+
+    def _write_touches(self):
+        if self._touched:
+            self._db.executemany(
+                "UPDATE responses SET last_used = MAX(last_used, ?) WHERE key = ?",
+                [(used, key) for key, used in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _evict_locked(self):
+        with self._lock:
+            self._evict()
+
+    def _evict(self):
+        if self.disk_bytes > self.max_bytes:
+            # Recency from memory hits must be on disk before choosing what to evict
+            self._write_touches()
+        while self.disk_bytes > self.max_bytes:
+            rows = self._db.execute(
+                "SELECT key, size FROM responses ORDER BY last_used LIMIT ?", (EVICTION_BATCH,)
+            ).fetchall()
+            for key, size in rows:
+                if self.disk_bytes <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._memory.pop(key, None)
+                self.disk_bytes -= size
+                self.evictions += 1
+
+    def close(self):
+        """Finish queued disk writes and close the file."""
+        self._disk.shutdown(wait=True)
+        with self._lock:
+            self._write_touches()
+            self._db.close()
+
+    def stats(self, since: Optional[dict] = None) -> dict:
+        """Counters and hit rate, or, given an earlier result as ``since``, only the lookups and writes made after it."""
+        counts = {name: getattr(self, name) - (since or {}).get(name, 0) for name in COUNTERS}
+        lookups = counts["memory_hits"] + counts["disk_hits"] + counts["misses"]
+        return {
+            **counts,
+            "disk_bytes": self.disk_bytes,
+            "hit_rate": (counts["memory_hits"] + counts["disk_hits"]) / lookups if lookups else 0.0,
+        }
+
+
+# One cache per file, shared by every LLM in the process
+_shared_caches: dict[Path, ResponseCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_shared_response_cache(directory: str | Path, max_bytes: int = DEFAULT_MAX_DISK_BYTES) -> ResponseCache:
+    """Return the process-wide cache stored in ``directory``, opening it on first use; ``max_bytes`` always applies."""
+    path = (Path(directory) / "responses.sqlite3").resolve()
+    with _shared_caches_lock:
+        cache = _shared_caches.get(path)
+        if cache is None:
+            cache = ResponseCache(path, max_bytes=max_bytes)
+            _shared_caches[path] = cache
+        elif cache.max_bytes != max_bytes:
+            cache.resize(max_bytes)
+        return cache
+
+
+def close_shared_response_caches():
+    with _shared_caches_lock:
+        for cache in _shared_caches.values():
+            cache.close()
+        _shared_caches.clear()
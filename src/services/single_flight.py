@@ -0,0 +1,48 @@
+import asyncio
+from typing import Awaitable, Callable, Dict
+
+# Calls in flight for every process-wide SingleFlight, so separate evaluations can share them
+_shared_in_flight: Dict[str, asyncio.Future] = {}
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls.
+
+    The first caller for a key starts the call; callers arriving with the
+    same key while it is in flight wait for that call's result (or
+    exception) instead of making their own. A caller that is cancelled
+    doesn't cancel the call for the others.
+
+    A ``process_wide`` instance joins calls started through any other
+    process-wide instance, but counts only the requests made through itself.
+    """
+
+    def __init__(self, process_wide: bool = False):
+        self._in_flight: Dict[str, asyncio.Future] = _shared_in_flight if process_wide else {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, call: Callable[[], Awaitable[str]]) -> str:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Future):
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def stats(self) -> dict:
+        requests = self.calls + self.coalesced
+        return {
+            "requests": requests,
+            "upstream_calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalesced_rate": self.coalesced / requests if requests else 0.0,
+        }
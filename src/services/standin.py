@@ -0,0 +1,218 @@
+import asyncio
+import hashlib
+import json
+import random
+import re
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from google.genai import errors
+
+from src.models.abstract.ParticipantBackend import ParticipantBackend
+from src.models.enum.Phase import Phase
+from src.models.enum.Role import Role
+from src.services.hedging import Hedger
+
+
+# TASK line at the end of every phase prompt -> phase it belongs to
+TASK_PHASES = {
+    "BID": Phase.BIDDING,
+    "DEBATE": Phase.DISCUSSION,
+    "VOTE": Phase.VOTE,
+    "WEREWOLF": Phase.NIGHT,
+    "SEER": Phase.NIGHT,
+    "DOCTOR": Phase.NIGHT,
+}
+TASK_PATTERN = re.compile(r"^TASK: (\w+)\s*$", re.MULTILINE)
+
+
+class PrefixCacheProbe:
+    """
+    Local model of a provider's prompt prefix cache.
+
+    Prompts are hashed at every ``block``-character boundary. A prompt's cached
+    length is its longest block-aligned prefix already seen in an earlier
+    prompt, which is how much a prefix-caching provider could skip. At most
+    ``max_entries`` prefix hashes are remembered (least recently used first out).
+    """
+
+    def __init__(self, block: int = 256, max_entries: int = 100_000):
+        self.block = block
+        self.max_entries = max_entries
+        self._seen: OrderedDict[bytes, None] = OrderedDict()
+        self.prompts = 0
+        self.prompt_chars = 0
+        self.cached_chars = 0
+
+    def observe(self, prompt: str) -> int:
+        """Record a prompt and return how many of its characters were a cached prefix."""
+        digest = hashlib.sha1()
+        cached = 0
+        reusing = True
+        for end in range(self.block, len(prompt) + 1, self.block):
+            digest.update(prompt[end - self.block:end].encode())
+            key = digest.copy().digest()
+            if reusing and key in self._seen:
+                cached = end
+                self._seen.move_to_end(key)
+                continue
+            reusing = False
+            self._seen[key] = None
+            if len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+
+        self.prompts += 1
+        self.prompt_chars += len(prompt)
+        self.cached_chars += cached
+        return cached
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "prompts": self.prompts,
+            "prompt_chars": self.prompt_chars,
+            "cached_chars": self.cached_chars,
+            "hit_rate": self.cached_chars / self.prompt_chars if self.prompt_chars else 0.0,
+        }
+
+
+class ThrottlingEndpoint:
+    """
+    Local stand-in for Gemini's async generate_content that throttles deterministically.
+
+    A call made while ``capacity`` others are in flight fails straight away
+    with the same 429 error the real API returns; the rest answer ``reply``
+    after ``latency`` seconds. Plug it in as ``client.aio.models`` to exercise
+    rate limiting offline.
+    """
+
+    def __init__(self, capacity: int, latency: float = 0.01, reply: str = '{"message": "ok"}'):
+        self.capacity = capacity
+        self.latency = latency
+        self.reply = reply
+        self.in_flight = 0
+        self.calls = 0
+        self.throttled = 0
+
+    async def generate_content(self, **kwargs) -> Any:
+        self.calls += 1
+        if self.in_flight >= self.capacity:
+            self.throttled += 1
+            raise errors.ClientError(429, {"error": {"code": 429, "message": "Resource exhausted", "status": "RESOURCE_EXHAUSTED"}})
+
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.latency)
+            return SimpleNamespace(text=self.reply)
+        finally:
+            self.in_flight -= 1
+
+
+class StandInBackend(ParticipantBackend):
+    """
+    Offline stand-in for the Gemini backend.
+
+    Plays from the bound participant's view of the game: random bids, werewolves
+    never target each other, the seer investigates players it hasn't checked yet
+    and votes for any werewolf it has found. Players are named by their per-game
+    alias, as a real agent reading the prompts would. If a ``prefix_cache`` probe
+    is given, every prompt is passed through it to measure prefix reuse. Every reply is delayed by
+    ``latency`` plus up to ``jitter`` seconds so orchestrator throughput can be
+    measured end to end without network access. With a ``hedger``, a slow reply's
+    delay is raced against a duplicate's; delays come from their own random
+    stream, so hedging never changes a seeded player's moves.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: Optional[int] = None, prefix_cache: Optional[PrefixCacheProbe] = None, hedger: Optional[Hedger] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.delays = random.Random(seed)
+        self.hedger = hedger
+        self.participant: Any = None  # Participant at runtime
+        self.calls = 0
+        self.prefix_cache = prefix_cache
+
+    def bind(self, participant: Any):
+        self.participant = participant
+
+    async def execute_prompt_async(self, prompt: str, phase: Optional[Phase] = None) -> str:
+        self.calls += 1
+        if self.prefix_cache is not None:
+            self.prefix_cache.observe(prompt)
+
+        if self.hedger is not None:
+            await self.hedger.run(self.wait)
+        else:
+            await self.wait()
+
+        if phase is None:
+            phase = self.guess_phase(prompt)
+
+        return json.dumps(self.decide(phase))
+
+    async def wait(self):
+        """The simulated network and model time of one request."""
+        delay = self.latency + (self.delays.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def guess_phase(self, prompt: str) -> Phase:
+        """Phase detection for callers that don't pass one, from the prompt's last TASK line."""
+        tasks = TASK_PATTERN.findall(prompt)
+        return TASK_PHASES.get(tasks[-1], Phase.VOTE) if tasks else Phase.VOTE
+
+    def decide(self, phase: Phase) -> dict:
+        if phase == Phase.BIDDING:
+            return {"bid_amount": self.random.randint(0, 100), "reason": "Stand-in bid"}
+
+        if phase == Phase.DISCUSSION:
+            target = self.pick_suspect()
+            message = f"I have doubts about {self.alias(target)}." if target else "I have nothing to add."
+            return {"message": message}
+
+        if phase == Phase.NIGHT:
+            role = self.participant.role
+            if role == Role.SEER:
+                return {"player_id": self.alias(self.pick_investigation()), "reason": "Stand-in investigation"}
+            if role == Role.DOCTOR:
+                return {"player_id": self.alias(self.pick(self.other_players())), "reason": "Stand-in save"}
+            return {"player_id": self.alias(self.pick_suspect()), "reason": "Stand-in kill"}
+
+        return {"player_id": self.alias(self.pick_suspect()), "reason": "Stand-in vote"}
+
+    def alias(self, participant_id: str) -> str:
+        return self.participant.game_data.alias_for(participant_id) if participant_id else participant_id
+
+    # Target selection
+    def other_players(self) -> List[str]:
+        if self.participant is None:
+            raise RuntimeError("StandInBackend must be bound to a participant before it can choose targets")
+
+        game_data = self.participant.game_data
+        alive = game_data.participants.get(game_data.current_round, [])
+        return [p.id for p in alive if p.id != self.participant.id]
+
+    def pick(self, candidates: List[str]) -> str:
+        return self.random.choice(candidates) if candidates else ""
+
+    def pick_suspect(self) -> str:
+        """Werewolves target non-werewolves; the seer targets a werewolf it has found."""
+        candidates = self.other_players()
+        game_data = self.participant.game_data
+
+        if self.participant.role == Role.WEREWOLF:
+            alive = game_data.participants.get(game_data.current_round, [])
+            werewolves = {p.id for p in alive if p.role == Role.WEREWOLF}
+            candidates = [pid for pid in candidates if pid not in werewolves] or candidates
+        elif self.participant.role == Role.SEER:
+            found = [pid for pid, is_werewolf in game_data.seer_checks if is_werewolf and pid in candidates]
+            if found:
+                return found[0]
+
+        return self.pick(candidates)
+
+    def pick_investigation(self) -> str:
+        checked = {pid for pid, _ in self.participant.game_data.seer_checks}
+        candidates = self.other_players()
+        return self.pick([pid for pid in candidates if pid not in checked] or candidates)
@@ -0,0 +1,6 @@
+# Rough characters-per-token ratio used for cheap budget checks and reports
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
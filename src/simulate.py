@@ -0,0 +1,162 @@
+"""
+Headless batch simulator.
+
+Plays N games directly through GreenAgent.run_single_game, without the A2A
+server, and reports throughput and latency. Used to size capacity and to
+catch orchestrator performance regressions.
+
+    python -m src.simulate --games 50 --concurrency 8 --seed 1 --output results/sim.jsonl
+"""
+import argparse
+import asyncio
+import json
+import math
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.a2a.agent import GreenAgent, ROLES_TO_EVALUATE
+from src.models.EvalConfig import EvalConfig
+from src.models.enum.Backend import Backend
+from src.models.enum.Difficulty import Difficulty
+from src.models.enum.Role import Role
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; returns 0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def role_for_game(index: int, role: Role | None) -> Role:
+    """Use the fixed role if given, otherwise rotate through the evaluated roles."""
+    return role if role is not None else ROLES_TO_EVALUATE[index % len(ROLES_TO_EVALUATE)]
+
+
+async def run_batch(
+    games: int,
+    config: EvalConfig,
+    participant_url: str | None = None,
+    role: Role | None = None,
+    output: Path | None = None,
+) -> Dict[str, Any]:
+    """
+    Play `games` games with at most config.max_concurrent_games in flight.
+
+    Each game's analytics is written to `output` as one JSON line as soon as the
+    game finishes. Returns the batch report.
+    """
+    agent = GreenAgent()
+    semaphore = asyncio.Semaphore(config.max_concurrent_games)
+    durations: List[float] = []
+    winners: Dict[str, int] = {}
+
+    output_file = None
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output_file = open(output, "w", encoding="utf-8")
+
+    async def play(index: int):
+        game_role = role_for_game(index, role)
+        game_config = agent.config_for_game(config, index)
+
+        async with semaphore:
+            started = time.perf_counter()
+            analytics = await agent.run_single_game(participant_url, game_role, game_config, updater=None, label=f"sim {index + 1}")
+            duration = time.perf_counter() - started
+
+        durations.append(duration)
+        winners[analytics["winner"]] = winners.get(analytics["winner"], 0) + 1
+
+        if output_file is not None:
+            record = {
+                "game": index + 1,
+                "seed": game_config.seed,
+                "role": game_role.name,
+                "duration_seconds": duration,
+                **analytics,
+            }
+            output_file.write(json.dumps(record, default=str) + "\n")
+            output_file.flush()
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(play(index) for index in range(games)))
+    finally:
+        if output_file is not None:
+            output_file.close()
+    wall_seconds = time.perf_counter() - started
+
+    report = {
+        "games": games,
+        "concurrency": config.max_concurrent_games,
+        "wall_seconds": wall_seconds,
+        "games_per_second": games / wall_seconds if wall_seconds else 0.0,
+        "p50_game_seconds": percentile(durations, 50),
+        "p95_game_seconds": percentile(durations, 95),
+        "winners": winners,
+    }
+    if config.backend == Backend.STAND_IN:
+        report["prompt_prefix_cache"] = agent.prefix_cache.stats()
+    elif config.coalesce_llm_calls:
+        report["llm_coalescing"] = agent.single_flight.stats()
+    if agent.hedger is not None:
+        report["hedging"] = agent.hedger.stats()
+    return report
+
+
+def render_report(report: Dict[str, Any]) -> str:
+    lines = [
+        f"Games: {report['games']} (concurrency {report['concurrency']})",
+        f"Wall time: {report['wall_seconds']:.2f}s",
+        f"Throughput: {report['games_per_second']:.2f} games/s",
+        f"Game latency p50: {report['p50_game_seconds']:.3f}s | p95: {report['p95_game_seconds']:.3f}s",
+        f"Winners: {report['winners']}",
+    ]
+    if "prompt_prefix_cache" in report:
+        lines.append(f"Prompt prefix reuse: {report['prompt_prefix_cache']['hit_rate']:.1%} of prompt characters")
+    if "llm_coalescing" in report:
+        lines.append(f"Coalesced LLM calls: {report['llm_coalescing']['coalesced_rate']:.1%} of requests")
+    if "hedging" in report:
+        hedging = report["hedging"]
+        lines.append(f"Hedged calls: {hedging['hedge_rate']:.1%} of requests, {hedging['hedge_win_rate']:.1%} of hedges won")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play Werewolf games headlessly and report throughput.")
+    parser.add_argument("--games", type=int, default=10, help="Number of games to play")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum games in flight")
+    parser.add_argument("--difficulty", type=str, choices=[d.value for d in Difficulty], default=Difficulty.HARD.value)
+    parser.add_argument("--backend", type=str, choices=[b.value for b in Backend], default=Backend.STAND_IN.value, help="Backend for simulated players")
+    parser.add_argument("--seed", type=int, help="Base seed; game i uses seed + i")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stand-in reply latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Stand-in reply jitter in seconds")
+    parser.add_argument("--role", type=str, choices=[r.name.lower() for r in ROLES_TO_EVALUATE], help="Role of the evaluated seat (default: rotate)")
+    parser.add_argument("--participant-url", type=str, help="Evaluated agent URL (default: simulate that seat too)")
+    parser.add_argument("--coalesce", action="store_true", help="Share one Gemini request between concurrent identical prompts")
+    parser.add_argument("--hedge", action="store_true", help="Send a duplicate request for simulated-player calls in the latency tail")
+    parser.add_argument("--output", type=Path, help="Write per-game analytics to this JSONL file")
+    args = parser.parse_args()
+
+    config = EvalConfig(
+        difficulty=Difficulty(args.difficulty),
+        backend=Backend(args.backend),
+        max_concurrent_games=args.concurrency,
+        seed=args.seed,
+        stand_in_latency_seconds=args.latency,
+        stand_in_jitter_seconds=args.jitter,
+        coalesce_llm_calls=args.coalesce,
+        hedge_simulated_calls=args.hedge,
+    )
+    role = Role[args.role.upper()] if args.role else None
+
+    report = asyncio.run(run_batch(args.games, config, args.participant_url, role, args.output))
+    print(render_report(report))
+
+
+if __name__ == '__main__':
+    main()
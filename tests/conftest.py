@@ -12,9 +12,13 @@ from src.models.Message import Message
 from src.models.Event import Event
 from src.models.Vote import Vote
 from src.models.Bid import Bid
+from src.models.EvalConfig import EvalConfig
 from src.game.Game import Game
 from src.game.GameData import GameData
+from src.a2a.agent import GreenAgent
 from src.a2a.messenger import Messenger
+from src.models.enum.Backend import Backend
+from src.services.standin import StandInBackend
 
 
 @pytest.fixture
@@ -42,6 +46,17 @@ def mock_game_data():
     game_data.events = {}
     game_data.seer_checks = []
     game_data.latest_werewolf_kill = None
+    game_data.config = EvalConfig()
+    game_data.transcripts = {}
+    game_data.get_transcript = Mock(side_effect=lambda round_num: GameData.get_transcript(game_data, round_num))
+    game_data.aliases = {}
+    game_data.truncations = []
+    game_data.invalid_replies = []
+    game_data.call_failures = []
+    game_data.circuit_breakers = {}
+    game_data.alias_ids = {}
+    game_data.alias_for = Mock(side_effect=lambda participant_id: GameData.alias_for(game_data, participant_id))
+    game_data.resolve_player = Mock(side_effect=lambda name: GameData.resolve_player(game_data, name))
     return game_data
 
 
@@ -58,8 +73,10 @@ def create_mock_participant(id: str, role: Role, game_data, messenger, url: str
     participant.llm_state = None
     participant.difficulty = difficulty
 
-    # Mock the async talk_to_agent method
+    # Mock the async talk_to_agent method; ask() validates its replies for real
     participant.talk_to_agent = AsyncMock()
+    participant.alias = Mock(side_effect=lambda participant_id: Participant.alias(participant, participant_id))
+    participant.ask = Mock(side_effect=lambda *args, **kwargs: Participant.ask(participant, *args, **kwargs))
 
     # Mock prompt methods
     participant.get_bid_prompt = Mock(return_value="bid prompt")
@@ -151,6 +168,30 @@ def mock_game(sample_participants, mock_messenger, mock_game_data):
     return game
 
 
+@pytest.fixture
+def create_game():
+    """Factory for a real game set up by GreenAgent.init_game.
+
+    Config fields are passed through to EvalConfig. With ``stand_in_seed`` every
+    player, including the evaluated one, is a stand-in seeded per seat.
+    """
+    def create(participant_role: Role = Role.VILLAGER, url: str = "http://localhost:8001", messenger: Messenger = None,
+               stand_in_seed: int = None, **config_fields) -> Game:
+        if stand_in_seed is not None:
+            config_fields.setdefault("backend", Backend.STAND_IN)
+        game = Game([], messenger=messenger, config=EvalConfig(**config_fields))
+        GreenAgent().init_game(game, url, participant_role, Difficulty.HARD)
+
+        if stand_in_seed is not None:
+            for index, participant in enumerate(game.state.participants[1]):
+                if not participant.use_llm:
+                    participant.use_llm = True
+                    participant.llm = StandInBackend(seed=stand_in_seed + index)
+                    participant.llm.bind(participant)
+        return game
+    return create
+
+
 @pytest.fixture
 def werewolf_elimination_response():
     """Sample parsed response for werewolf elimination."""
@@ -0,0 +1,102 @@
+import pytest
+
+from src.game.AgentState import AgentState
+from src.game.Game import Game
+from src.models.Elimination import Elimination
+from src.models.Message import Message
+from src.models.Vote import Vote
+from src.models.enum.EliminationType import EliminationType
+
+
+def play_scripted_round(game: Game, message: str = "I suspect someone."):
+    """Fill the current round with one message and one vote per player, and a night kill."""
+    state = game.state
+    round_num = state.current_round
+    alive = state.participants[round_num]
+    state.chat_history[round_num] = [Message(sender_id=p.id, content=message) for p in alive]
+    state.votes[round_num] = [Vote(voter_id=p.id, voted_for_id=alive[0].id, rationale="quiet") for p in alive]
+    state.eliminations[round_num] = [Elimination(eliminated_participant=alive[-1].id, elimination_type=EliminationType.NIGHT_KILL)]
+
+
+class TestAgentState:
+    """Test suite for per-participant rolling memory."""
+
+    def test_init_game_gives_everyone_memory(self, create_game):
+        """Test that every participant gets its own AgentState."""
+        # Execute
+        game = create_game()
+
+        # Verify
+        states = [p.llm_state for p in game.state.participants[1]]
+        assert all(isinstance(s, AgentState) for s in states)
+        assert len({id(s) for s in states}) == len(states)
+
+    def test_round_summary_uses_aliases(self, create_game):
+        """Test that a recorded round names players by alias and covers night, chat and votes."""
+        # Setup
+        game = create_game()
+        state = game.state
+        play_scripted_round(game)
+        participant = state.participants[1][1]
+
+        # Execute
+        participant.llm_state.record_round(1)
+
+        # Verify
+        memory = participant.llm_state.get_memory_prompt()
+        victim = state.participants[1][-1]
+        assert memory.startswith("Round 1:")
+        assert f"{state.alias_for(victim.id)} killed at night." in memory
+        assert "I suspect someone." in memory
+        assert not any(p.id in memory for p in state.participants[1])
+        assert participant.llm_state.suspects[0].suspect_agent_id == state.participants[1][0].id
+
+    def test_rounds_recorded_once(self, create_game):
+        """Test that recording the same round twice doesn't duplicate it."""
+        # Setup
+        game = create_game()
+        play_scripted_round(game)
+        memory = game.state.participants[1][0].llm_state
+
+        # Execute
+        memory.record_round(1)
+        memory.record_round(1)
+
+        # Verify
+        assert len(memory.notes) == 1
+
+    def test_memory_is_capped(self, create_game):
+        """Test that memory keeps only the latest rounds within its size limits."""
+        # Setup
+        game = create_game()
+        state = game.state
+        memory = state.participants[1][0].llm_state
+        memory.max_rounds = 3
+
+        # Execute
+        for round_num in range(1, 9):
+            state.current_round = round_num
+            state.participants[round_num] = state.participants[1]
+            play_scripted_round(game, message="x" * 500)
+            memory.record_round(round_num)
+
+        # Verify
+        assert len(memory.notes) <= 3
+        assert len(memory.get_memory_prompt()) <= memory.max_chars
+        assert memory.notes[-1].startswith("Round 8:")
+
+    @pytest.mark.asyncio
+    async def test_round_end_updates_memory_and_prompts_include_it(self, create_game):
+        """Test that the round end phase records memory, which later prompts carry."""
+        # Setup
+        game = create_game()
+        play_scripted_round(game)
+
+        # Execute
+        await game.run_round_end_phase()
+
+        # Verify
+        survivor = game.state.participants[game.state.current_round][0]
+        assert survivor.llm_state.last_recorded_round == 1
+        assert "Round 1:" in survivor.get_vote_prompt()
+        assert "Round 1:" in survivor.get_doctor_prompt()
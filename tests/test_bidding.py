@@ -1,9 +1,14 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 
 from src.phases.bidding import Bidding
 from src.models.Bid import Bid
+from src.models.EvalConfig import EvalConfig
+from src.models.Participant import Participant
+from src.models.enum.BiddingMode import BiddingMode
 from src.models.enum.EventType import EventType
+from src.models.enum.Role import Role
 
 
 class TestBiddingPhase:
@@ -182,3 +187,108 @@ class TestBiddingPhase:
 
         # Verify max bid is first in speaking order
         assert mock_game.state.speaking_order[1][0] == "werewolf_1"
+
+
+class TestSealedBidding:
+    """Test suite for sealed (concurrent) bid collection."""
+
+    @pytest.mark.asyncio
+    async def test_sealed_bids_requested_concurrently(self, mock_game, mock_messenger, sample_participants):
+        """Test that sealed mode prompts every participant before any reply arrives."""
+        # Setup
+        bidding = Bidding(mock_game, mock_messenger)
+        mock_game.state.config = EvalConfig(bidding_mode=BiddingMode.SEALED)
+        participants = list(sample_participants.values())
+        in_flight = 0
+        peak = 0
+
+        async def reply(prompt, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"bid_amount": 10, "reason": "r"}
+
+        for participant in participants:
+            participant.talk_to_agent.side_effect = reply
+
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.bids = {}
+
+        # Execute
+        await bidding.collect_round_bids()
+
+        # Verify
+        assert peak == len(participants)
+        for participant in participants:
+            participant.get_bid_prompt.assert_called_once_with(sealed=True)
+
+    @pytest.mark.asyncio
+    async def test_sealed_bids_recorded_in_participant_order(self, mock_game, mock_messenger, sample_participants):
+        """Test that bids and events keep participant order even when replies finish out of order."""
+        # Setup
+        bidding = Bidding(mock_game, mock_messenger)
+        mock_game.state.config = EvalConfig(bidding_mode=BiddingMode.SEALED)
+        participants = list(sample_participants.values())
+
+        for index, participant in enumerate(participants):
+            async def reply(prompt, index=index, **kwargs):
+                # Earlier participants answer last
+                await asyncio.sleep(0.002 * (len(participants) - index))
+                return {"bid_amount": index * 10, "reason": "r"}
+            participant.talk_to_agent.side_effect = reply
+
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.bids = {}
+
+        # Execute
+        await bidding.collect_round_bids()
+
+        # Verify
+        assert [b.participant_id for b in mock_game.state.bids[1]] == [p.id for p in participants]
+        logged_players = [call.args[1].player for call in mock_game.log_event.call_args_list]
+        assert logged_players == [p.id for p in participants]
+
+    @pytest.mark.asyncio
+    async def test_sequential_is_default(self, mock_game, mock_messenger, bid_response, sample_participants):
+        """Test that the default config keeps the sequential, see-earlier-bids mode."""
+        # Setup
+        bidding = Bidding(mock_game, mock_messenger)
+        participants = list(sample_participants.values())
+        for participant in participants:
+            participant.talk_to_agent.return_value = bid_response
+
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.bids = {}
+
+        # Execute
+        await bidding.collect_round_bids()
+
+        # Verify
+        for participant in participants:
+            participant.get_bid_prompt.assert_called_once_with()
+
+    def test_sealed_bid_prompt_hides_other_bids(self, mock_game_data, mock_messenger):
+        """Test that the sealed prompt does not list bids already placed."""
+        # Setup
+        mock_game_data.bids = {1: [Bid(participant_id="other_player", amount=90)]}
+        participant = Participant(
+            id="villager_1",
+            role=Role.VILLAGER,
+            game_data=mock_game_data,
+            use_llm=True,
+            messenger=mock_messenger
+        )
+
+        # Execute
+        open_prompt = participant.get_bid_prompt()
+        sealed_prompt = participant.get_bid_prompt(sealed=True)
+
+        # Verify
+        assert "other_player" in open_prompt
+        assert "other_player" not in sealed_prompt
+        assert "sealed" in sealed_prompt
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from a2a.utils import new_agent_text_message
+
+from src.a2a.agent import GreenAgent, GAMES_PER_ROLE, ROLES_TO_EVALUATE
+from src.game.Game import Game
+from src.models.enum.Difficulty import Difficulty
+from src.models.enum.Role import Role
+
+
+def create_eval_message(config: dict | None = None):
+    """Build an incoming A2A message carrying an EvalRequest."""
+    request = {"participants": {"agent1": "http://localhost:8001"}}
+    if config is not None:
+        request["config"] = config
+    return new_agent_text_message(json.dumps(request))
+
+
+def create_mock_updater():
+    updater = Mock()
+    updater.update_status = AsyncMock()
+    updater.add_artifact = AsyncMock()
+    updater.reject = AsyncMock()
+    return updater
+
+
+class TestConcurrentGames:
+    """Test suite for running evaluation games concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_games_is_respected(self):
+        """Test that no more than max_concurrent_games games are in flight at once."""
+        # Setup
+        agent = GreenAgent()
+        updater = create_mock_updater()
+        in_flight = 0
+        peak = 0
+
+        async def fake_game(participant_url, role, config, updater, label=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"winner": "villagers", "detail": {"participant_role": role.name}}
+
+        agent.run_single_game = fake_game
+
+        # Execute
+        await agent.run(create_eval_message({"max_concurrent_games": 3}), updater)
+
+        # Verify
+        assert peak == 3
+        updater.add_artifact.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_results_grouped_by_role_in_schedule_order(self):
+        """Test that results land under the right role regardless of finish order."""
+        # Setup
+        agent = GreenAgent()
+        updater = create_mock_updater()
+        calls = []
+
+        async def fake_game(participant_url, role, config, updater, label=None):
+            calls.append(label)
+            # Later games finish first
+            await asyncio.sleep(0.001 * (len(ROLES_TO_EVALUATE) * GAMES_PER_ROLE - len(calls)))
+            return {"winner": "werewolf", "detail": {"participant_role": role.name, "label": label}}
+
+        agent.run_single_game = fake_game
+
+        # Execute
+        await agent.run(create_eval_message(), updater)
+
+        # Verify
+        aggregate = updater.add_artifact.call_args.kwargs["parts"][1].root.data
+        assert aggregate["total_games"] == GAMES_PER_ROLE * len(ROLES_TO_EVALUATE)
+        for role in ROLES_TO_EVALUATE:
+            games = aggregate["by_role"][role.name]["games"]
+            labels = [g["detail"]["label"] for g in games]
+            assert labels == [f"{role.name} {n}/{GAMES_PER_ROLE}" for n in range(1, GAMES_PER_ROLE + 1)]
+
+    @pytest.mark.asyncio
+    async def test_failed_game_cancels_remaining_games(self):
+        """Test that a failing game fails the evaluation and cancels the others."""
+        # Setup
+        agent = GreenAgent()
+        updater = create_mock_updater()
+        cancelled = 0
+
+        async def fake_game(participant_url, role, config, updater, label=None):
+            nonlocal cancelled
+            if role == Role.VILLAGER:
+                raise RuntimeError("participant unreachable")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+
+        agent.run_single_game = fake_game
+
+        # Execute
+        with pytest.raises(RuntimeError):
+            await agent.run(create_eval_message({"max_concurrent_games": 8}), updater)
+        await asyncio.sleep(0)
+
+        # Verify
+        assert cancelled > 0
+        updater.add_artifact.assert_not_called()
+
+    def test_init_game_isolates_state_per_game(self):
+        """Test that participants are bound to the game they were created for."""
+        # Setup
+        agent = GreenAgent()
+        game_a = Game([])
+        game_b = Game([])
+
+        # Execute
+        agent.init_game(game_a, "http://localhost:8001", Role.SEER, Difficulty.EASY)
+        agent.init_game(game_b, "http://localhost:8001", Role.SEER, Difficulty.EASY)
+
+        # Verify
+        assert len(game_a.state.participants[1]) == 7
+        assert all(p.game_data is game_a.state for p in game_a.state.participants[1])
+        assert all(p.game_data is game_b.state for p in game_b.state.participants[1])
+        assert agent.get_participant_id_by_url(game_a, "http://localhost:8001") != \
+            agent.get_participant_id_by_url(game_b, "http://localhost:8001")
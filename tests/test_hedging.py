@@ -0,0 +1,170 @@
+import asyncio
+import pytest
+
+from src.a2a.agent import GreenAgent
+from src.models.EvalConfig import EvalConfig
+from src.models.enum.Backend import Backend
+from src.models.enum.Difficulty import Difficulty
+from src.models.enum.Phase import Phase
+from src.services.hedging import Hedger
+from src.services.standin import StandInBackend
+
+
+def create_hedger(max_ratio: float = 1.0) -> Hedger:
+    hedger = Hedger(percentile=90, max_ratio=max_ratio, min_samples=5)
+    hedger.latencies.extend([0.01] * 5)
+    return hedger
+
+
+def create_calls(*delays: float):
+    """A call whose n-th invocation sleeps delays[n] and returns n; records cancelled invocations."""
+    started = []
+    cancelled = []
+
+    async def call():
+        attempt = len(started)
+        started.append(attempt)
+        try:
+            await asyncio.sleep(delays[attempt])
+        except asyncio.CancelledError:
+            cancelled.append(attempt)
+            raise
+        return attempt
+
+    return call, started, cancelled
+
+
+class TestHedger:
+    """Test suite for hedging calls in the latency tail."""
+
+    @pytest.mark.asyncio
+    async def test_slow_call_hedged_and_loser_cancelled(self):
+        """Test that a call past the threshold gets a duplicate, whose reply wins."""
+        # Setup
+        hedger = create_hedger()
+        call, started, cancelled = create_calls(5, 0)
+
+        # Execute
+        result = await hedger.run(call)
+        await asyncio.sleep(0)  # let the loser process its cancellation
+
+        # Verify
+        assert result == 1
+        assert started == [0, 1]
+        assert cancelled == [0]
+        assert hedger.stats()["hedges"] == 1
+        assert hedger.stats()["hedge_win_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_fast_calls_and_unprimed_hedger_not_hedged(self):
+        """Test that no duplicate is sent before enough latencies are known or when the call is fast."""
+        # Setup
+        unprimed = Hedger(min_samples=5)
+        primed = create_hedger()
+        slow, slow_started, _ = create_calls(0.05)
+        fast, fast_started, _ = create_calls(0)
+
+        # Execute
+        await unprimed.run(slow)
+        await primed.run(fast)
+
+        # Verify
+        assert slow_started == [0] and fast_started == [0]
+        assert unprimed.hedges == 0 and primed.hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_hedges_capped_by_ratio(self):
+        """Test that hedges stay within max_ratio of all calls."""
+        # Setup
+        hedger = create_hedger(max_ratio=0.25)
+
+        # Execute
+        for _ in range(8):
+            hedger.latencies.extend([0.01] * 5)  # keep the threshold below the slow attempt
+            call, _, _ = create_calls(0.03, 0)
+            await hedger.run(call)
+
+        # Verify
+        assert hedger.stats()["requests"] == 8
+        assert hedger.stats()["hedges"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_slow_calls_stay_within_cap(self):
+        """Test that slow calls waiting out the threshold together don't all hedge."""
+        # Setup
+        hedger = create_hedger(max_ratio=0.1)
+        for _ in range(100):
+            call, _, _ = create_calls(0)
+            await hedger.run(call)
+        hedger.latencies.clear()
+        hedger.latencies.extend([0.01] * 5)
+
+        # Execute
+        slow_calls = [create_calls(0.05, 0)[0] for _ in range(50)]
+        await asyncio.gather(*(hedger.run(call) for call in slow_calls))
+
+        # Verify
+        assert hedger.stats()["requests"] == 150
+        assert hedger.hedges <= 0.1 * hedger.requests
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_falls_back_to_other(self):
+        """Test that an error from one attempt is only raised if the other fails too."""
+        # Setup
+        hedger = create_hedger()
+        attempts = 0
+
+        async def call():
+            nonlocal attempts
+            attempts += 1
+            if attempts == 1:
+                await asyncio.sleep(0.05)
+                raise TimeoutError()
+            await asyncio.sleep(0.1)
+            return "late reply"
+
+        # Execute / Verify
+        assert await hedger.run(call) == "late reply"
+
+        async def broken():
+            raise TimeoutError()
+
+        with pytest.raises(TimeoutError):
+            await hedger.run(broken)
+
+
+class TestSimulatedPlayerHedging:
+    """Test suite for hedging simulated players' calls."""
+
+    @pytest.mark.asyncio
+    async def test_hedging_keeps_seeded_stand_in_moves(self):
+        """Test that duplicate requests don't consume the stand-in's decision randomness."""
+        # Setup
+        plain = StandInBackend(jitter=0.01, seed=7)
+        hedged = StandInBackend(jitter=0.01, seed=7, hedger=create_hedger())
+        hedged.hedger.latencies.clear()
+        hedged.hedger.latencies.extend([0.0] * 5)
+
+        # Execute
+        plain_bids = [await plain.execute_prompt_async("p", Phase.BIDDING) for _ in range(5)]
+        hedged_bids = [await hedged.execute_prompt_async("p", Phase.BIDDING) for _ in range(5)]
+
+        # Verify
+        assert hedged.hedger.hedges > 0
+        assert hedged_bids == plain_bids
+
+    def test_agent_shares_hedger_when_enabled(self):
+        """Test that simulated players share one hedger built from the config, and get none by default."""
+        # Setup
+        agent = GreenAgent()
+        config = EvalConfig(backend=Backend.STAND_IN, hedge_simulated_calls=True, hedge_percentile=80, hedge_max_ratio=0.05)
+
+        # Execute
+        first = agent.create_backend(config, Difficulty.HARD)
+        second = agent.create_backend(config, Difficulty.HARD)
+        plain = GreenAgent().create_backend(EvalConfig(backend=Backend.STAND_IN), Difficulty.HARD)
+
+        # Verify
+        assert first.hedger is second.hedger is agent.hedger
+        assert (first.hedger.percentile, first.hedger.max_ratio) == (80, 0.05)
+        assert plain.hedger is None
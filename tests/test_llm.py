@@ -0,0 +1,333 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from google.genai import errors
+from unittest.mock import AsyncMock, Mock, patch
+
+from src import prompts
+from src.a2a.agent import GreenAgent
+from src.models.EvalConfig import EvalConfig
+from src.models.PhaseResponse import BidResponse, DebateResponse, PlayerChoiceResponse
+from src.models.enum.Phase import Phase
+from src.services.llm import LLM, PREFIX_CACHE_RENEW_MARGIN_SECONDS, clear_shared_clients
+from src.models.enum.Difficulty import Difficulty
+from src.models.Participant import Participant
+from src.models.enum.Role import Role
+
+
+def create_mock_genai_client(text: str = '{"message": "hello"}'):
+    """Helper to create a genai client double exposing both sync and aio surfaces."""
+    client = Mock()
+    client.models.generate_content = Mock(return_value=Mock(text=text))
+    client.aio.models.generate_content = AsyncMock(return_value=Mock(text=text))
+    return client
+
+
+class TestLLMAsync:
+    """Test suite for the non-blocking LLM execution path."""
+
+    @pytest.mark.asyncio
+    async def test_execute_prompt_async_uses_aio_client(self):
+        """Test that the async path goes through the aio client, not the blocking one."""
+        # Setup
+        llm = LLM()
+        client = create_mock_genai_client("response text")
+        llm._client = client
+
+        # Execute
+        result = await llm.execute_prompt_async("prompt")
+
+        # Verify
+        assert result == "response text"
+        client.aio.models.generate_content.assert_awaited_once_with(model=llm.model, contents="prompt")
+        client.models.generate_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reply_without_text_is_reprompted(self, mock_game_data, mock_messenger):
+        """Test that a reply with no text (e.g. safety-blocked) is re-requested instead of crashing the game."""
+        # Setup
+        llm = LLM(structured_output=False)
+        llm._client = create_mock_genai_client()
+        llm._client.aio.models.generate_content = AsyncMock(side_effect=[Mock(text=None), Mock(text='{"message": "hi"}')])
+        participant = Participant(id="p1", role=Role.VILLAGER, game_data=mock_game_data, use_llm=True, messenger=mock_messenger, llm=llm)
+
+        # Execute
+        reply = await participant.ask("prompt", Phase.DISCUSSION)
+
+        # Verify
+        assert reply.message == "hi"
+        assert llm._client.aio.models.generate_content.await_count == 2
+        assert "empty" in mock_game_data.invalid_replies[0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_participant_llm_calls_overlap(self, mock_game_data, mock_messenger):
+        """Test that simulated participants don't block each other while waiting on the LLM."""
+        # Setup
+        in_flight = 0
+        peak = 0
+
+        async def slow_generate(model, contents):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(text='{"message": "hi"}')
+
+        participants = []
+        for i in range(3):
+            llm = LLM()
+            llm._client = create_mock_genai_client()
+            llm._client.aio.models.generate_content = slow_generate
+            participants.append(Participant(
+                id=f"p{i}",
+                role=Role.VILLAGER,
+                game_data=mock_game_data,
+                use_llm=True,
+                messenger=mock_messenger,
+                llm=llm
+            ))
+
+        # Execute
+        results = await asyncio.gather(*(p.talk_to_agent("prompt") for p in participants))
+
+        # Verify
+        assert results == [{"message": "hi"}] * 3
+        assert peak == 3
+
+
+class TestSharedClients:
+    """Test suite for the process-wide genai client registry."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_registry(self, monkeypatch):
+        monkeypatch.setenv("GEMINI_API_KEY", "key-1")
+        clear_shared_clients()
+        with patch('src.services.llm.genai.Client', side_effect=lambda api_key: Mock(api_key=api_key)) as client_cls:
+            yield client_cls
+        clear_shared_clients()
+
+    def test_same_model_and_key_share_client(self, isolated_registry):
+        """Test that LLM instances with the same model and key reuse one client."""
+        # Execute
+        first = LLM(difficulty=Difficulty.HARD).client
+        second = LLM(difficulty=Difficulty.HARD).client
+
+        # Verify
+        assert first is second
+        assert isolated_registry.call_count == 1
+
+    def test_different_model_gets_own_client(self, isolated_registry):
+        """Test that clients are keyed by model."""
+        # Execute
+        easy = LLM(difficulty=Difficulty.EASY).client
+        hard = LLM(difficulty=Difficulty.HARD).client
+
+        # Verify
+        assert easy is not hard
+        assert isolated_registry.call_count == 2
+
+    def test_different_key_gets_own_client(self, isolated_registry, monkeypatch):
+        """Test that clients are keyed by API key."""
+        # Execute
+        first = LLM().client
+        monkeypatch.setenv("GEMINI_API_KEY", "key-2")
+        second = LLM().client
+
+        # Verify
+        assert first is not second
+        assert second.api_key == "key-2"
+
+
+class TestPrefixCache:
+    """Test suite for registering the static prompt prefix as cached content."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_registry(self):
+        clear_shared_clients()
+        # The shipped prefix is below Gemini's caching minimum; these tests cover registration itself
+        with patch("src.services.llm.prefix_cacheable", return_value=True):
+            yield
+        clear_shared_clients()
+
+    def create_llm(self, client):
+        llm = LLM(cache_prefix=True)
+        llm._client = client
+        return llm
+
+    @pytest.mark.asyncio
+    async def test_sends_only_suffix_with_cached_content(self):
+        """Test that a registered prefix is referenced by name instead of being resent."""
+        # Setup
+        client = create_mock_genai_client("ok")
+        client.aio.caches.create = AsyncMock(return_value=SimpleNamespace(name="cachedContents/123"))
+        llm = self.create_llm(client)
+
+        # Execute
+        await llm.execute_prompt_async(prompts.STATIC_PREFIX + "TASK: VOTE")
+
+        # Verify
+        kwargs = client.aio.models.generate_content.await_args.kwargs
+        assert kwargs["contents"] == "TASK: VOTE"
+        assert kwargs["config"].cached_content == "cachedContents/123"
+
+    @pytest.mark.asyncio
+    async def test_registers_once_for_concurrent_calls(self):
+        """Test that concurrent first calls share one registration."""
+        # Setup
+        client = create_mock_genai_client("ok")
+
+        async def slow_create(**kwargs):
+            await asyncio.sleep(0.01)
+            return SimpleNamespace(name="cachedContents/1")
+
+        client.aio.caches.create = AsyncMock(side_effect=slow_create)
+        llms = [self.create_llm(client) for _ in range(3)]
+
+        # Execute
+        await asyncio.gather(*(llm.execute_prompt_async(prompts.STATIC_PREFIX + "TASK: BID") for llm in llms))
+
+        # Verify
+        assert client.aio.caches.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_registration_sends_full_prompt(self):
+        """Test that prompts fall back to the full text if the prefix can't be cached."""
+        # Setup
+        client = create_mock_genai_client("ok")
+        client.aio.caches.create = AsyncMock(side_effect=RuntimeError("too small to cache"))
+        llm = self.create_llm(client)
+        prompt = prompts.STATIC_PREFIX + "TASK: VOTE"
+
+        # Execute
+        await llm.execute_prompt_async(prompt)
+        await llm.execute_prompt_async(prompt)
+
+        # Verify
+        client.aio.models.generate_content.assert_awaited_with(model=llm.model, contents=prompt)
+        assert client.aio.caches.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_prefix_below_model_minimum_not_registered(self):
+        """Test that a prefix too short for the model's cache is sent in full without a registration attempt."""
+        # Setup
+        client = create_mock_genai_client("ok")
+        client.aio.caches.create = AsyncMock()
+        llm = self.create_llm(client)
+        prompt = prompts.STATIC_PREFIX + "TASK: VOTE"
+
+        # Execute
+        with patch("src.services.llm.prefix_cacheable", return_value=False):
+            await llm.execute_prompt_async(prompt)
+
+        # Verify
+        client.aio.models.generate_content.assert_awaited_once_with(model=llm.model, contents=prompt)
+        client.aio.caches.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_registration_renewed_before_expiry(self):
+        """Test that the prefix is registered again once its renewal time has passed."""
+        # Setup
+        client = create_mock_genai_client("ok")
+        client.aio.caches.create = AsyncMock(side_effect=[SimpleNamespace(name="cachedContents/1"), SimpleNamespace(name="cachedContents/2")])
+        llm = self.create_llm(client)
+
+        # Execute
+        with patch("src.services.llm.PREFIX_CACHE_TTL_SECONDS", PREFIX_CACHE_RENEW_MARGIN_SECONDS):
+            await llm.execute_prompt_async(prompts.STATIC_PREFIX + "TASK: VOTE")
+            await llm.execute_prompt_async(prompts.STATIC_PREFIX + "TASK: BID")
+
+        # Verify
+        assert client.aio.caches.create.await_count == 2
+        assert client.aio.models.generate_content.await_args.kwargs["config"].cached_content == "cachedContents/2"
+
+    @pytest.mark.asyncio
+    async def test_missing_cache_resends_full_prompt(self):
+        """Test that a call whose cached prefix is gone is resent in full and the prefix registered again."""
+        # Setup
+        client = create_mock_genai_client("ok")
+        client.aio.caches.create = AsyncMock(side_effect=[SimpleNamespace(name="cachedContents/1"), SimpleNamespace(name="cachedContents/2")])
+        missing = errors.ClientError(404, {"error": {"code": 404, "message": "CachedContent not found (or permission denied)", "status": "NOT_FOUND"}})
+        client.aio.models.generate_content.side_effect = [missing, Mock(text="first"), Mock(text="second")]
+        llm = self.create_llm(client)
+        prompt = prompts.STATIC_PREFIX + "TASK: VOTE"
+
+        # Execute
+        first = await llm.execute_prompt_async(prompt)
+        second = await llm.execute_prompt_async(prompt + "\nagain")
+
+        # Verify
+        calls = client.aio.models.generate_content.await_args_list
+        assert (first, second) == ("first", "second")
+        assert calls[1].kwargs == {"model": llm.model, "contents": prompt}
+        assert calls[2].kwargs["config"].cached_content == "cachedContents/2"
+
+
+class TestStructuredOutput:
+    """Test suite for schema-constrained replies from the LLM backend."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("phase, schema", [
+        (Phase.BIDDING, BidResponse),
+        (Phase.DISCUSSION, DebateResponse),
+        (Phase.VOTE, PlayerChoiceResponse),
+        (Phase.NIGHT, PlayerChoiceResponse),
+    ])
+    async def test_phase_requests_its_schema(self, phase, schema):
+        """Test that each phase asks for JSON matching its response model."""
+        # Setup
+        llm = LLM()
+        llm._client = create_mock_genai_client()
+
+        # Execute
+        await llm.execute_prompt_async("prompt", phase=phase)
+
+        # Verify
+        config = llm._client.aio.models.generate_content.await_args.kwargs["config"]
+        assert config.response_mime_type == "application/json"
+        assert config.response_schema is schema
+
+    @pytest.mark.asyncio
+    async def test_disabled_sends_plain_prompt(self):
+        """Test that no schema is requested when structured output is off."""
+        # Setup
+        llm = LLM(structured_output=False)
+        llm._client = create_mock_genai_client()
+
+        # Execute
+        await llm.execute_prompt_async("prompt", phase=Phase.VOTE)
+
+        # Verify
+        llm._client.aio.models.generate_content.assert_awaited_once_with(model=llm.model, contents="prompt")
+
+    @pytest.mark.asyncio
+    async def test_schema_combines_with_cached_prefix(self):
+        """Test that the cached prefix and the response schema go in the same request."""
+        # Setup
+        clear_shared_clients()
+        client = create_mock_genai_client('{"bid_amount": 10, "reason": "quiet"}')
+        client.aio.caches.create = AsyncMock(return_value=SimpleNamespace(name="cachedContents/9"))
+        llm = LLM(cache_prefix=True)
+        llm._client = client
+
+        # Execute
+        with patch("src.services.llm.prefix_cacheable", return_value=True):
+            reply = await llm.execute_prompt_async(prompts.STATIC_PREFIX + "TASK: BID", phase=Phase.BIDDING)
+        clear_shared_clients()
+
+        # Verify
+        kwargs = client.aio.models.generate_content.await_args.kwargs
+        assert kwargs["contents"] == "TASK: BID"
+        assert kwargs["config"].cached_content == "cachedContents/9"
+        assert kwargs["config"].response_schema is BidResponse
+        assert BidResponse.model_validate_json(reply).bid_amount == 10
+
+    def test_agent_passes_config_to_backend(self):
+        """Test that the evaluation config switches structured output for Gemini players."""
+        # Execute
+        default = GreenAgent().create_backend(EvalConfig(), Difficulty.HARD)
+        disabled = GreenAgent().create_backend(EvalConfig(structured_output=False), Difficulty.HARD)
+
+        # Verify
+        assert default.structured_output is True
+        assert disabled.structured_output is False
@@ -0,0 +1,261 @@
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+
+from src.a2a.card_cache import AgentCardCache
+from src.a2a.messenger import ContextRejectedError, Messenger
+
+
+@pytest.fixture
+def a2a_doubles():
+    """Patch card resolution, client creation and sending inside the messenger module."""
+    with patch('src.a2a.messenger.A2ACardResolver') as resolver_cls, \
+            patch('src.a2a.messenger.ClientFactory') as factory_cls, \
+            patch('src.a2a.messenger.send_with_client', new_callable=AsyncMock) as send:
+        resolver_cls.return_value.get_agent_card = AsyncMock(return_value=Mock(name="card"))
+        factory_cls.return_value.create.side_effect = lambda card: Mock(name="client")
+        send.return_value = {"response": '{"ok": true}', "context_id": "ctx-1"}
+        yield resolver_cls, factory_cls, send
+
+
+class TestMessengerPooling:
+    """Test suite for Messenger connection and client reuse."""
+
+    @pytest.mark.asyncio
+    async def test_client_cached_per_url(self, a2a_doubles):
+        """Test that the agent card and A2A client are built once per participant URL."""
+        # Setup
+        resolver_cls, factory_cls, send = a2a_doubles
+        messenger = Messenger()
+
+        # Execute
+        await messenger.talk_to_agent("one", "http://agent-a")
+        await messenger.talk_to_agent("two", "http://agent-a")
+        await messenger.talk_to_agent("three", "http://agent-b")
+
+        # Verify
+        assert resolver_cls.return_value.get_agent_card.await_count == 2
+        assert factory_cls.return_value.create.call_count == 2
+        clients = [call.args[0] for call in send.await_args_list]
+        assert clients[0] is clients[1]
+        assert clients[0] is not clients[2]
+
+        await messenger.close()
+
+    @pytest.mark.asyncio
+    async def test_httpx_client_shared_and_pooled(self, a2a_doubles):
+        """Test that every call goes through one pooled httpx client."""
+        # Setup
+        resolver_cls, _, _ = a2a_doubles
+        messenger = Messenger(max_connections=4, max_keepalive_connections=2)
+
+        # Execute
+        await messenger.talk_to_agent("one", "http://agent-a")
+        await messenger.talk_to_agent("two", "http://agent-b")
+
+        # Verify
+        httpx_clients = {call.kwargs["httpx_client"] for call in resolver_cls.call_args_list}
+        assert len(httpx_clients) == 1
+        assert messenger._limits.max_connections == 4
+        assert messenger._limits.max_keepalive_connections == 2
+
+        await messenger.close()
+
+    @pytest.mark.asyncio
+    async def test_close_releases_connections(self, a2a_doubles):
+        """Test that close shuts the pooled client and forgets cached A2A clients."""
+        # Setup
+        messenger = Messenger()
+        await messenger.talk_to_agent("one", "http://agent-a")
+        httpx_client = messenger._httpx_client
+
+        # Execute
+        await messenger.close()
+
+        # Verify
+        assert httpx_client.is_closed
+        assert messenger._httpx_client is None
+        assert messenger._clients == {}
+
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes(self, a2a_doubles):
+        """Test that leaving an ``async with`` block closes the messenger."""
+        # Execute
+        async with Messenger() as messenger:
+            await messenger.talk_to_agent("one", "http://agent-a")
+            httpx_client = messenger._httpx_client
+
+        # Verify
+        assert httpx_client.is_closed
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAgentCardCache:
+    """Test suite for the agent card TTL cache."""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted as hits or misses."""
+        # Setup
+        cache = AgentCardCache(ttl=60)
+        card = Mock(name="card")
+
+        # Execute
+        assert cache.get("http://agent-a") is None
+        cache.put("http://agent-a", card)
+        assert cache.get("http://agent-a") is card
+
+        # Verify
+        assert cache.stats() == {"hits": 1, "misses": 1, "invalidations": 0}
+
+    def test_entries_expire_after_ttl(self):
+        """Test that a card older than the TTL is treated as missing."""
+        # Setup
+        clock = FakeClock()
+        cache = AgentCardCache(ttl=60, clock=clock)
+        cache.put("http://agent-a", Mock(name="card"))
+
+        # Execute
+        clock.now = 59
+        fresh = cache.get("http://agent-a")
+        clock.now = 60
+        expired = cache.get("http://agent-a")
+
+        # Verify
+        assert fresh is not None
+        assert expired is None
+
+    def test_zero_ttl_disables_caching(self):
+        """Test that a TTL of 0 never returns a cached card."""
+        # Setup
+        cache = AgentCardCache(ttl=0)
+        cache.put("http://agent-a", Mock(name="card"))
+
+        # Execute / Verify
+        assert cache.get("http://agent-a") is None
+
+    @pytest.mark.asyncio
+    async def test_card_refetched_after_ttl(self, a2a_doubles):
+        """Test that the messenger re-resolves the card and rebuilds the client once it expires."""
+        # Setup
+        resolver_cls, factory_cls, _ = a2a_doubles
+        clock = FakeClock()
+        messenger = Messenger(card_cache=AgentCardCache(ttl=60, clock=clock))
+
+        # Execute
+        await messenger.talk_to_agent("one", "http://agent-a")
+        clock.now = 30
+        await messenger.talk_to_agent("two", "http://agent-a")
+        clock.now = 90
+        resolver_cls.return_value.get_agent_card.return_value = Mock(name="new card")
+        await messenger.talk_to_agent("three", "http://agent-a")
+
+        # Verify
+        assert resolver_cls.return_value.get_agent_card.await_count == 2
+        assert factory_cls.return_value.create.call_count == 2
+        assert messenger.card_cache.stats()["hits"] == 1
+
+        await messenger.close()
+
+    @pytest.mark.asyncio
+    async def test_transport_error_invalidates_card(self, a2a_doubles):
+        """Test that a failed send drops the cached card so the next call re-resolves it."""
+        # Setup
+        resolver_cls, _, send = a2a_doubles
+        messenger = Messenger()
+        await messenger.talk_to_agent("one", "http://agent-a")
+        send.side_effect = httpx.ConnectError("connection refused")
+
+        # Execute
+        with pytest.raises(httpx.ConnectError):
+            await messenger.talk_to_agent("two", "http://agent-a")
+        send.side_effect = None
+        await messenger.talk_to_agent("three", "http://agent-a")
+
+        # Verify
+        assert resolver_cls.return_value.get_agent_card.await_count == 2
+        assert messenger.card_cache.stats()["invalidations"] == 1
+
+        await messenger.close()
+
+    @pytest.mark.asyncio
+    async def test_application_error_keeps_card(self, a2a_doubles):
+        """Test that a non-transport failure does not invalidate the card."""
+        # Setup
+        resolver_cls, _, send = a2a_doubles
+        messenger = Messenger()
+        send.return_value = {"response": "boom", "context_id": "ctx", "status": "failed"}
+
+        # Execute
+        with pytest.raises(RuntimeError):
+            await messenger.talk_to_agent("one", "http://agent-a")
+
+        # Verify
+        assert messenger.card_cache.stats()["invalidations"] == 0
+
+        await messenger.close()
+
+
+class TestConversationContexts:
+    """Test suite for per-participant contexts and context rejection."""
+
+    @pytest.mark.asyncio
+    async def test_contexts_kept_per_key(self, a2a_doubles):
+        """Test that each context key continues its own conversation."""
+        # Setup
+        _, _, send = a2a_doubles
+        messenger = Messenger()
+        send.return_value = {"response": "{}", "context_id": "ctx-a"}
+        await messenger.talk_to_agent("one", "http://agent", new_conversation=True, context_key="a")
+        send.return_value = {"response": "{}", "context_id": "ctx-b"}
+        await messenger.talk_to_agent("one", "http://agent", new_conversation=True, context_key="b")
+
+        # Execute
+        await messenger.talk_to_agent("two", "http://agent", context_key="a")
+
+        # Verify
+        assert send.await_args.kwargs["context_id"] == "ctx-a"
+
+        await messenger.close()
+
+    @pytest.mark.asyncio
+    async def test_rejected_context_raises_and_is_forgotten(self, a2a_doubles):
+        """Test that a rejected continuation raises ContextRejectedError and the next call starts fresh."""
+        # Setup
+        _, _, send = a2a_doubles
+        messenger = Messenger()
+        await messenger.talk_to_agent("one", "http://agent", context_key="a")
+        send.return_value = {"response": "unknown context", "context_id": "ctx-1", "status": "rejected"}
+
+        # Execute
+        with pytest.raises(ContextRejectedError):
+            await messenger.talk_to_agent("two", "http://agent", context_key="a")
+        send.return_value = {"response": "{}", "context_id": "ctx-2"}
+        await messenger.talk_to_agent("three", "http://agent", context_key="a")
+
+        # Verify
+        assert send.await_args.kwargs["context_id"] is None
+
+        await messenger.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_without_context_is_not_a_rejection(self, a2a_doubles):
+        """Test that a failed first message is reported as a plain error."""
+        # Setup
+        _, _, send = a2a_doubles
+        messenger = Messenger()
+        send.return_value = {"response": "boom", "context_id": "ctx", "status": "rejected"}
+
+        # Execute / Verify
+        with pytest.raises(RuntimeError) as error:
+            await messenger.talk_to_agent("one", "http://agent", new_conversation=True)
+        assert not isinstance(error.value, ContextRejectedError)
+
+        await messenger.close()
@@ -1,9 +1,12 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 
 from src.phases.night import Night
 from src.models.enum.EventType import EventType
-from src.models.enum.EliminationType import EliminationType
+from src.models.enum.EliminationType import EliminationType, EliminationStatus
+from src.models.enum.Role import Role
+from conftest import create_mock_participant
 
 
 class TestNightPhase:
@@ -138,3 +141,112 @@ class TestNightPhase:
 
         # Verify latest kill was updated
         assert mock_game.state.latest_werewolf_kill == "villager_1"
+
+
+@pytest.fixture
+def night_roles(mock_game, mock_messenger, sample_participants):
+    """Wire up doctor, primary werewolf and seer on the mocked game state."""
+    doctor = create_mock_participant(
+        id="doctor_1",
+        role=Role.DOCTOR,
+        game_data=mock_game.state,
+        messenger=mock_messenger
+    )
+    doctor.get_doctor_prompt = Mock(return_value="doctor prompt")
+
+    mock_game.state.current_round = 1
+    mock_game.state.doctor = doctor
+    mock_game.state.primary_werewolf = sample_participants["werewolf"]
+    mock_game.state.secondary_werewolf = None
+    mock_game.state.seer = sample_participants["seer"]
+    mock_game.state.doctor_saves = {}
+    return doctor, sample_participants["werewolf"], sample_participants["seer"]
+
+
+class TestConcurrentNight:
+    """Test suite for concurrent night decisions with ordered resolution."""
+
+    @pytest.mark.asyncio
+    async def test_night_decisions_requested_concurrently(self, mock_game, mock_messenger, night_roles):
+        """Test that doctor, werewolf and seer are all prompted before any decision resolves."""
+        # Setup
+        night = Night(mock_game, mock_messenger)
+        doctor, werewolf, seer = night_roles
+        in_flight = 0
+        peak = 0
+
+        def replying(player_id):
+            async def reply(prompt, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return {"player_id": player_id, "reason": "r"}
+            return reply
+
+        doctor.talk_to_agent.side_effect = replying("villager_2")
+        werewolf.talk_to_agent.side_effect = replying("villager_1")
+        seer.talk_to_agent.side_effect = replying("werewolf_1")
+
+        # Execute
+        await night.run()
+
+        # Verify
+        assert peak == 3
+        mock_game.state.eliminate_player.assert_called_once_with("villager_1", EliminationType.NIGHT_KILL)
+        assert mock_game.state.seer_checks == [("werewolf_1", True)]
+
+    @pytest.mark.asyncio
+    async def test_save_resolved_before_kill_regardless_of_reply_order(self, mock_game, mock_messenger, night_roles):
+        """Test that a save that arrives last still blocks the kill on the same target."""
+        # Setup
+        night = Night(mock_game, mock_messenger)
+        doctor, werewolf, seer = night_roles
+
+        async def slow_doctor(prompt, **kwargs):
+            await asyncio.sleep(0.02)
+            return {"player_id": "villager_1", "reason": "protect"}
+
+        doctor.talk_to_agent.side_effect = slow_doctor
+        werewolf.talk_to_agent.return_value = {"player_id": "villager_1", "reason": "kill"}
+        seer.talk_to_agent.return_value = {"player_id": "villager_2", "reason": "check"}
+
+        # Execute
+        await night.run()
+
+        # Verify
+        mock_game.state.eliminate_player.assert_not_called()
+        assert mock_game.state.latest_werewolf_kill == ("villager_1", EliminationStatus.FAIL)
+        logged_types = [call.args[1].type for call in mock_game.log_event.call_args_list]
+        assert logged_types == [
+            EventType.DOCTOR_SAVE,
+            EventType.WEREWOLF_ELIMINATION_FAILURE,
+            EventType.SEER_INVESTIGATION,
+            EventType.NIGHT_END,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_seer_killed_tonight_loses_investigation(self, mock_game, mock_messenger, night_roles):
+        """Test that the seer's decision is discarded when the werewolf kills them the same night."""
+        # Setup
+        night = Night(mock_game, mock_messenger)
+        doctor, werewolf, seer = night_roles
+
+        def eliminate(player_id, elimination_type):
+            if player_id == seer.id:
+                mock_game.state.seer = None
+
+        mock_game.state.eliminate_player.side_effect = eliminate
+        doctor.talk_to_agent.return_value = {"player_id": "villager_2", "reason": "protect"}
+        werewolf.talk_to_agent.return_value = {"player_id": seer.id, "reason": "kill the seer"}
+        seer.talk_to_agent.return_value = {"player_id": "werewolf_1", "reason": "check"}
+
+        # Execute
+        await night.run()
+
+        # Verify
+        seer.talk_to_agent.assert_called_once()
+        assert mock_game.state.seer_checks == []
+        logged_types = [call.args[1].type for call in mock_game.log_event.call_args_list]
+        assert EventType.SEER_INVESTIGATION not in logged_types
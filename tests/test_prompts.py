@@ -0,0 +1,138 @@
+import subprocess
+import sys
+
+import pytest
+from unittest.mock import patch
+
+from src.models.EvalConfig import EvalConfig
+from src.prompt_report import build_report, create_sample_game
+from src.prompts import PHASE_TEMPLATES, STATIC_PREFIX, TASKS, PromptTemplate, split_prefix
+from src.services.llm import LLM
+
+
+class TestPromptTemplate:
+    """Test suite for the precompiled prompt templates."""
+
+    def test_source_is_dedented_and_compacted_once(self):
+        """Test that indentation, trailing spaces and blank-line runs are removed at compile time."""
+        # Execute
+        template = PromptTemplate("""
+            First line   
+
+            
+
+            Second $name
+        """)
+
+        # Verify
+        assert template.text == "First line\n\nSecond $name"
+        assert template.sections == {"name"}
+        assert template.render(name="value") == "First line\n\nSecond value"
+
+    def test_constants_are_filled_at_compile_time(self):
+        """Test that constant sections are substituted once and are not render arguments."""
+        # Execute
+        template = PromptTemplate("""
+            $context
+            $response_format
+        """, response_format='{"player_id": "who"}')
+
+        # Verify
+        assert template.sections == {"context"}
+        assert '{"player_id": "who"}' in template.text
+
+    def test_missing_section_is_an_error(self):
+        """Test that rendering without every variable section fails loudly."""
+        # Setup
+        template = PromptTemplate("$a and $b")
+
+        # Execute / Verify
+        with pytest.raises(KeyError, match="b"):
+            template.render(a="x")
+
+    def test_module_imports_on_its_own(self):
+        """Test that the prompts module imports from a cold start, without a circular import."""
+        result = subprocess.run([sys.executable, "-c", "import src.prompts"], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+    def test_phase_templates_have_no_leading_indentation(self):
+        """Test that no compiled phase prompt carries indentation from the source."""
+        for template in PHASE_TEMPLATES.values():
+            assert not any(line.startswith(" ") for line in template.text.splitlines())
+
+    def test_report_covers_every_phase_and_shrinks_prompts(self):
+        """Test that the token report compares old and new prompts for each phase."""
+        # Execute
+        rows = build_report()
+
+        # Verify
+        assert [row["phase"] for row in rows] == list(PHASE_TEMPLATES)
+        assert all(row["sent_tokens"] == row["tokens"] < row["legacy_tokens"] for row in rows)
+
+    def test_report_counts_prefix_as_sent_unless_cacheable(self):
+        """Test that the prefix only drops out of the sent tokens when the model can cache it."""
+        # Setup
+        game = create_sample_game(EvalConfig(seed=0, cache_prompt_prefix=True))
+
+        # Execute
+        uncacheable = build_report(game)
+        with patch("src.prompt_report.prefix_cacheable", return_value=True):
+            cacheable = build_report(game)
+
+        # Verify
+        assert all(row["sent_tokens"] == row["tokens"] for row in uncacheable)
+        assert sum(row["sent_tokens"] for row in cacheable) < sum(row["tokens"] for row in cacheable)
+
+    def test_phase_prompts_share_static_prefix(self):
+        """Test that every player's phase prompt starts with the same static prefix."""
+        # Setup
+        state = create_sample_game(EvalConfig(seed=0, cache_prompt_prefix=True)).state
+
+        # Execute
+        rendered = [
+            state.villagers[0].get_vote_prompt(),
+            state.villagers[1].get_bid_prompt(),
+            state.villagers[0].get_debate_prompt(),
+            state.seer.get_seer_prompt(),
+            state.doctor.get_doctor_prompt(),
+            state.primary_werewolf.get_werewolf_prompt(),
+        ]
+
+        # Verify
+        for prompt in rendered:
+            prefix, suffix = split_prefix(prompt)
+            assert prefix == STATIC_PREFIX
+            assert suffix.splitlines()[-1].startswith("TASK: ")
+            assert "Your player ID: P" in suffix
+        assert split_prefix("no prefix") == ("", "no prefix")
+
+    def test_prompts_without_shared_prefix_carry_own_task_only(self):
+        """Test that without prefix caching a prompt holds its own task's instructions, not the rules or other tasks."""
+        # Setup
+        state = create_sample_game().state
+
+        # Execute
+        prompt = state.villagers[0].get_vote_prompt()
+
+        # Verify
+        assert split_prefix(prompt)[0] == ""
+        assert "TASK: VOTE" in prompt and TASKS["VOTE"] in prompt
+        assert TASKS["BID"] not in prompt and "WIN CONDITIONS" not in prompt
+
+    def test_gemini_players_skip_uncacheable_prefix(self):
+        """Test that Gemini players don't get the prefix when their model can't cache it."""
+        # Setup
+        state = create_sample_game(EvalConfig(seed=0, cache_prompt_prefix=True)).state
+        villager = state.villagers[0]
+        villager.llm = LLM()
+
+        # Execute
+        with patch("src.models.Participant.prefix_cacheable", return_value=False):
+            uncacheable = villager.get_vote_prompt()
+        with patch("src.models.Participant.prefix_cacheable", return_value=True):
+            cacheable = villager.get_vote_prompt()
+
+        # Verify
+        assert not uncacheable.startswith(STATIC_PREFIX)
+        assert cacheable.startswith(STATIC_PREFIX)
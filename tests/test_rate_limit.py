@@ -0,0 +1,227 @@
+import asyncio
+import pytest
+from google.genai import errors
+from unittest.mock import AsyncMock, Mock
+
+from src.a2a.agent import GreenAgent
+from src.models.EvalConfig import EvalConfig
+from src.models.enum.Difficulty import Difficulty
+from src.services.hedging import Hedger
+from src.services.llm import LLM, clear_shared_clients, get_rate_limiter
+from src.services.rate_limit import AdaptiveConcurrency, RateLimiter, TokenBucket
+from src.services.standin import ThrottlingEndpoint
+
+
+def create_throttled_llms(endpoint: ThrottlingEndpoint, count: int, limiter: RateLimiter = None):
+    client = Mock()
+    client.aio.models = endpoint
+    llms = [LLM(rate_limiter=limiter) for _ in range(count)]
+    for llm in llms:
+        llm._client = client
+    return llms
+
+
+class TestTokenBucket:
+    """Test suite for the requests-per-second limit."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        """Test that a burst passes at once and later requests wait for refilled tokens."""
+        # Setup
+        now = 0.0
+        waits = []
+
+        async def sleep(seconds):
+            waits.append(seconds)
+
+        bucket = TokenBucket(rate=2, burst=2, clock=lambda: now, sleep=sleep)
+
+        # Execute
+        for _ in range(4):
+            await bucket.acquire()
+
+        # Verify
+        assert waits == [0.5, 1.0]
+
+
+class TestAdaptiveConcurrency:
+    """Test suite for the AIMD concurrency window."""
+
+    def test_throttling_halves_and_success_grows(self):
+        """Test multiplicative decrease on throttling and additive increase on success."""
+        # Setup
+        window = AdaptiveConcurrency(maximum=8)
+        window.in_flight = 2
+
+        # Execute
+        window.release(throttled=True)
+        after_throttle = window.window
+        # About one extra slot per window's worth of successes
+        for _ in range(5):
+            window.in_flight += 1
+            window.release()
+
+        # Verify
+        assert after_throttle == 4
+        assert window.window == 5
+
+    @pytest.mark.asyncio
+    async def test_waiters_resume_when_slots_free(self):
+        """Test that no more than the window runs at once."""
+        # Setup
+        window = AdaptiveConcurrency(maximum=2)
+
+        async def work():
+            await window.acquire()
+            await asyncio.sleep(0.01)
+            window.release()
+
+        # Execute
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        # Verify
+        assert window.peak_in_flight == 2
+        assert window.in_flight == 0
+
+
+class TestRateLimiter:
+    """Test suite for rate limiting Gemini calls against a throttling stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_calls_get_throttled(self):
+        """Test that without pacing or throttle retries a burst above the endpoint's capacity fails."""
+        # Setup
+        endpoint = ThrottlingEndpoint(capacity=2)
+        llms = create_throttled_llms(endpoint, 6, RateLimiter(rate=0, max_concurrency=6, max_throttle_retries=0))
+
+        # Execute
+        results = await asyncio.gather(*(llm.execute_prompt_async("p") for llm in llms), return_exceptions=True)
+
+        # Verify
+        assert sum(isinstance(r, errors.ClientError) for r in results) == endpoint.throttled > 0
+
+    @pytest.mark.asyncio
+    async def test_limiter_adapts_and_completes_every_call(self):
+        """Test that throttling shrinks the window and every call eventually succeeds."""
+        # Setup
+        endpoint = ThrottlingEndpoint(capacity=2)
+        limiter = RateLimiter(rate=0, max_concurrency=8, backoff_seconds=0.001)
+        llms = create_throttled_llms(endpoint, 12, limiter)
+
+        # Execute
+        results = await asyncio.gather(*(llm.execute_prompt_async("p") for llm in llms))
+
+        # Verify
+        assert results == ['{"message": "ok"}'] * 12
+        assert endpoint.throttled > 0
+        assert limiter.stats()["throttled"] == endpoint.throttled
+        assert limiter.stats()["concurrency_limit"] < 8
+
+    @pytest.mark.asyncio
+    async def test_throttled_calls_not_hedged(self):
+        """Test that 429 backoff doesn't count as latency, so throttled calls don't send duplicates."""
+        # Setup
+        endpoint = ThrottlingEndpoint(capacity=2)
+        limiter = RateLimiter(rate=0, max_concurrency=8, backoff_seconds=0.05)
+        hedger = Hedger(max_ratio=1.0, min_samples=5)
+        hedger.latencies.extend([0.03] * 5)
+        llms = create_throttled_llms(endpoint, 8, limiter)
+        for llm in llms:
+            llm.hedger = hedger
+
+        # Execute
+        await asyncio.gather(*(llm.execute_prompt_async("p") for llm in llms))
+
+        # Verify
+        assert endpoint.throttled > 0
+        assert hedger.hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_other_errors_not_retried(self):
+        """Test that non-throttling errors are raised on the first attempt."""
+        # Setup
+        limiter = RateLimiter(rate=0)
+        calls = 0
+
+        async def broken():
+            nonlocal calls
+            calls += 1
+            raise errors.ServerError(500, {"error": {"code": 500, "message": "boom", "status": "INTERNAL"}})
+
+        # Execute / Verify
+        with pytest.raises(errors.ServerError):
+            await limiter.call(broken)
+        assert calls == 1
+        assert limiter.concurrency.in_flight == 0
+
+    def test_limiter_shared_per_model(self):
+        """Test that all Gemini players of one model share a limiter built from the config."""
+        # Setup
+        clear_shared_clients()
+        agent = GreenAgent()
+        config = EvalConfig(llm_max_concurrency=3)
+
+        # Execute
+        first = agent.create_backend(config, Difficulty.HARD)
+        second = agent.create_backend(config, Difficulty.HARD)
+        easy = agent.create_backend(config, Difficulty.EASY)
+        clear_shared_clients()
+
+        # Verify
+        assert first.rate_limiter is second.rate_limiter
+        assert first.rate_limiter is not easy.rate_limiter
+        assert first.rate_limiter.concurrency.maximum == 3
+
+    def test_later_config_applies_to_shared_limiter(self):
+        """Test that a later evaluation's limits replace the ones the limiter was created with."""
+        # Setup
+        clear_shared_clients()
+        agent = GreenAgent()
+
+        # Execute
+        first = agent.create_backend(EvalConfig(llm_requests_per_second=10, llm_burst=10, llm_max_concurrency=16), Difficulty.HARD)
+        second = agent.create_backend(EvalConfig(llm_requests_per_second=2, llm_burst=1, llm_max_concurrency=4), Difficulty.HARD)
+        clear_shared_clients()
+
+        # Verify
+        limiter = second.rate_limiter
+        assert limiter is first.rate_limiter
+        assert (limiter.bucket.rate, limiter.bucket.burst, limiter.concurrency.maximum) == (2, 1, 4)
+        assert limiter.concurrency.window == 4
+
+    @pytest.mark.asyncio
+    async def test_each_agent_reports_its_own_traffic(self):
+        """Test that agents sharing a model's limiter each report only the calls their players made."""
+        # Setup
+        clear_shared_clients()
+        first, second = GreenAgent(), GreenAgent()
+        config = EvalConfig(llm_requests_per_second=0)
+        client = Mock()
+        client.aio.models = ThrottlingEndpoint(capacity=10)
+        backends = [first.create_backend(config, Difficulty.HARD), second.create_backend(config, Difficulty.HARD), second.create_backend(config, Difficulty.HARD)]
+        for backend in backends:
+            backend._client = client
+
+        # Execute
+        await asyncio.gather(*(backend.execute_prompt_async("p") for backend in backends))
+        model = Difficulty.HARD.get_model()
+        first_stats, second_stats = first.rate_limit_stats(), second.rate_limit_stats()
+        clear_shared_clients()
+
+        # Verify
+        assert first_stats == {model: {"requests": 1, "throttled": 0, "concurrency_limit": 16}}
+        assert second_stats[model]["requests"] == 2
+
+    def test_every_llm_uses_the_shared_limiter(self):
+        """Test that an LLM built without a limiter still goes through its model's shared one."""
+        # Setup
+        clear_shared_clients()
+        configured = get_rate_limiter(Difficulty.HARD.get_model(), rate=2, burst=1, max_concurrency=4)
+
+        # Execute
+        llm = LLM(difficulty=Difficulty.HARD)
+        clear_shared_clients()
+
+        # Verify
+        assert llm.rate_limiter is configured
+        assert configured.concurrency.maximum == 4
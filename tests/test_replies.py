@@ -0,0 +1,61 @@
+import pytest
+
+from src.services.replies import ReplyParseError, extract_json_object
+
+
+class TestExtractJsonObject:
+    """Test suite for pulling the JSON object out of an agent reply."""
+
+    @pytest.mark.parametrize("reply", [
+        '{"player_id": "P3", "reason": "quiet"}',
+        '```json\n{"player_id": "P3", "reason": "quiet"}\n```',
+        '```\n{"player_id": "P3", "reason": "quiet"}\n```',
+        'I think P3 is suspicious. {"player_id": "P3", "reason": "quiet"} Hope that helps!',
+        'Here you go:\n  {"player_id": "P3",\n   "reason": "quiet"}',
+    ])
+    def test_finds_object_in_common_wrappings(self, reply):
+        """Test that bare, fenced and prose-wrapped objects are all recovered."""
+        assert extract_json_object(reply) == {"player_id": "P3", "reason": "quiet"}
+
+    def test_braces_inside_strings_are_ignored(self):
+        """Test that braces and escaped quotes in string values don't end the object early."""
+        # Setup
+        reply = 'Answer: {"message": "I said \\"}\\" and {not} more", "extra": {"a": 1}} trailing }'
+
+        # Execute
+        parsed = extract_json_object(reply)
+
+        # Verify
+        assert parsed == {"message": 'I said "}" and {not} more', "extra": {"a": 1}}
+
+    def test_skips_invalid_candidate(self):
+        """Test that a balanced but invalid block before the real object is skipped."""
+        assert extract_json_object('Use {curly braces} like {"bid_amount": 40, "reason": "r"}') == {"bid_amount": 40, "reason": "r"}
+
+    def test_returns_first_object(self):
+        """Test that the first valid top-level object wins."""
+        assert extract_json_object('{"message": "one"} {"message": "two"}') == {"message": "one"}
+
+    @pytest.mark.parametrize("reply, reason", [
+        ("I'd rather not say.", "no JSON object"),
+        ('{"player_id": "P3", "reason": ', "unclosed"),
+        ("{oops} {also not json}", "no valid JSON object"),
+    ])
+    def test_failures_raise_typed_error(self, reply, reason):
+        """Test that unparseable replies raise ReplyParseError carrying the reply."""
+        # Execute
+        with pytest.raises(ReplyParseError) as error:
+            extract_json_object(reply)
+
+        # Verify
+        assert reason in error.value.reason
+        assert error.value.reply == reply
+        assert isinstance(error.value, ValueError)
+
+    @pytest.mark.parametrize("reply", [None, "", "  \n"])
+    def test_empty_reply_raises_typed_error(self, reply):
+        """Test that a missing or blank reply is a parse error, not a TypeError."""
+        with pytest.raises(ReplyParseError) as error:
+            extract_json_object(reply)
+
+        assert "empty" in error.value.reason
@@ -0,0 +1,226 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+from a2a.client.errors import A2AClientHTTPError
+from google.genai import errors
+
+from src.a2a.agent import GreenAgent
+from src.a2a.messenger import AgentTaskFailedError
+from src.game.GameData import GameData
+from src.game.analytics import compute_game_analytics
+from src.models.EvalConfig import EvalConfig
+from src.models.Participant import Participant
+from src.models.enum.Difficulty import Difficulty
+from src.models.enum.Phase import Phase
+from src.models.enum.Role import Role
+from src.services.resilience import CircuitBreaker, ParticipantUnavailableError, backoff_delay, clear_circuit_breakers, get_circuit_breaker, is_transient
+
+
+class TestRetryPolicy:
+    """Test suite for classifying failures and spacing retries."""
+
+    @pytest.mark.parametrize("error, transient", [
+        (TimeoutError(), True),
+        (httpx.ConnectError("refused"), True),
+        (A2AClientHTTPError(503, "unavailable"), True),
+        (A2AClientHTTPError(400, "bad request"), False),
+        (errors.ServerError(500, {"error": {"code": 500, "message": "boom", "status": "INTERNAL"}}), True),
+        (errors.ClientError(429, {"error": {"code": 429, "message": "slow down", "status": "RESOURCE_EXHAUSTED"}}), False),
+        (AgentTaskFailedError("http://agent responded with: {'status': 'failed'}"), True),
+        (ValueError("bad prompt"), False),
+    ])
+    def test_transient_errors(self, error, transient):
+        """Test that only failures a resend could fix are retried."""
+        assert is_transient(error) == transient
+
+    def test_backoff_is_capped_and_jittered(self):
+        """Test that delays stay within the exponential envelope and its cap."""
+        delays = [backoff_delay(attempt, 0.5, 4) for attempt in range(6) for _ in range(20)]
+
+        assert all(0 <= d <= 4 for d in delays)
+        assert max(backoff_delay(0, 0.5, 4) for _ in range(50)) <= 0.5
+        assert len(set(delays)) > 1
+
+
+class TestCircuitBreaker:
+    """Test suite for failing fast on endpoints that are down."""
+
+    def test_opens_after_threshold_and_half_opens_after_reset(self):
+        """Test closed -> open -> half-open -> closed transitions."""
+        # Setup
+        now = 0.0
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=10, clock=lambda: now)
+
+        # Execute / Verify
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+        now = 10.0
+        assert breaker.allow()
+        assert not breaker.allow()  # only one trial call while half-open
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.rejected == 2
+
+    def test_failed_trial_reopens(self):
+        """Test that a failing half-open trial opens the circuit again immediately."""
+        # Setup
+        now = 0.0
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=5, clock=lambda: now)
+        breaker.record_failure()
+        now = 5.0
+
+        # Execute
+        breaker.allow()
+        breaker.record_failure()
+
+        # Verify
+        assert breaker.state == "open"
+
+    def test_shared_breaker_takes_latest_settings(self):
+        """Test that a later evaluation's thresholds apply to an endpoint's existing breaker."""
+        # Setup
+        clear_circuit_breakers()
+        first = get_circuit_breaker("http://agent", failure_threshold=5, reset_seconds=30)
+
+        # Execute
+        second = get_circuit_breaker("http://agent", failure_threshold=2, reset_seconds=1)
+        clear_circuit_breakers()
+
+        # Verify
+        assert second is first
+        assert (first.failure_threshold, first.reset_seconds) == (2, 1)
+
+
+class TestParticipantRetries:
+    """Test suite for retries and circuit breaking around participant calls."""
+
+    @pytest.fixture(autouse=True)
+    def isolated_breakers(self, mock_game_data):
+        clear_circuit_breakers()
+        mock_game_data.config = EvalConfig(participant_retries=2, retry_base_delay_seconds=0, circuit_failure_threshold=4)
+        yield
+        clear_circuit_breakers()
+
+    def create_participant(self, mock_game_data, mock_messenger) -> Participant:
+        return Participant(id="p1", role=Role.VILLAGER, game_data=mock_game_data, use_llm=False, messenger=mock_messenger, url="http://agent")
+
+    @pytest.mark.asyncio
+    async def test_transient_failures_retried(self, mock_game_data, mock_messenger):
+        """Test that timeouts and 5xx replies are retried and counted in the analytics."""
+        # Setup
+        participant = self.create_participant(mock_game_data, mock_messenger)
+        mock_messenger.talk_to_agent.side_effect = [TimeoutError(), A2AClientHTTPError(502, "bad gateway"), '{"message": "hi"}']
+
+        # Execute
+        reply = await participant.talk_to_agent("prompt", phase=Phase.DISCUSSION)
+
+        # Verify
+        assert reply == {"message": "hi"}
+        assert mock_messenger.talk_to_agent.await_count == 3
+        analytics = compute_game_analytics(mock_game_data)
+        assert analytics["participant_retries"] == 2
+        assert analytics["participant_retries_by_participant"] == {"p1": 2}
+        assert analytics["participant_calls_failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_other_errors_not_retried(self, mock_game_data, mock_messenger):
+        """Test that non-transient errors are raised straight away."""
+        # Setup
+        participant = self.create_participant(mock_game_data, mock_messenger)
+        mock_messenger.talk_to_agent.side_effect = A2AClientHTTPError(400, "bad request")
+
+        # Execute / Verify
+        with pytest.raises(A2AClientHTTPError):
+            await participant.talk_to_agent("prompt")
+        assert mock_messenger.talk_to_agent.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_remote_task_falls_back(self, mock_game_data, mock_messenger):
+        """Test that a remote task ending in "failed" is retried and then yields no reply instead of raising."""
+        # Setup
+        participant = self.create_participant(mock_game_data, mock_messenger)
+        mock_messenger.talk_to_agent.side_effect = AgentTaskFailedError("http://agent responded with: {'status': 'failed'}")
+
+        # Execute
+        reply = await participant.ask("prompt", Phase.VOTE)
+
+        # Verify
+        assert reply is None
+        assert mock_messenger.talk_to_agent.await_count == 3
+        assert [f["outcome"] for f in mock_game_data.call_failures] == ["retried", "retried", "gave_up"]
+
+    @pytest.mark.asyncio
+    async def test_down_participant_fails_fast(self, mock_game_data, mock_messenger):
+        """Test that exhausted retries yield no reply, and an open circuit skips the endpoint entirely."""
+        # Setup
+        participant = self.create_participant(mock_game_data, mock_messenger)
+        mock_messenger.talk_to_agent.side_effect = httpx.ConnectError("refused")
+
+        # Execute
+        first = await participant.ask("prompt", Phase.VOTE)
+        calls_after_first = mock_messenger.talk_to_agent.await_count
+        second = await participant.ask("prompt", Phase.VOTE)
+        with pytest.raises(ParticipantUnavailableError):
+            await participant.talk_to_agent("prompt")
+
+        # Verify
+        assert first is None and second is None
+        assert calls_after_first == 3
+        assert mock_messenger.talk_to_agent.await_count == 4  # the circuit opened after the 4th failure
+        outcomes = [f["outcome"] for f in mock_game_data.call_failures]
+        assert outcomes == ["retried", "retried", "gave_up", "gave_up", "circuit_open"]
+        assert compute_game_analytics(mock_game_data)["participant_calls_failed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_releases_half_open_circuit(self, mock_game_data, mock_messenger):
+        """Test that a trial call cut off by a timeout doesn't leave the circuit refusing every call."""
+        # Setup
+        participant = self.create_participant(mock_game_data, mock_messenger)
+        breaker = participant.circuit_breaker()
+        breaker.failures = breaker.failure_threshold
+        breaker.opened_at = time.monotonic() - breaker.reset_seconds
+
+        async def hang(**kwargs):
+            await asyncio.sleep(1)
+
+        mock_messenger.talk_to_agent.side_effect = hang
+
+        # Execute
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(participant.talk_to_agent("prompt"), timeout=0.01)
+
+        # Verify
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+
+    @pytest.mark.asyncio
+    async def test_simulated_players_break_per_game(self, mock_game_data, mock_messenger):
+        """Test that a failing model opens the circuit for its own game only, and the game is flagged."""
+        # Setup
+        backend = Mock(model="gemini-test")
+        backend.execute_prompt_async = AsyncMock(side_effect=ConnectionError("down"))
+        other_game = GameData(current_round=1, turns_to_speak_per_round=1, config=mock_game_data.config)
+        player = Participant(id="sim", role=Role.VILLAGER, game_data=mock_game_data, use_llm=True, messenger=mock_messenger, llm=backend)
+        other = Participant(id="sim", role=Role.VILLAGER, game_data=other_game, use_llm=True, messenger=mock_messenger, llm=backend)
+
+        # Execute
+        await player.ask("prompt", Phase.VOTE)
+        await player.ask("prompt", Phase.VOTE)
+        analytics = compute_game_analytics(mock_game_data)
+        summary = GreenAgent().render_aggregate_summary(GreenAgent().compute_aggregate_analytics(
+            {Role.VILLAGER: [{"winner": "villagers", "detail": analytics}]}, "http://agent", Difficulty.HARD
+        ))
+
+        # Verify
+        assert player.circuit_breaker().state == "open"
+        assert other.circuit_breaker().state == "closed"
+        assert get_circuit_breaker(player.endpoint).state == "closed"
+        assert analytics["simulated_calls_failed"] == 2
+        assert "WARNING: 1 game(s)" in summary
@@ -0,0 +1,193 @@
+import asyncio
+import itertools
+import threading
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from src.a2a.agent import GreenAgent
+from src.models.EvalConfig import EvalConfig
+from src.models.enum.Difficulty import Difficulty
+from src.models.enum.Phase import Phase
+from src.services.llm import LLM
+from src.services.response_cache import ResponseCache, cache_key, close_shared_response_caches, get_shared_response_cache
+
+
+def create_cache(tmp_path, **kwargs) -> ResponseCache:
+    ticks = itertools.count()
+    return ResponseCache(tmp_path / "responses.sqlite3", clock=lambda: next(ticks), **kwargs)
+
+
+class TestResponseCache:
+    """Test suite for the two-tier model reply cache."""
+
+    def test_key_covers_model_seed_variant_and_prompt(self):
+        """Test that any change to what the model sees gives a different key."""
+        base = cache_key("m", "prompt", 1, "BidResponse")
+
+        assert base == cache_key("m", "prompt", 1, "BidResponse")
+        assert len({base, cache_key("m2", "prompt", 1, "BidResponse"), cache_key("m", "prompt!", 1, "BidResponse"),
+                    cache_key("m", "prompt", 2, "BidResponse"), cache_key("m", "prompt", 1, "")}) == 5
+
+    def test_memory_then_disk_hits(self, tmp_path):
+        """Test that replies survive a restart and are promoted back to memory."""
+        # Setup
+        cache = create_cache(tmp_path)
+        cache.put("k", "reply")
+        cache.close()
+        reopened = create_cache(tmp_path)
+
+        # Execute
+        first = reopened.get("k")
+        second = reopened.get("k")
+        missing = reopened.get("other")
+
+        # Verify
+        assert first == second == "reply"
+        assert missing is None
+        stats = reopened.stats()
+        assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 1)
+
+    def test_disk_evicts_least_recently_used(self, tmp_path):
+        """Test that the store stays under its size bound by dropping the least recently used replies."""
+        # Setup
+        cache = create_cache(tmp_path, max_bytes=30, memory_entries=1)
+        cache.put("a", "x" * 10)
+        cache.put("b", "y" * 10)
+        cache.put("c", "z" * 10)
+        cache.get("a")
+
+        # Execute
+        cache.put("d", "w" * 10)
+
+        # Verify
+        assert cache.disk_bytes <= 30
+        assert cache.get("b") is None
+        assert cache.get("a") == "x" * 10
+        assert cache.stats()["evictions"] == 1
+
+    def test_memory_hits_keep_reply_from_eviction(self, tmp_path):
+        """Test that a reply served from memory counts as recently used when the disk store evicts."""
+        # Setup
+        cache = create_cache(tmp_path, max_bytes=30)
+        cache.put("a", "x" * 10)
+        cache.put("b", "y" * 10)
+        cache.put("c", "z" * 10)
+        cache.get("a")
+
+        # Execute
+        cache.put("d", "w" * 10)
+        cache.close()
+        reopened = create_cache(tmp_path)
+
+        # Verify
+        assert cache.stats()["memory_hits"] == 1
+        assert reopened.get("a") == "x" * 10
+        assert reopened.get("b") is None
+
+    def test_stats_since_snapshot_cover_only_new_lookups(self, tmp_path):
+        """Test that stats relative to an earlier snapshot leave out the lookups made before it."""
+        # Setup
+        cache = create_cache(tmp_path)
+        cache.put("k", "reply")
+        cache.get("k")
+        cache.get("other")
+        before = cache.stats()
+
+        # Execute
+        cache.get("k")
+        stats = cache.stats(since=before)
+
+        # Verify
+        assert (stats["memory_hits"], stats["misses"], stats["writes"]) == (1, 0, 0)
+        assert stats["hit_rate"] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_async_access_keeps_disk_off_the_loop(self, tmp_path):
+        """Test that put_nowait answers from memory at once and SQLite is only touched on the cache's thread."""
+        # Setup
+        cache = create_cache(tmp_path)
+        disk_threads = []
+        disk_get, disk_put = cache._disk_get, cache._disk_put
+
+        def record(call):
+            def wrapper(*args):
+                disk_threads.append(threading.current_thread().name)
+                return call(*args)
+            return wrapper
+
+        cache._disk_get, cache._disk_put = record(disk_get), record(disk_put)
+
+        # Execute
+        write = cache.put_nowait("k", "reply")
+        remembered = await cache.get_async("k")
+        missing = await cache.get_async("other")
+        await asyncio.wrap_future(write)
+        cache.close()
+        reopened = create_cache(tmp_path)
+
+        # Verify
+        assert (remembered, missing) == ("reply", None)
+        assert reopened.get("k") == "reply"
+        assert disk_threads and all(name.startswith("response-cache") for name in disk_threads)
+
+    def test_shared_cache_takes_latest_size_bound(self, tmp_path):
+        """Test that reopening the shared cache with a smaller bound evicts down to it."""
+        # Setup
+        cache = get_shared_response_cache(tmp_path, max_bytes=100)
+        for key in "abc":
+            cache.put(key, "x" * 20)
+
+        # Execute
+        same = get_shared_response_cache(tmp_path, max_bytes=30)
+        same._disk.submit(lambda: None).result()  # wait for the queued eviction
+        close_shared_response_caches()
+
+        # Verify
+        assert same is cache
+        assert cache.max_bytes == 30
+        assert cache.disk_bytes <= 30
+
+
+class TestLLMResponseCache:
+    """Test suite for the reply cache in front of the Gemini backend."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_answered_from_cache(self, tmp_path):
+        """Test that the second identical call doesn't reach the model, but a different seed does."""
+        # Setup
+        cache = create_cache(tmp_path)
+        client = Mock()
+        client.aio.models.generate_content = AsyncMock(return_value=Mock(text='{"message": "hi"}'))
+
+        def create_llm(seed):
+            llm = LLM(seed=seed, response_cache=cache)
+            llm._client = client
+            return llm
+
+        # Execute
+        first = await create_llm(1).execute_prompt_async("debate", phase=Phase.DISCUSSION)
+        second = await create_llm(1).execute_prompt_async("debate", phase=Phase.DISCUSSION)
+        await create_llm(2).execute_prompt_async("debate", phase=Phase.DISCUSSION)
+
+        # Verify
+        assert first == second == '{"message": "hi"}'
+        assert client.aio.models.generate_content.await_count == 2
+        assert client.aio.models.generate_content.await_args.kwargs["config"].seed == 2
+
+    def test_agent_bypasses_cache_per_difficulty(self, tmp_path):
+        """Test that the cache is shared by Gemini players unless their difficulty bypasses it."""
+        # Setup
+        agent = GreenAgent()
+        config = EvalConfig(response_cache_dir=str(tmp_path), response_cache_bypass=[Difficulty.EASY])
+
+        # Execute
+        hard = [agent.create_backend(config, Difficulty.HARD) for _ in range(2)]
+        easy = agent.create_backend(config, Difficulty.EASY)
+        uncached = agent.create_backend(EvalConfig(), Difficulty.HARD)
+        close_shared_response_caches()
+
+        # Verify
+        assert hard[0].response_cache is not None
+        assert hard[0].response_cache is hard[1].response_cache
+        assert easy.response_cache is None
+        assert uncached.response_cache is None
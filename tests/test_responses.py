@@ -0,0 +1,186 @@
+import pytest
+from pydantic import ValidationError
+
+from src.game.analytics import compute_game_analytics
+from src.models.PhaseResponse import BidResponse, DebateResponse, PlayerChoiceResponse, describe_errors
+from src.models.enum.Phase import Phase
+from src.models.enum.Role import Role
+from src.phases.bidding import Bidding
+from src.phases.night import Night
+from src.phases.voting import Voting
+from src.services.replies import ReplyParseError
+from conftest import create_mock_participant
+
+
+class TestResponseModels:
+    """Test suite for the per-phase reply validators."""
+
+    @pytest.mark.parametrize("amount", [-1, 101, "lots"])
+    def test_bid_out_of_range_rejected(self, amount):
+        """Test that bids must be whole numbers from 0 to 100."""
+        with pytest.raises(ValidationError):
+            BidResponse.model_validate({"bid_amount": amount, "reason": "r"})
+
+    def test_blank_debate_message_rejected(self):
+        """Test that an empty or whitespace-only message is invalid."""
+        with pytest.raises(ValidationError):
+            DebateResponse.model_validate({"message": "   "})
+
+    def test_player_choice_resolved_and_checked(self):
+        """Test that aliases resolve to IDs and only candidates are accepted."""
+        # Setup
+        context = {
+            "resolve": {"P1": "id-1", "P2": "id-2"}.get,
+            "alias": {"id-1": "P1", "id-2": "P2"}.get,
+            "candidates": ["id-1", "id-2"],
+        }
+
+        # Execute
+        choice = PlayerChoiceResponse.model_validate({"player_id": "P2", "reason": "r"}, context=context)
+        with pytest.raises(ValidationError) as error:
+            PlayerChoiceResponse.model_validate({"player_id": "P9", "reason": "r"}, context={**context, "resolve": lambda name: name})
+
+        # Verify
+        assert choice.player_id == "id-2"
+        assert describe_errors(error.value) == "player_id: 'P9' is not a valid choice; pick one of: P1, P2"
+
+    def test_missing_field_described(self):
+        """Test that missing keys are reported by name."""
+        with pytest.raises(ValidationError) as error:
+            PlayerChoiceResponse.model_validate({"player_id": "P1"})
+
+        assert describe_errors(error.value) == "reason: Field required"
+
+
+class TestAsk:
+    """Test suite for validated replies with bounded re-prompting."""
+
+    @pytest.mark.asyncio
+    async def test_invalid_reply_reprompted_with_error(self, sample_participants, mock_game_data):
+        """Test that an invalid reply is re-requested with the error and the valid retry is returned."""
+        # Setup
+        villager = sample_participants["villager1"]
+        villager.talk_to_agent.side_effect = [
+            {"player_id": "nobody", "reason": "r"},
+            {"player_id": "villager_2", "reason": "r"},
+        ]
+
+        # Execute
+        response = await villager.ask("vote prompt", Phase.VOTE, candidates=["villager_2", "villager_3"])
+
+        # Verify
+        assert response.player_id == "villager_2"
+        retry = villager.talk_to_agent.await_args_list[1].args[0]
+        assert retry.startswith("vote prompt\n\nYour previous reply was rejected: player_id: 'nobody' is not a valid choice")
+        assert [r["attempt"] for r in mock_game_data.invalid_replies] == [1]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, sample_participants, mock_game_data):
+        """Test that unparseable replies are retried a bounded number of times."""
+        # Setup
+        villager = sample_participants["villager1"]
+        villager.talk_to_agent.side_effect = ReplyParseError("Reply contains no JSON object", "I bid fifty")
+
+        # Execute
+        response = await villager.ask("bid prompt", Phase.BIDDING, max_attempts=2)
+
+        # Verify
+        assert response is None
+        assert villager.talk_to_agent.await_count == 2
+        assert mock_game_data.invalid_replies[0]["error"] == "Reply contains no JSON object"
+        assert compute_game_analytics(mock_game_data)["invalid_replies_by_phase"] == {"BIDDING": 2}
+
+
+class TestPhaseFallbacks:
+    """Test suite for how phases handle players that never reply validly."""
+
+    @pytest.mark.asyncio
+    async def test_dead_player_vote_rejected(self, mock_game, mock_messenger, sample_participants):
+        """Test that votes for players outside the living set are re-requested, then abstain."""
+        # Setup
+        voting = Voting(mock_game, mock_messenger)
+        for participant in sample_participants.values():
+            participant.talk_to_agent.return_value = {"player_id": "villager_2", "reason": "r"}
+        sample_participants["villager2"].talk_to_agent.return_value = {"player_id": "villager_1", "reason": "r"}
+        stubborn = sample_participants["seer"]
+        stubborn.talk_to_agent.return_value = {"player_id": "eliminated_9", "reason": "r"}
+
+        # Execute
+        await voting.collect_round_votes()
+
+        # Verify
+        assert stubborn.talk_to_agent.await_count == 3
+        assert [v.voter_id for v in mock_game.state.votes[1]] == [p.id for p in sample_participants.values() if p is not stubborn]
+
+    @pytest.mark.asyncio
+    async def test_invalid_bid_records_zero(self, mock_game, mock_messenger, sample_participants):
+        """Test that a player with no valid bid still gets the last speaking slot."""
+        # Setup
+        bidding = Bidding(mock_game, mock_messenger)
+        for index, participant in enumerate(sample_participants.values()):
+            participant.talk_to_agent.return_value = {"bid_amount": 10 + index, "reason": "r"}
+        sample_participants["werewolf"].talk_to_agent.return_value = {"bid_amount": "all of them"}
+
+        # Execute
+        await bidding.collect_round_bids()
+
+        # Verify
+        amounts = {b.participant_id: b.amount for b in mock_game.state.bids[1]}
+        assert amounts["werewolf_1"] == 0
+        assert len(amounts) == len(sample_participants)
+
+    @pytest.mark.asyncio
+    async def test_doctor_self_save_rejected(self, mock_game, mock_messenger, sample_participants):
+        """Test that the doctor is re-prompted when saving themselves and skips the save after the limit."""
+        # Setup
+        night = Night(mock_game, mock_messenger)
+        doctor = create_mock_participant("doctor_1", Role.DOCTOR, mock_game.state, mock_messenger)
+        doctor.get_doctor_prompt.return_value = "doctor prompt"
+        doctor.talk_to_agent.return_value = {"player_id": "doctor_1", "reason": "myself"}
+        mock_game.state.doctor = doctor
+        mock_game.state.participants = {1: list(sample_participants.values()) + [doctor]}
+
+        # Execute
+        decision = await night.collect_doctor_save()
+
+        # Verify
+        assert decision is None
+        assert doctor.talk_to_agent.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_self_vote_rejected(self, mock_game, mock_messenger, sample_participants):
+        """Test that a voter naming themselves is re-prompted like any other invalid choice."""
+        # Setup
+        voting = Voting(mock_game, mock_messenger)
+        for participant in sample_participants.values():
+            participant.talk_to_agent.return_value = {"player_id": "werewolf_1", "reason": "r"}
+        werewolf = sample_participants["werewolf"]
+        werewolf.talk_to_agent.side_effect = [{"player_id": "werewolf_1", "reason": "me"}, {"player_id": "seer_1", "reason": "r"}]
+
+        # Execute
+        await voting.collect_round_votes()
+
+        # Verify
+        votes = {v.voter_id: v.voted_for_id for v in mock_game.state.votes[1]}
+        assert werewolf.talk_to_agent.await_count == 2
+        assert votes["werewolf_1"] == "seer_1"
+
+    @pytest.mark.asyncio
+    async def test_night_roles_cannot_target_themselves(self, mock_game, mock_messenger, sample_participants):
+        """Test that the werewolf can't kill, nor the seer investigate, themselves."""
+        # Setup
+        night = Night(mock_game, mock_messenger)
+        werewolf, seer = sample_participants["werewolf"], sample_participants["seer"]
+        mock_game.state.primary_werewolf = werewolf
+        mock_game.state.seer = seer
+        werewolf.talk_to_agent.return_value = {"player_id": "werewolf_1", "reason": "me"}
+        seer.talk_to_agent.return_value = {"player_id": "seer_1", "reason": "me"}
+
+        # Execute
+        kill = await night.collect_werewolf_kill()
+        investigation = await night.collect_seer_investigation()
+
+        # Verify
+        assert kill is None and investigation is None
+        assert werewolf.talk_to_agent.await_count == 3
+        assert seer.talk_to_agent.await_count == 3
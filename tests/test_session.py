@@ -0,0 +1,160 @@
+import pytest
+
+from src import prompts
+from src.a2a.messenger import ContextRejectedError, Messenger
+from src.game.Game import Game
+from src.models.enum.Backend import Backend
+from src.models.enum.Phase import Phase
+from src.services.standin import StandInBackend
+
+
+REMOTE_URL = "http://remote-agent"
+
+
+class FakeRemoteAgent(Messenger):
+    """Messenger double for an external agent that keeps conversation contexts and answers like a stand-in."""
+
+    def __init__(self, reject_after: int | None = None):
+        super().__init__()
+        self.sent = []  # (message, new_conversation)
+        self.backend = StandInBackend(seed=1)
+        self.reject_after = reject_after
+        self.invalid_replies = 0
+
+    async def talk_to_agent(self, message, url, new_conversation=False, timeout=300, context_key=None):
+        if not new_conversation and self.reject_after is not None and len(self.sent) >= self.reject_after:
+            self.reject_after = None
+            raise ContextRejectedError("unknown context")
+        self.sent.append((message, new_conversation))
+        if self.invalid_replies:
+            self.invalid_replies -= 1
+            return "not json"
+        return await self.backend.execute_prompt_async(message)
+
+
+@pytest.fixture
+def create_session_game(create_game):
+    """Factory for a session-mode game whose evaluated seat is answered by a FakeRemoteAgent."""
+    def create(remote: FakeRemoteAgent) -> tuple[Game, object]:
+        game = create_game(url=REMOTE_URL, messenger=remote, backend=Backend.STAND_IN, session_mode=True, seed=4)
+        participant = next(p for p in game.state.participants[1] if p.url == REMOTE_URL)
+        remote.backend.bind(participant)
+        return game, participant
+    return create
+
+
+async def play(game: Game, rounds: int = 10):
+    for _ in range(rounds):
+        await game.run_night_phase()
+        await game.run_bidding_phase()
+        await game.run_debate_phase()
+        await game.run_voting_phase()
+        await game.run_round_end_phase()
+        if game.current_phase == Phase.GAME_END:
+            break
+
+
+class TestAgentSession:
+    """Test suite for delta-only sessions with external participants."""
+
+    def test_session_only_for_external_seat(self, create_session_game):
+        """Test that session mode gives the external participant, and only it, a session."""
+        # Execute
+        game, participant = create_session_game(FakeRemoteAgent())
+
+        # Verify
+        assert participant.session is not None
+        assert all(p.session is None for p in game.state.participants[1] if p is not participant)
+
+    @pytest.mark.asyncio
+    async def test_only_first_prompt_carries_prefix(self, create_session_game):
+        """Test that after the first turn prompts continue the context without the static prefix."""
+        # Setup
+        remote = FakeRemoteAgent()
+        game, participant = create_session_game(remote)
+
+        # Execute
+        await play(game)
+
+        # Verify
+        first, rest = remote.sent[0], remote.sent[1:]
+        assert first[1] is True and first[0].startswith(prompts.STATIC_PREFIX)
+        assert rest and all(not new and not message.startswith(prompts.STATIC_PREFIX) for message, new in rest)
+        assert participant.session.stats()["payload_ratio"] < 0.5
+
+    @pytest.mark.asyncio
+    async def test_transcript_sent_only_once(self, create_session_game):
+        """Test that chat messages already delivered are not repeated in later prompts."""
+        # Setup
+        remote = FakeRemoteAgent()
+        game, participant = create_session_game(remote)
+        await game.run_night_phase()
+        await game.run_bidding_phase()
+        await game.run_debate_phase()
+        sent_before_vote = len(remote.sent)
+
+        delivered = participant.session.delivered.get(1, 0)
+
+        # Execute
+        await game.run_voting_phase()
+
+        # Verify
+        vote_prompt = remote.sent[sent_before_vote][0]
+        already_sent = game.state.chat_history[1][:delivered]
+        assert delivered > 0
+        assert "TASK: VOTE" in vote_prompt
+        assert not any(f"{game.state.alias_for(m.sender_id)}: {m.content}" in vote_prompt for m in already_sent)
+
+    @pytest.mark.asyncio
+    async def test_new_memory_notes_sent_once(self, create_session_game):
+        """Test that a round-2 prompt carries the round-1 votes, and later prompts don't repeat them."""
+        # Setup
+        remote = FakeRemoteAgent()
+        game, participant = create_session_game(remote)
+        await play(game, rounds=1)
+        sent_before_round_2 = len(remote.sent)
+
+        # Execute
+        await play(game, rounds=1)
+
+        # Verify
+        first, *rest = [message for message, _ in remote.sent[sent_before_round_2:]]
+        assert "What you remember from earlier rounds:" in first and "Votes:" in first
+        assert rest and not any("Round 1:" in message for message in rest)
+        assert participant.session.remembered == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_context_resyncs_with_full_prompt(self, create_session_game):
+        """Test that a rejected context is replaced by a new one primed with the full prompt."""
+        # Setup
+        remote = FakeRemoteAgent(reject_after=2)
+        game, participant = create_session_game(remote)
+
+        # Execute
+        await play(game)
+
+        # Verify
+        resent = remote.sent[2]
+        assert resent[1] is True
+        assert resent[0].startswith(prompts.STATIC_PREFIX)
+        assert participant.session.stats()["resyncs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_context_during_reprompt_resyncs_with_full_prompt(self, create_session_game):
+        """Test that a re-prompt sent into a rejected context is resent in full with the error note."""
+        # Setup
+        remote = FakeRemoteAgent()
+        game, participant = create_session_game(remote)
+        await participant.ask(participant.get_bid_prompt(), Phase.BIDDING)
+        remote.invalid_replies = 1
+        remote.reject_after = len(remote.sent) + 1
+
+        # Execute
+        reply = await participant.ask(participant.get_vote_prompt(), Phase.VOTE)
+
+        # Verify
+        resent, new_conversation = remote.sent[-1]
+        assert reply is not None
+        assert new_conversation is True
+        assert resent.startswith(prompts.STATIC_PREFIX)
+        assert "Your previous reply was rejected" in resent
@@ -0,0 +1,61 @@
+import json
+import pytest
+
+from src.models.EvalConfig import EvalConfig
+from src.models.enum.Backend import Backend
+from src.models.enum.Role import Role
+from src.simulate import percentile, role_for_game, run_batch
+
+
+class TestSimulator:
+    """Test suite for the headless batch simulator."""
+
+    def test_percentile_nearest_rank(self):
+        """Test that percentiles use the nearest-rank method."""
+        values = [5.0, 1.0, 4.0, 2.0, 3.0]
+
+        assert percentile(values, 50) == 3.0
+        assert percentile(values, 95) == 5.0
+        assert percentile(values, 0) == 1.0
+        assert percentile([], 50) == 0.0
+
+    def test_roles_rotate_unless_fixed(self):
+        """Test that games rotate through the evaluated roles by default."""
+        assert [role_for_game(i, None) for i in range(4)] == [Role.VILLAGER, Role.WEREWOLF, Role.SEER, Role.DOCTOR]
+        assert role_for_game(3, Role.SEER) == Role.SEER
+
+    @pytest.mark.asyncio
+    async def test_run_batch_writes_jsonl_and_reports(self, tmp_path):
+        """Test that every game is written as a JSON line and the report covers the batch."""
+        # Setup
+        output = tmp_path / "sim.jsonl"
+        config = EvalConfig(backend=Backend.STAND_IN, max_concurrent_games=3, seed=11)
+
+        # Execute
+        report = await run_batch(6, config, output=output)
+
+        # Verify
+        records = [json.loads(line) for line in output.read_text().splitlines()]
+        assert sorted(r["game"] for r in records) == [1, 2, 3, 4, 5, 6]
+        assert all(r["winner"] in ("villagers", "werewolf") for r in records)
+        assert report["games"] == 6
+        assert report["games_per_second"] > 0
+        assert report["p50_game_seconds"] <= report["p95_game_seconds"]
+        assert sum(report["winners"].values()) == 6
+
+    @pytest.mark.asyncio
+    async def test_seeded_batches_replay(self, tmp_path):
+        """Test that the same seed produces the same games."""
+        # Setup
+        config = EvalConfig(backend=Backend.STAND_IN, max_concurrent_games=4, seed=3)
+
+        # Execute
+        await run_batch(4, config, output=tmp_path / "a.jsonl")
+        await run_batch(4, config, output=tmp_path / "b.jsonl")
+
+        # Verify
+        def outcomes(path):
+            records = [json.loads(line) for line in path.read_text().splitlines()]
+            return {r["game"]: (r["winner"], r["detail"]["rounds_played"], r["detail"]["werewolf_kills"]) for r in records}
+
+        assert outcomes(tmp_path / "a.jsonl") == outcomes(tmp_path / "b.jsonl")
@@ -0,0 +1,172 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.a2a.agent import GreenAgent
+from src.game.Game import Game
+from src.models.EvalConfig import EvalConfig
+from src.models.enum.Difficulty import Difficulty
+from src.models.enum.Phase import Phase
+from src.models.enum.Role import Role
+from src.services.llm import LLM, clear_shared_clients
+from src.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test suite for coalescing concurrent identical calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one(self):
+        """Test that waiters on the same key get the leader's result without calling again."""
+        # Setup
+        flight = SingleFlight()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "reply"
+
+        # Execute
+        results = await asyncio.gather(*(flight.run("k", call) for _ in range(4)), flight.run("other", call))
+        after = await flight.run("k", call)
+
+        # Verify
+        assert results == ["reply"] * 5
+        assert after == "reply"
+        assert calls == 3
+        assert flight.stats() == {"requests": 6, "upstream_calls": 3, "coalesced": 3, "coalesced_rate": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self):
+        """Test that a failed call fails all its waiters and the next call retries."""
+        # Setup
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream down")
+
+        # Execute
+        results = await asyncio.gather(flight.run("k", failing), flight.run("k", failing), return_exceptions=True)
+
+        # Verify
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.stats()["upstream_calls"] == 1
+        assert await flight.run("k", AsyncMock(return_value="ok")) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        """Test that a timed-out first caller leaves the shared call running for the others."""
+        # Setup
+        flight = SingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.02)
+            return "reply"
+
+        # Execute
+        leader = asyncio.ensure_future(flight.run("k", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.run("k", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        # Verify
+        assert await follower == "reply"
+
+
+class TestLLMCoalescing:
+    """Test suite for single-flight Gemini calls."""
+
+    @pytest.mark.asyncio
+    async def test_llm_instances_share_identical_requests(self):
+        """Test that different LLM instances sending the same prompt make one request."""
+        # Setup
+        flight = SingleFlight()
+        client = Mock()
+
+        async def generate(**kwargs):
+            await asyncio.sleep(0.01)
+            return Mock(text='{"player_id": "P2", "reason": "r"}')
+
+        client.aio.models.generate_content = AsyncMock(side_effect=generate)
+        llms = [LLM(single_flight=flight) for _ in range(3)]
+        for llm in llms:
+            llm._client = client
+
+        # Execute
+        replies = await asyncio.gather(
+            *(llm.execute_prompt_async("doctor prompt", phase=Phase.NIGHT) for llm in llms),
+            llms[0].execute_prompt_async("seer prompt", phase=Phase.NIGHT),
+        )
+
+        # Verify
+        assert len(set(replies)) == 1
+        assert client.aio.models.generate_content.await_count == 2
+        assert flight.stats()["coalesced"] == 2
+
+    def test_agent_enables_coalescing_from_config(self):
+        """Test that Gemini players share the agent's single-flight only when configured."""
+        # Setup
+        agent = GreenAgent()
+
+        # Execute
+        coalescing = agent.create_backend(EvalConfig(coalesce_llm_calls=True), Difficulty.HARD)
+        default = agent.create_backend(EvalConfig(), Difficulty.HARD)
+
+        # Verify
+        assert coalescing.single_flight is agent.single_flight
+        assert default.single_flight is None
+
+    @pytest.mark.asyncio
+    async def test_evaluations_replaying_one_seed_share_requests(self, monkeypatch):
+        """Test that two agents' games built from the same seeded config coalesce their simulated players' calls."""
+        # Setup
+        monkeypatch.setenv("GEMINI_API_KEY", "key")
+        clear_shared_clients()
+        client = Mock()
+
+        async def generate(**kwargs):
+            await asyncio.sleep(0.01)
+            return Mock(text='{"bid_amount": 10, "reason": "r"}')
+
+        client.aio.models.generate_content = AsyncMock(side_effect=generate)
+        agents = [GreenAgent(), GreenAgent()]
+        config = EvalConfig(coalesce_llm_calls=True, seed=3)
+        games = [Game([], config=config) for _ in range(2)]
+        with patch("src.services.llm.genai.Client", return_value=client):
+            for agent, game in zip(agents, games):
+                agent.init_game(game, None, Role.VILLAGER, Difficulty.HARD)
+            players = [p for game in games for p in game.state.participants[1]]
+
+            # Execute
+            bids = await asyncio.gather(*(p.ask(p.get_bid_prompt(), Phase.BIDDING) for p in players))
+        clear_shared_clients()
+
+        # Verify
+        assert all(bid.bid_amount == 10 for bid in bids)
+        assert client.aio.models.generate_content.await_count == len(players) // 2
+        assert sum(agent.single_flight.stats()["coalesced"] for agent in agents) == len(players) // 2
+        assert all(agent.single_flight.stats()["requests"] == len(players) // 2 for agent in agents)
+
+    @pytest.mark.asyncio
+    async def test_private_instances_do_not_share(self):
+        """Test that only process-wide instances join each other's calls."""
+        # Setup
+        shared = [SingleFlight(process_wide=True), SingleFlight(process_wide=True)]
+        private = SingleFlight()
+        call = AsyncMock(return_value="reply")
+
+        async def slow():
+            await asyncio.sleep(0.01)
+            return await call()
+
+        # Execute
+        await asyncio.gather(*(flight.run("k", slow) for flight in shared + [private]))
+
+        # Verify
+        assert call.await_count == 2
+        assert shared[0].stats()["upstream_calls"] + shared[1].stats()["coalesced"] == 2
+
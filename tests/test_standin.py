@@ -0,0 +1,159 @@
+import json
+import pytest
+
+from src.a2a.agent import GreenAgent
+from src.game.Game import Game
+from src.models.EvalConfig import EvalConfig
+from src.models.Participant import Participant
+from src.models.enum.Backend import Backend
+from src.models.enum.Difficulty import Difficulty
+from src.models.enum.Phase import Phase
+from src.models.enum.Role import Role
+from src import prompts
+from src.services.llm import LLM
+from src.services.standin import PrefixCacheProbe, StandInBackend
+
+
+class TestStandInBackend:
+    """Test suite for the offline stand-in participant backend."""
+
+    def test_init_game_uses_configured_backend(self):
+        """Test that init_game builds stand-in backends bound to their participants."""
+        # Setup
+        agent = GreenAgent()
+
+        # Execute
+        standin_game = Game([], config=EvalConfig(backend=Backend.STAND_IN))
+        agent.init_game(standin_game, "http://localhost:8001", Role.VILLAGER, Difficulty.HARD)
+        gemini_game = Game([])
+        agent.init_game(gemini_game, "http://localhost:8001", Role.VILLAGER, Difficulty.HARD)
+
+        # Verify
+        simulated = [p for p in standin_game.state.participants[1] if p.use_llm]
+        assert all(isinstance(p.llm, StandInBackend) for p in simulated)
+        assert all(p.llm.participant is p for p in simulated)
+        assert all(isinstance(p.llm, LLM) for p in gemini_game.state.participants[1] if p.use_llm)
+
+    @pytest.mark.asyncio
+    async def test_replies_match_phase(self, create_game):
+        """Test that the stand-in answers each phase with the keys the controllers read."""
+        # Setup
+        game = create_game(stand_in_seed=7)
+        werewolf = game.state.primary_werewolf
+        alive_ids = {p.id for p in game.state.participants[1]}
+
+        # Execute
+        bid = json.loads(await werewolf.llm.execute_prompt_async("bid", phase=Phase.BIDDING))
+        message = json.loads(await werewolf.llm.execute_prompt_async("debate", phase=Phase.DISCUSSION))
+        kill = json.loads(await werewolf.llm.execute_prompt_async("night", phase=Phase.NIGHT))
+        vote = json.loads(await werewolf.llm.execute_prompt_async("vote", phase=Phase.VOTE))
+
+        # Verify
+        assert 0 <= bid["bid_amount"] <= 100
+        assert "message" in message
+        kill_target = game.state.resolve_player(kill["player_id"])
+        assert kill["player_id"] == game.state.alias_for(kill_target)
+        assert kill_target in alive_ids
+        partner = game.state.secondary_werewolf
+        assert kill_target not in {werewolf.id, partner.id}
+        assert game.state.resolve_player(vote["player_id"]) in alive_ids - {werewolf.id}
+
+    @pytest.mark.asyncio
+    async def test_unbound_backend_refuses_targeted_moves(self):
+        """Test that choosing a target without game context fails loudly."""
+        # Setup
+        backend = StandInBackend()
+
+        # Execute / Verify
+        assert "bid_amount" in await backend.execute_prompt_async("bid", phase=Phase.BIDDING)
+        with pytest.raises(RuntimeError):
+            await backend.execute_prompt_async("vote", phase=Phase.VOTE)
+
+    @pytest.mark.asyncio
+    async def test_full_game_runs_offline(self, create_game):
+        """Test that a complete game can be played end to end with no network access."""
+        # Setup
+        game = create_game(Role.SEER, stand_in_seed=7)
+
+        # Execute
+        for _ in range(10):
+            await game.run_night_phase()
+            await game.run_bidding_phase()
+            await game.run_debate_phase()
+            await game.run_voting_phase()
+            await game.run_round_end_phase()
+            if game.current_phase == Phase.GAME_END:
+                break
+        analytics = await game.run_game_end_phase()
+
+        # Verify
+        assert game.current_phase == Phase.GAME_END
+        assert analytics["winner"] in ("villagers", "werewolf")
+        assert analytics["rounds_played"] >= 1
+
+    def test_guess_phase_reads_task_line(self, create_game):
+        """Test that the phase is recovered from real prompts without a hint."""
+        # Setup
+        game = create_game(stand_in_seed=7)
+        state = game.state
+        villager = state.villagers[0]
+
+        # Execute / Verify
+        assert villager.llm.guess_phase(villager.get_bid_prompt()) == Phase.BIDDING
+        assert villager.llm.guess_phase(villager.get_debate_prompt()) == Phase.DISCUSSION
+        assert villager.llm.guess_phase(villager.get_vote_prompt()) == Phase.VOTE
+        assert villager.llm.guess_phase(state.seer.get_seer_prompt()) == Phase.NIGHT
+        assert villager.llm.guess_phase(state.doctor.get_doctor_prompt()) == Phase.NIGHT
+
+
+class TestPrefixCacheProbe:
+    """Test suite for the local prompt prefix cache model."""
+
+    def test_counts_block_aligned_shared_prefix(self):
+        """Test that only whole blocks of an already-seen prefix count as cached."""
+        # Setup
+        probe = PrefixCacheProbe(block=4)
+
+        # Execute
+        first = probe.observe("aaaabbbbcc")
+        second = probe.observe("aaaabbbXdddd")
+
+        # Verify
+        assert first == 0
+        assert second == 4
+        assert probe.stats()["cached_chars"] == 4
+        assert probe.stats()["prompts"] == 2
+
+    def test_players_share_the_static_prefix(self, create_game):
+        """Test that different players in different phases reuse the same cached prefix."""
+        # Setup
+        probe = PrefixCacheProbe()
+        game = create_game(stand_in_seed=7, cache_prompt_prefix=True)
+        state = game.state
+
+        # Execute
+        probe.observe(state.villagers[0].get_vote_prompt())
+        cached = [
+            probe.observe(state.seer.get_seer_prompt()),
+            probe.observe(state.primary_werewolf.get_werewolf_prompt()),
+            probe.observe(state.villagers[1].get_bid_prompt()),
+        ]
+
+        # Verify
+        block_aligned_prefix = len(prompts.STATIC_PREFIX) // probe.block * probe.block
+        assert all(c >= block_aligned_prefix for c in cached)
+
+    @pytest.mark.asyncio
+    async def test_simulated_game_reports_prefix_reuse(self):
+        """Test that stand-ins built by the agent feed one shared probe."""
+        # Setup
+        agent = GreenAgent()
+        config = EvalConfig(backend=Backend.STAND_IN, seed=1, cache_prompt_prefix=True)
+
+        # Execute
+        await agent.run_single_game(None, Role.VILLAGER, config, updater=None)
+
+        # Verify
+        stats = agent.prefix_cache.stats()
+        assert stats["prompts"] > 7
+        assert stats["hit_rate"] > 0.5
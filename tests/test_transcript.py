@@ -0,0 +1,141 @@
+from unittest.mock import patch
+
+from src.game.Game import Game
+from src.models.Message import Message
+from src.models.Participant import Participant
+from src.models.Transcript import Transcript
+from src.models.enum.Role import Role
+
+
+class TestTranscript:
+    """Test suite for the incremental per-round chat transcript."""
+
+    def test_renders_each_message_once(self):
+        """Test that syncing only renders messages added since the last call."""
+        # Setup
+        transcript = Transcript()
+        messages = [Message(sender_id="p1", content="hello")]
+
+        # Execute
+        first = transcript.sync(messages)
+        messages.append(Message(sender_id="p2", content="hi"))
+        second = transcript.sync(messages)
+        third = transcript.sync(messages)
+
+        # Verify
+        assert first == "p1: hello"
+        assert second == third == "p1: hello\np2: hi"
+        assert transcript.rendered_messages == 2
+        assert transcript.length == len(second)
+
+    def test_replaced_history_is_rerendered(self):
+        """Test that a shorter history than already rendered triggers a rebuild."""
+        # Setup
+        transcript = Transcript()
+        transcript.sync([Message(sender_id="p1", content="a"), Message(sender_id="p2", content="b")])
+
+        # Execute
+        text = transcript.sync([Message(sender_id="p3", content="c")])
+
+        # Verify
+        assert text == "p3: c"
+        assert transcript.rendered_messages == 1
+
+    def test_game_data_keeps_one_transcript_per_round(self):
+        """Test that GameData tracks chat_history appends without rebuilding the transcript."""
+        # Setup
+        game_data = Game([]).state
+        game_data.chat_history[1] = [Message(sender_id="p1", content="hello")]
+
+        # Execute
+        transcript = game_data.get_transcript(1)
+        game_data.chat_history[1].append(Message(sender_id="p2", content="hi"))
+        updated = game_data.get_transcript(1)
+
+        # Verify
+        assert updated is transcript
+        assert updated.text == "p1: hello\np2: hi"
+        assert game_data.get_transcript(2).text == ""
+
+    def test_prompts_read_from_transcript(self):
+        """Test that debate and vote prompts include the round's rendered transcript."""
+        # Setup
+        game_data = Game([]).state
+        participant = Participant(id="p1", role=Role.VILLAGER, game_data=game_data, use_llm=False, messenger=None)
+        game_data.participants[1] = [participant, Participant(id="p2", role=Role.VILLAGER, game_data=game_data, use_llm=False, messenger=None)]
+        game_data.speaking_order[1] = ["p2", "p1"]
+        game_data.chat_history[1] = [Message(sender_id="p2", content="I trust nobody")]
+
+        # Execute
+        debate_prompt = participant.get_debate_prompt()
+        vote_prompt = participant.get_vote_prompt()
+
+        # Verify
+        assert "p2: I trust nobody" in debate_prompt
+        assert "p2: I trust nobody" in vote_prompt
+        assert game_data.transcripts[1].rendered_messages == 1
+
+    def test_prompts_reuse_rendered_text(self):
+        """Test that without a budget to enforce, prompts take the transcript text as rendered, without re-splitting it."""
+        # Setup
+        game_data = Game([]).state
+        participant = Participant(id="p1", role=Role.VILLAGER, game_data=game_data, use_llm=False, messenger=None)
+        game_data.participants[1] = [participant]
+        game_data.chat_history[1] = [Message(sender_id="p2", content="first"), Message(sender_id="p3", content="second")]
+
+        # Execute
+        with patch.object(Transcript, "message_lines", side_effect=AssertionError("transcript re-split")):
+            vote_prompt = participant.get_vote_prompt()
+
+        # Verify
+        assert game_data.transcripts[1].text in vote_prompt
+
+
+class TestAliases:
+    """Test suite for per-game player aliases."""
+
+    def test_every_participant_gets_a_short_alias(self, create_game):
+        """Test that init_game assigns P1..P7 to the seven participants."""
+        # Execute
+        game = create_game()
+
+        # Verify
+        ids = [p.id for p in game.state.participants[1]]
+        assert sorted(game.state.aliases) == sorted(ids)
+        assert sorted(game.state.aliases.values()) == sorted(f"P{i}" for i in range(1, 8))
+
+    def test_resolve_player_accepts_aliases_and_raw_ids(self):
+        """Test that responses naming a player by alias or by ID map back to the ID."""
+        # Setup
+        game_data = Game([]).state
+        game_data.assign_aliases(["id-a", "id-b"])
+
+        # Execute / Verify
+        assert game_data.resolve_player("P2") == "id-b"
+        assert game_data.resolve_player(" p1 ") == "id-a"
+        assert game_data.resolve_player("id-b") == "id-b"
+        assert game_data.resolve_player("P9") == "P9"
+
+    def test_prompts_show_aliases_not_ids(self, create_game):
+        """Test that prompts never contain the internal participant IDs."""
+        # Setup
+        game = create_game()
+        state = game.state
+        seer = state.seer
+        state.chat_history[1].append(Message(sender_id=seer.id, content="hello"))
+        state.seer_checks.append((state.primary_werewolf.id, True))
+
+        # Execute
+        prompts = [
+            seer.get_vote_prompt(),
+            seer.get_seer_prompt(),
+            seer.get_debate_prompt(),
+            seer.get_bid_prompt(),
+            state.primary_werewolf.get_werewolf_prompt(),
+            state.doctor.get_doctor_prompt(),
+        ]
+
+        # Verify
+        for prompt in prompts:
+            assert not any(p.id in prompt for p in state.participants[1])
+        assert f"{state.alias_for(seer.id)}: hello" in prompts[2]
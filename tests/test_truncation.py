@@ -0,0 +1,126 @@
+import pytest
+from pydantic import ValidationError
+
+from src import prompts
+from src.game.Game import Game
+from src.game.analytics import compute_game_analytics
+from src.models.EvalConfig import EvalConfig
+from src.models.Message import Message
+from src.models.Transcript import fit_lines
+from src.models.enum.Phase import Phase
+from src.models.enum.TruncationPolicy import TruncationPolicy
+from src.services.tokens import estimate_tokens
+
+
+def add_messages(game: Game, contents):
+    state = game.state
+    speakers = state.participants[state.current_round]
+    state.chat_history[state.current_round] = [
+        Message(sender_id=speakers[i % len(speakers)].id, content=content) for i, content in enumerate(contents)
+    ]
+
+
+class TestFitLines:
+    """Test suite for cutting transcript lines down to a character budget."""
+
+    def test_oldest_first_drops_earliest_lines(self):
+        """Test that the oldest lines are dropped until the rest fit."""
+        # Setup
+        lines = ["P1: " + "a" * 50, "P2: " + "b" * 50, "P3: " + "c" * 50]
+
+        # Execute
+        kept, affected = fit_lines(lines, 120, TruncationPolicy.OLDEST_FIRST)
+
+        # Verify
+        assert kept == lines[1:]
+        assert affected == 1
+
+    def test_per_speaker_caps_long_messages(self):
+        """Test that one verbose message is shortened while short ones are kept whole."""
+        # Setup
+        lines = ["P1: short", "P2: " + "x" * 1000, "P3: also short"]
+
+        # Execute
+        kept, affected = fit_lines(lines, 200, TruncationPolicy.PER_SPEAKER)
+
+        # Verify
+        assert kept[0] == lines[0] and kept[2] == lines[2]
+        assert kept[1].startswith("P2: xxx") and kept[1].endswith("...")
+        assert len("\n".join(kept)) <= 200
+        assert affected == 1
+
+    def test_lines_within_budget_are_untouched(self):
+        """Test that nothing is changed when the lines already fit."""
+        # Setup
+        lines = ["P1: hi", "P2: hello"]
+
+        # Execute / Verify
+        for policy in TruncationPolicy:
+            assert fit_lines(lines, 100, policy) == (lines, 0)
+
+
+class TestPhaseTokenBudgets:
+    """Test suite for per-phase prompt token budgets."""
+
+    def test_config_normalizes_and_validates_phases(self):
+        """Test that budgets are keyed by phase name and unknown phases or non-positive budgets are rejected."""
+        # Setup
+        config = EvalConfig(phase_token_budgets={"discussion": 300, "Vote": 250})
+
+        # Verify
+        assert config.token_budget_for(Phase.DISCUSSION) == 300
+        assert config.token_budget_for(Phase.VOTE) == 250
+        assert config.token_budget_for(Phase.NIGHT) is None
+        with pytest.raises(ValidationError):
+            EvalConfig(phase_token_budgets={"lunch": 100})
+        with pytest.raises(ValidationError):
+            EvalConfig(phase_token_budgets={"vote": 0})
+
+    @pytest.mark.parametrize("policy", list(TruncationPolicy))
+    def test_prompts_stay_within_budget(self, policy, create_game):
+        """Test that a verbose debate is cut down so the per-player prompt fits the budget."""
+        # Setup
+        game = create_game(phase_token_budgets={"discussion": 300, "vote": 300}, truncation_policy=policy)
+        add_messages(game, ["short point"] + ["blah " * 400] * 4 + ["final word"])
+        villager = game.state.villagers[0]
+
+        # Execute
+        debate = villager.get_debate_prompt()
+        vote = villager.get_vote_prompt()
+
+        # Verify
+        for prompt in (debate, vote):
+            _, suffix = prompts.split_prefix(prompt)
+            assert estimate_tokens(suffix) <= 300
+            assert "shortened to fit the prompt budget" in suffix
+            assert "final word" in suffix
+        assert [t["phase"] for t in game.state.truncations] == ["DISCUSSION", "VOTE"]
+        assert all(t["policy"] == policy.value and t["messages_affected"] > 0 for t in game.state.truncations)
+
+    def test_no_budget_keeps_full_transcript(self, create_game):
+        """Test that prompts are not truncated when no budget is configured."""
+        # Setup
+        game = create_game()
+        add_messages(game, ["blah " * 400] * 4)
+
+        # Execute
+        prompt = game.state.villagers[0].get_debate_prompt()
+
+        # Verify
+        assert prompt.count("blah") == 1600
+        assert game.state.truncations == []
+
+    def test_analytics_count_truncations(self, create_game):
+        """Test that truncations are reported in the game analytics by phase."""
+        # Setup
+        game = create_game(phase_token_budgets={"discussion": 300})
+        add_messages(game, ["blah " * 400] * 4)
+
+        # Execute
+        for villager in game.state.villagers:
+            villager.get_debate_prompt()
+        analytics = compute_game_analytics(game.state)
+
+        # Verify
+        assert analytics["prompt_truncations"] == len(game.state.villagers)
+        assert analytics["prompt_truncations_by_phase"] == {"DISCUSSION": len(game.state.villagers)}
@@ -1,12 +1,21 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 
 from src.phases.voting import Voting
+from src.models.EvalConfig import EvalConfig
 from src.models.Vote import Vote
 from src.models.enum.EventType import EventType
 from src.models.Message import Message
 
 
+def ballot_for(participant, response: dict) -> dict:
+    """The given ballot, redirected to another player if it names the voter (self-votes are rejected)."""
+    if response["player_id"] == participant.id:
+        return dict(response, player_id="werewolf_1")
+    return response
+
+
 class TestVotingPhase:
     """Test suite for the Voting phase."""
 
@@ -25,7 +34,7 @@ class TestVotingPhase:
         voting = Voting(mock_game, mock_messenger)
 
         for participant in sample_participants.values():
-            participant.talk_to_agent.return_value = vote_response
+            participant.talk_to_agent.return_value = ballot_for(participant, vote_response)
 
         mock_game.state.participants = {1: list(sample_participants.values())}
         mock_game.state.votes = {1: []}
@@ -48,7 +57,7 @@ class TestVotingPhase:
         voting = Voting(mock_game, mock_messenger)
 
         for participant in sample_participants.values():
-            participant.talk_to_agent.return_value = vote_response
+            participant.talk_to_agent.return_value = ballot_for(participant, vote_response)
 
         mock_game.state.current_round = 1
         mock_game.state.participants = {1: list(sample_participants.values())}
@@ -120,7 +129,7 @@ class TestVotingPhase:
         voting = Voting(mock_game, mock_messenger)
 
         for participant in sample_participants.values():
-            participant.talk_to_agent.return_value = vote_response
+            participant.talk_to_agent.return_value = ballot_for(participant, vote_response)
 
         mock_game.state.current_round = 1
         mock_game.state.participants = {1: list(sample_participants.values())}
@@ -151,7 +160,7 @@ class TestVotingPhase:
         ]
 
         for participant in active_participants:
-            participant.talk_to_agent.return_value = vote_response
+            participant.talk_to_agent.return_value = ballot_for(participant, vote_response)
 
         mock_game.state.current_round = 1
         mock_game.state.participants = {1: active_participants}
@@ -165,3 +174,95 @@ class TestVotingPhase:
         total_calls = sum(p.talk_to_agent.call_count for p in active_participants)
         assert total_calls == len(active_participants)
         assert len(mock_game.state.votes[1]) == len(active_participants)
+
+
+class TestConcurrentVoting:
+    """Test suite for simultaneous ballot collection."""
+
+    @pytest.mark.asyncio
+    async def test_votes_requested_concurrently(self, mock_game, mock_messenger, vote_response, sample_participants):
+        """Test that every voter is prompted before any ballot comes back."""
+        # Setup
+        voting = Voting(mock_game, mock_messenger)
+        participants = list(sample_participants.values())
+        in_flight = 0
+        peak = 0
+
+        def replier(participant):
+            async def reply(prompt, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return ballot_for(participant, vote_response)
+            return reply
+
+        for participant in participants:
+            participant.talk_to_agent.side_effect = replier(participant)
+
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.votes = {1: []}
+
+        # Execute
+        await voting.collect_round_votes()
+
+        # Verify
+        assert peak == len(participants)
+        assert len(mock_game.state.votes[1]) == len(participants)
+
+    @pytest.mark.asyncio
+    async def test_vote_order_stable(self, mock_game, mock_messenger, sample_participants):
+        """Test that votes are stored in participant order even when replies finish out of order."""
+        # Setup
+        voting = Voting(mock_game, mock_messenger)
+        participants = list(sample_participants.values())
+
+        for index, participant in enumerate(participants):
+            async def reply(prompt, index=index, participant=participant, **kwargs):
+                # Earlier voters answer last
+                await asyncio.sleep(0.002 * (len(participants) - index))
+                return ballot_for(participant, {"player_id": "villager_2", "reason": f"reason {index}"})
+            participant.talk_to_agent.side_effect = reply
+
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.votes = {1: []}
+
+        # Execute
+        await voting.collect_round_votes()
+
+        # Verify
+        assert [v.voter_id for v in mock_game.state.votes[1]] == [p.id for p in participants]
+        logged_players = [call.args[1].player for call in mock_game.log_event.call_args_list]
+        assert logged_players == [p.id for p in participants]
+
+    @pytest.mark.asyncio
+    async def test_slow_voter_abstains_after_timeout(self, mock_game, mock_messenger, vote_response, sample_participants):
+        """Test that a voter who misses the per-call timeout is skipped without blocking the others."""
+        # Setup
+        voting = Voting(mock_game, mock_messenger)
+        mock_game.state.config = EvalConfig(vote_timeout_seconds=0.05)
+        participants = list(sample_participants.values())
+        slow = sample_participants["villager3"]
+
+        for participant in participants:
+            participant.talk_to_agent.return_value = ballot_for(participant, vote_response)
+
+        async def never_answers(prompt, **kwargs):
+            await asyncio.sleep(10)
+
+        slow.talk_to_agent.side_effect = never_answers
+
+        mock_game.state.current_round = 1
+        mock_game.state.participants = {1: participants}
+        mock_game.state.votes = {1: []}
+
+        # Execute
+        await voting.collect_round_votes()
+
+        # Verify
+        voter_ids = [v.voter_id for v in mock_game.state.votes[1]]
+        assert slow.id not in voter_ids
+        assert len(voter_ids) == len(participants) - 1